@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Scaffolding Benchmark Suite
+
+Generates a synthetic template at a configurable scale (file count, file
+size, placeholder density, skills, agents, inheritance layers) and times
+the scaffolding pipeline end to end: bundle compile, create,
+substitution, validate, cached re-validate and registry render. Each operation reports its median and
+p95 wall time and its tracemalloc memory peak.
+
+Results can be written to JSON and compared with an earlier run:
+
+    python3 benchmarks/bench_scaffold.py --json baseline.json
+    python3 benchmarks/bench_scaffold.py --compare baseline.json
+
+Uses only Python standard library.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from bench_search_registry import make_servers, percentile  # noqa: E402
+from init_project import materialize_bundle, project_variables, substitute_variables  # noqa: E402
+from registry_store import RegistryStore  # noqa: E402
+from template_bundle import compile_bundle, get_bundle, resolve_template_files  # noqa: E402
+from template_engine import compile_template  # noqa: E402
+from validate_project import collect_project_report  # noqa: E402
+
+
+FILLER = 'lorem ipsum dolor sit amet consectetur adipiscing elit '
+VARIABLE_COUNT = 20
+
+
+def _text(rng: random.Random, size: int, density: float) -> str:
+    """About size bytes of text, with a placeholder on a density fraction of lines."""
+    lines = []
+    total = 0
+    while total < size:
+        line = FILLER[:rng.randint(20, len(FILLER))]
+        if rng.random() < density:
+            line += f"{{{{VAR_{rng.randrange(VARIABLE_COUNT)}}}}}"
+        lines.append(line)
+        total += len(line) + 1
+    return '\n'.join(lines) + '\n'
+
+
+def _write(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def make_template(
+    root: Path,
+    files: int,
+    file_size: int,
+    density: float,
+    skills: int,
+    agents: int,
+    layers: int = 1,
+    seed: int = 0
+) -> Path:
+    """
+    Write a synthetic template (and the layers it extends) under root.
+
+    Files, skills and agents are spread round-robin over the layers; each
+    layer has its own .gitignore, so the merge appends them.
+
+    Returns:
+        Directory of the top layer
+    """
+    rng = random.Random(seed)
+    layer_dirs = [root / f"layer-{i}" for i in range(max(1, layers))]
+    for i, layer_dir in enumerate(layer_dirs):
+        layer_dir.mkdir(parents=True)
+        if i:
+            _write(layer_dir / 'template.json', json.dumps({'extends': layer_dirs[i - 1].name}))
+        _write(layer_dir / '.gitignore.template', f"# Layer {i}\nbuild-{i}/\n*.tmp{i}\n")
+
+    base = layer_dirs[0]
+    _write(base / '.claude' / 'CLAUDE.md.template',
+           "# {{PROJECT_NAME}}\n\n{{DESCRIPTION}}\n\n" + _text(rng, 2048, density))
+    _write(base / '.claude' / 'settings.json.template', json.dumps({
+        'permissions': {
+            'allow': [f"Bash(tool-{i}:*)" for i in range(20)] + ['Read(./**)', 'Edit(./src/**)'],
+            'deny': ['Read(./.env)', 'Bash(rm -rf:*)'],
+        }
+    }, indent=2) + '\n')
+    _write(base / 'README.md.template', "# {{PROJECT_NAME}}\n\nCreated {{TIMESTAMP}}\n")
+
+    for i in range(files):
+        layer_dir = layer_dirs[i % len(layer_dirs)]
+        _write(layer_dir / 'src' / f"module_{i // 50}" / f"file_{i}.txt.template",
+               _text(rng, file_size, density))
+    for i in range(skills):
+        layer_dir = layer_dirs[i % len(layer_dirs)]
+        _write(layer_dir / '.claude' / 'skills' / f"skill-{i}" / 'SKILL.md.template',
+               f"---\nname: skill-{i}\ndescription: Synthetic skill {i} for {{{{PROJECT_NAME}}}}\n---\n\n"
+               + _text(rng, 1024, density))
+    for i in range(agents):
+        layer_dir = layer_dirs[i % len(layer_dirs)]
+        _write(layer_dir / '.claude' / 'agents' / f"agent-{i}.md.template",
+               f"---\nname: agent-{i}\ndescription: Synthetic agent {i}\ntools: Read, Grep\n---\n\n"
+               + _text(rng, 1024, density))
+
+    return layer_dirs[-1]
+
+
+def measure(setup, run, repeat: int) -> dict:
+    """
+    Time run(setup(i)) for repeat fresh inputs, then measure its memory peak.
+
+    Setup is not timed. The memory peak comes from one extra run under
+    tracemalloc, kept apart from the timed runs because tracing slows
+    allocation down.
+
+    Returns:
+        Dict with median_ms, p95_ms, min_ms, max_ms, runs and peak_kib
+    """
+    samples = []
+    for i in range(repeat):
+        arg = setup(i)
+        start = time.perf_counter()
+        run(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    arg = setup(repeat)
+    tracemalloc.start()
+    try:
+        run(arg)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(percentile(samples, 0.95), 3),
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'runs': repeat,
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def run_suite(config: dict, work_dir: Path) -> dict:
+    """Run every benchmark in a scratch directory; returns results by operation."""
+    template_dir = make_template(
+        work_dir / 'templates', config['files'], config['file_size'], config['density'],
+        config['skills'], config['agents'], config['layers'], config['seed']
+    )
+    cache_dir = work_dir / 'bundles'
+    bundle = get_bundle(template_dir, cache_dir)
+    projects = work_dir / 'projects'
+    repeat = config['repeat']
+    counter = iter(range(1 << 30))
+
+    def new_path(kind: str) -> Path:
+        return projects / f"{kind}-{next(counter)}"
+
+    def variables_for(path: Path) -> dict:
+        extra = {f"VAR_{i}": f"value-{i}" for i in range(VARIABLE_COUNT)}
+        return project_variables(path, template_dir.name, 'Bench Project', extra_variables=extra)
+
+    def created(_i) -> Path:
+        path = new_path('project')
+        path.mkdir(parents=True)
+        materialize_bundle(bundle, path, variables_for(path), verbose=False)
+        return path
+
+    def validated(i) -> Path:
+        path = created(i)
+        collect_project_report(path)
+        return path
+
+    texts = [
+        sources[-1][1].read_text(encoding='utf-8')
+        for sources in resolve_template_files(template_dir).values()
+    ]
+    sample_variables = variables_for(projects / 'substitute')
+
+    def substitute(_arg):
+        compile_template.cache_clear()
+        for text in texts:
+            substitute_variables(text, sample_variables)
+
+    results = {
+        'compile': measure(lambda i: work_dir / 'compiled' / f"{i}.bundle",
+                           lambda path: compile_bundle(template_dir, path), repeat),
+        'create': measure(lambda i: new_path('create'),
+                          lambda path: materialize_bundle(bundle, path, variables_for(path), verbose=False), repeat),
+        'substitute': measure(lambda i: None, substitute, repeat),
+        'validate': measure(created, collect_project_report, repeat),
+        'revalidate': measure(validated, collect_project_report, repeat),
+    }
+
+    servers = make_servers(config['servers'], config['seed'])
+    with RegistryStore(work_dir / 'registry.db') as store:
+        store.upsert(servers, source='benchmark')
+        results['registry_render'] = measure(
+            lambda i: work_dir / f"registry-{i}.md",
+            lambda path: store.write_markdown(path, force=True),
+            repeat
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Operations that got slower or hungrier than the baseline.
+
+    A regression is a median time or memory peak more than threshold
+    (a fraction) above the baseline's.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('median_ms', 'peak_kib'):
+            if previous[metric] and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name} {metric}: {previous[metric]} -> {current[metric]} "
+                    f"(+{(current[metric] / previous[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark template compile, create, validate and registry render at scale'
+    )
+    parser.add_argument('--files', type=int, default=500, help='Plain template files')
+    parser.add_argument('--file-size', type=int, default=4096, help='Approximate bytes per file')
+    parser.add_argument('--density', type=float, default=0.1, help='Fraction of lines with a placeholder')
+    parser.add_argument('--skills', type=int, default=20, help='Skills in the template')
+    parser.add_argument('--agents', type=int, default=20, help='Agents in the template')
+    parser.add_argument('--layers', type=int, default=1, help='Templates in the extends chain')
+    parser.add_argument('--servers', type=int, default=1000, help='Registry size for the render benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per operation')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic data')
+    parser.add_argument('--json', metavar='FILE', help='Write the results to a JSON file')
+    parser.add_argument('--compare', metavar='FILE', help='Compare with the results of an earlier --json run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed slowdown before --compare reports a regression (default: 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    config = {
+        'files': args.files,
+        'file_size': args.file_size,
+        'density': args.density,
+        'skills': args.skills,
+        'agents': args.agents,
+        'layers': args.layers,
+        'servers': args.servers,
+        'repeat': args.repeat,
+        'seed': args.seed,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = run_suite(config, Path(tmp))
+
+    print(f"Template: {args.files} files x ~{args.file_size} bytes, density {args.density}, "
+          f"{args.skills} skills, {args.agents} agents, {args.layers} layer(s); registry {args.servers} servers\n")
+    print(f"  {'operation':<16} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10}")
+    for name, result in results.items():
+        print(f"  {name:<16} {result['median_ms']:>10.2f} {result['p95_ms']:>10.2f} {result['peak_kib']:>10.1f}")
+
+    if args.json:
+        report = {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'config': config,
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\nResults written to {args.json}")
+
+    if args.compare:
+        try:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {args.compare}: {e}", file=sys.stderr)
+            sys.exit(2)
+        if baseline.get('config') != config:
+            print(f"\nWarning: {args.compare} was run with a different configuration", file=sys.stderr)
+        regressions = compare(results, baseline.get('results', {}), args.threshold)
+        if regressions:
+            print(f"\nRegressions against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.compare} (threshold {args.threshold:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Registry Search Benchmark
+
+Builds a synthetic registry store, then times a full index build, an
+incremental update of a few servers and top-k queries against it.
+Uses only Python standard library.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from registry_store import RegistryStore  # noqa: E402
+from search_registry import search  # noqa: E402
+
+
+CATEGORIES = ['Databases', 'Development', 'Cloud', 'Communication', 'Files', 'Search', 'Monitoring', 'Design']
+WORDS = (
+    'postgres mysql sqlite redis mongo query schema migration github gitlab issue pull request '
+    'review slack email calendar message notify file directory upload storage bucket s3 azure gcp '
+    'deploy container kubernetes docker log metric trace alert dashboard browser scrape crawl web '
+    'search index vector embedding document pdf image figma sketch design token api rest graphql '
+    'weather map location payment invoice stripe analytics report spreadsheet sheet notion wiki'
+).split()
+
+
+def make_servers(count: int, seed: int = 0) -> list[dict]:
+    """Synthetic registry entries with realistic field lengths."""
+    rng = random.Random(seed)
+    servers = []
+    for i in range(count):
+        topic = rng.sample(WORDS, 2)
+        servers.append({
+            'name': f"{topic[0]}-{topic[1]}-{i}",
+            'category': rng.choice(CATEGORIES),
+            'purpose': ' '.join(rng.choices(WORDS, k=rng.randint(6, 14))).capitalize(),
+            'use_cases': ', '.join(rng.choices(WORDS, k=rng.randint(3, 8))),
+            'transport': rng.choice(['stdio', 'http']),
+        })
+    return servers
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the registry search index'
+    )
+    parser.add_argument('--servers', type=int, default=10_000, help='Synthetic registry size')
+    parser.add_argument('--queries', type=int, default=200, help='Number of queries to time')
+    parser.add_argument('--updates', type=int, default=100, help='Servers changed in the incremental update')
+    parser.add_argument('-k', type=int, default=10, help='Results per query')
+    args = parser.parse_args()
+
+    servers = make_servers(args.servers)
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with RegistryStore(Path(tmp) / 'registry.db') as store:
+            start = time.perf_counter()
+            store.upsert(servers, source='benchmark')
+            build = time.perf_counter() - start
+
+            changed = [dict(s, purpose=s['purpose'] + ' updated') for s in rng.sample(servers, args.updates)]
+            start = time.perf_counter()
+            store.upsert(changed, source='benchmark')
+            update = time.perf_counter() - start
+
+            samples = []
+            for _ in range(args.queries):
+                query = ' '.join(rng.sample(WORDS, rng.randint(1, 3)))
+                start = time.perf_counter()
+                search(store, query, args.k)
+                samples.append((time.perf_counter() - start) * 1000)
+
+    print(f"Registry: {args.servers} servers")
+    print(f"  full build (upsert + index):   {build * 1000:8.1f} ms")
+    print(f"  incremental update ({args.updates:>4}):    {update * 1000:8.1f} ms")
+    print(f"  query top-{args.k}: median {statistics.median(samples):.2f} ms, p95 {percentile(samples, 0.95):.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Template Substitution Benchmark
+
+Compares the single-pass template engine against the previous
+per-variable str.replace loop on synthetic templates.
+Uses only Python standard library.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from template_engine import compile_template, render  # noqa: E402
+
+
+def replace_loop(content: str, variables: dict) -> str:
+    """The original substitute_variables implementation."""
+    for key, value in variables.items():
+        placeholder = f"{{{{{key}}}}}"
+        content = content.replace(placeholder, str(value))
+    return content
+
+
+def make_template(size: int, variable_count: int, density: float, seed: int = 0) -> tuple[str, dict]:
+    """
+    Build synthetic template content and matching variables.
+
+    Args:
+        size: Approximate content size in bytes
+        variable_count: Number of distinct variables
+        density: Fraction of lines containing a placeholder
+
+    Returns:
+        (content, variables) tuple
+    """
+    rng = random.Random(seed)
+    variables = {f"VAR_{i}": f"value-{i}" for i in range(variable_count)}
+    names = list(variables)
+    lines = []
+    total = 0
+    while total < size:
+        line = "lorem ipsum dolor sit amet " * rng.randint(1, 4)
+        if rng.random() < density:
+            line += f"{{{{{rng.choice(names)}}}}}"
+        lines.append(line)
+        total += len(line) + 1
+    return '\n'.join(lines), variables
+
+
+def time_call(func, repeat: int) -> float:
+    """Median wall-clock time of func() over repeat runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark template substitution strategies'
+    )
+    parser.add_argument('--size', type=int, default=1_000_000, help='Template size in bytes')
+    parser.add_argument('--variables', type=int, default=50, help='Number of variables')
+    parser.add_argument('--density', type=float, default=0.1, help='Fraction of lines with a placeholder')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per measurement')
+    args = parser.parse_args()
+
+    content, variables = make_template(args.size, args.variables, args.density)
+    expected = replace_loop(content, variables)
+
+    compile_template.cache_clear()
+    if render(compile_template(content), variables) != expected:
+        print("Error: engine output differs from replace loop", file=sys.stderr)
+        sys.exit(1)
+
+    def cold():
+        compile_template.cache_clear()
+        render(compile_template(content), variables)
+
+    compiled = compile_template(content)
+
+    results = {
+        'replace loop': time_call(lambda: replace_loop(content, variables), args.repeat),
+        'engine (parse + render)': time_call(cold, args.repeat),
+        'engine (cached render)': time_call(lambda: render(compiled, variables), args.repeat),
+    }
+
+    print(f"Template: {len(content):,} bytes, {args.variables} variables, "
+          f"{len(compiled.names):,} placeholders\n")
+    baseline = results['replace loop']
+    for label, ms in results.items():
+        print(f"  {label:<26} {ms:9.2f} ms  ({baseline / ms:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
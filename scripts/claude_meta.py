@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Claude Meta
+
+One entry point for every script, and one importable API for their core
+functions, so a create -> install -> validate flow can run in a single
+Python process:
+
+    python3 scripts/claude_meta.py create --path ~/p --template base --name P
+    python3 scripts/claude_meta.py pipeline --path ~/p --template base --name P --servers servers.json
+
+    import claude_meta
+    claude_meta.create_project(...)
+
+Subcommands and API names are resolved lazily: only the module behind the
+subcommand or function actually used is imported.
+Uses only Python standard library.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+
+# Subcommand -> (module, help)
+COMMANDS = {
+    'create': ('init_project', 'Create or update projects from templates'),
+    'validate': ('validate_project', 'Validate project structure'),
+    'install': ('install_mcp', 'Install MCP servers'),
+    'update-registry': ('update_registry', 'Refresh the MCP server registry'),
+    'search': ('search_registry', 'Search the MCP server registry'),
+    'permissions': ('permissions', 'Check and lint permission rules'),
+    'bundle': ('template_bundle', 'Compile templates into cached bundles'),
+    'frontmatter': ('frontmatter', 'Print Markdown frontmatter as JSON'),
+    'registry-store': ('registry_store', 'Inspect and edit the registry store'),
+    'fetch-registry': ('registry_fetch', 'Fetch servers from registry sources'),
+    'parse-registry': ('registry_markdown', 'Parse servers out of Markdown registries'),
+    'serve': ('meta_server', 'Run the warm JSON-RPC worker service'),
+}
+
+# Public API name -> (module, attribute)
+API = {
+    # Projects
+    'available_templates': ('init_project', 'available_templates'),
+    'create_project': ('init_project', 'create_project'),
+    'create_projects_batch': ('init_project', 'create_projects_batch'),
+    'plan_project': ('init_project', 'plan_project'),
+    'project_variables': ('init_project', 'project_variables'),
+    'update_project': ('init_project', 'update_project'),
+    'get_bundle': ('template_bundle', 'get_bundle'),
+    'render': ('template_engine', 'render'),
+    'compile_template': ('template_engine', 'compile_template'),
+    # Validation
+    'collect_project_report': ('validate_project', 'collect_project_report'),
+    'validate_project': ('validate_project', 'validate_project'),
+    'validate_tree': ('validate_project', 'validate_tree'),
+    'read_frontmatter': ('frontmatter', 'read_frontmatter'),
+    'compile_permissions': ('permissions', 'compile_permissions'),
+    'compile_project_permissions': ('permissions', 'compile_project_permissions'),
+    # MCP servers
+    'BACKENDS': ('install_mcp', 'BACKENDS'),
+    'install_mcp_server': ('install_mcp', 'install_mcp_server'),
+    'install_mcp_servers': ('install_mcp', 'install_mcp_servers'),
+    'load_servers_file': ('install_mcp', 'load_servers_file'),
+    'check_servers': ('install_mcp', 'check_servers'),
+    'McpConfigStore': ('mcp_config', 'McpConfigStore'),
+    # Registry
+    'open_registry': ('update_registry', 'open_registry'),
+    'update_registry': ('update_registry', 'update_registry'),
+    'start_background_refresh': ('update_registry', 'start_background_refresh'),
+    'search_registry': ('search_registry', 'search'),
+    'RegistryStore': ('registry_store', 'RegistryStore'),
+    'load_registry_markdown': ('registry_markdown', 'load_registry_markdown'),
+    'fetch_sources': ('registry_fetch', 'fetch_sources'),
+    # Instrumentation
+    'trace_span': ('tracing', 'span'),
+    'trace_session': ('tracing', 'session'),
+    # Worker service
+    'MetaService': ('meta_server', 'MetaService'),
+    'call_server': ('meta_server', 'call'),
+}
+
+__all__ = sorted(API) + ['main', 'run_pipeline']
+
+# Sibling scripts import each other as top-level modules
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+
+def __getattr__(name: str):
+    if name not in API:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = API[name]
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(API))
+
+
+def run_pipeline(
+    path: str,
+    template: str,
+    name: str,
+    description: str = None,
+    servers_file: str = None,
+    backend: str = 'native',
+    on_exists: str = 'fail',
+    workers: int = 4,
+    output_format: str = 'human'
+) -> bool:
+    """
+    Create a project, install its MCP servers and validate it in-process.
+
+    Args:
+        path: Project directory
+        template: Template name
+        name: Project name
+        description: Project description
+        servers_file: Servers to install into the project's .mcp.json
+            (see install_mcp.load_servers_file)
+        backend: Install backend name (see install_mcp.BACKENDS)
+        on_exists: What to do if the project directory exists
+        workers: Concurrent installations
+        output_format: Validation output format
+
+    Returns:
+        True if every step succeeded, False at the first failure
+    """
+    from init_project import create_project, resolve_project_path
+    from validate_project import validate_project
+
+    # Resolved once, so every step works on the same directory
+    project_path = resolve_project_path(path)
+    if not create_project(str(project_path), template, name, description, on_exists=on_exists):
+        return False
+
+    if servers_file:
+        from install_mcp import BACKENDS, install_mcp_servers, load_servers_file
+
+        try:
+            servers = load_servers_file(Path(servers_file))
+        except (OSError, ValueError) as e:
+            print(f"Error reading {servers_file}: {e}", file=sys.stderr)
+            return False
+        if not install_mcp_servers(
+            servers,
+            config_path=str(project_path / '.mcp.json'),
+            workers=workers,
+            backend=BACKENDS[backend]()
+        ):
+            return False
+
+    return validate_project(str(project_path), output_format=output_format)
+
+
+def _pipeline_main(argv: list[str] = None):
+    import argparse
+
+    import tracing
+
+    parser = argparse.ArgumentParser(
+        prog=f"{Path(sys.argv[0]).name} pipeline",
+        description='Create a project, install MCP servers and validate it in one process'
+    )
+    parser.add_argument('--path', required=True, help='Project directory path')
+    parser.add_argument('--template', required=True, help='Template name')
+    parser.add_argument('--name', required=True, help='Project name')
+    parser.add_argument('--description', help='Project description')
+    parser.add_argument('--servers', help='JSON file of MCP servers to install into the project .mcp.json')
+    parser.add_argument(
+        '--backend',
+        choices=['cli', 'native', 'fake'],
+        default='native',
+        help='Install backend (default: native)'
+    )
+    parser.add_argument(
+        '--on-exists',
+        choices=['skip', 'overwrite', 'fail'],
+        default='fail',
+        help='What to do if the project directory exists (default: fail)'
+    )
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent installations (default: 4)')
+    parser.add_argument(
+        '--format',
+        choices=['human', 'json', 'junit', 'sarif'],
+        default='human',
+        help='Validation output format (default: human)'
+    )
+    tracing.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with tracing.session(args.trace, args.profile):
+        success = run_pipeline(
+            args.path, args.template, args.name, args.description,
+            servers_file=args.servers,
+            backend=args.backend,
+            on_exists=args.on_exists,
+            workers=args.workers,
+            output_format=args.format
+        )
+        sys.exit(0 if success else 1)
+
+
+def _usage() -> str:
+    width = max(len(c) for c in COMMANDS)
+    lines = [f"usage: {Path(sys.argv[0]).name} <command> [args...]", "", "commands:"]
+    for command, (_module, help_text) in COMMANDS.items():
+        lines.append(f"  {command:<{width}}  {help_text}")
+    lines.append(f"  {'pipeline':<{width}}  Create, install MCP servers and validate in one process")
+    lines.append("")
+    lines.append("Run '<command> --help' for the options of a command.")
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] = None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(_usage())
+        sys.exit(0 if argv else 2)
+
+    command, rest = argv[0], argv[1:]
+    if command == 'pipeline':
+        _pipeline_main(rest)
+        return
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n\n{_usage()}", file=sys.stderr)
+        sys.exit(2)
+
+    # Usage lines read "claude_meta.py <command> ..."
+    sys.argv[0] = f"{Path(sys.argv[0]).name} {command}"
+    importlib.import_module(COMMANDS[command][0]).main(rest)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Reader
+
+Reads the YAML frontmatter block at the top of Markdown files (skills,
+agents) without loading the body. The file is streamed line by line and
+reading stops at the closing ---.
+Uses only Python standard library.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+
+class FrontmatterError(ValueError):
+    """Raised when a file has no frontmatter or it is not closed."""
+
+
+def read_frontmatter(path: Path) -> dict:
+    """
+    Read the frontmatter of a Markdown file as a dict.
+
+    Every "key: value" line between the opening and closing --- becomes an
+    entry, with the key and value stripped of surrounding whitespace. Only
+    the frontmatter lines are read.
+
+    Raises:
+        FrontmatterError: if the file does not start with --- or the block
+            is not closed
+        OSError, UnicodeDecodeError: if the file cannot be read
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        # Bounded read: the opening line must be exactly "---"
+        if f.readline(5) != '---\n':
+            raise FrontmatterError("Missing YAML frontmatter (should start with ---)")
+
+        fields = {}
+        for line in f:
+            line = line.strip()
+            if line == '---':
+                return fields
+            key, separator, value = line.partition(':')
+            if separator:
+                fields[key.strip()] = value.strip()
+
+    raise FrontmatterError("YAML frontmatter not properly closed (missing second ---)")
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Print the frontmatter of Markdown files as JSON'
+    )
+
+    parser.add_argument(
+        'files',
+        nargs='+',
+        help='Markdown files to read'
+    )
+
+    args = parser.parse_args(argv)
+
+    success = True
+    result = {}
+    for file in args.files:
+        try:
+            result[file] = read_frontmatter(Path(file))
+        except (FrontmatterError, OSError, UnicodeDecodeError) as e:
+            print(f"Error reading {file}: {e}", file=sys.stderr)
+            success = False
+
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Filesystem Helpers
+
+Small pieces shared by the scripts that replace files atomically
+(temporary file + os.replace): the process umask, for giving the
+temporary file the permissions a newly created file would have, and a
+directory fsync to make a rename durable.
+Uses only Python standard library.
+"""
+
+import os
+from pathlib import Path
+
+
+# Read once at import: querying the umask means setting it, which is not
+# safe once worker threads are running.
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# Permissions of a newly created regular file under the process umask
+DEFAULT_FILE_MODE = 0o666 & ~UMASK
+
+
+def fsync_directory(directory: Path):
+    """Make a rename durable by syncing its directory, where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -7,74 +7,529 @@ Uses only Python standard library for maximum portability.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import shutil
+import stat
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import tracing
+from fsutil import DEFAULT_FILE_MODE, fsync_directory
+from template_bundle import TEMPLATES_DIR, TemplateBundle, get_bundle
+from template_engine import check_variable_names, compile_template, render
+
+
+# Variables create_project always provides; only custom variables are
+# reported when no template references them.
+BUILTIN_VARIABLES = {'PROJECT_NAME', 'PROJECT_PATH', 'PROJECT_TYPE', 'TIMESTAMP', 'DESCRIPTION'}
+
+# Files written concurrently per project; writing is I/O-bound.
+DEFAULT_WORKERS = 8
+
+# Records the template, variables and rendered file hashes of a project
+# so that it can be updated incrementally.
+SCAFFOLD_STATE_FILE = Path('.claude') / '.scaffold-state.json'
+
+# Progress of a scaffold that has not finished yet (see ScaffoldJournal)
+SCAFFOLD_JOURNAL_FILE = Path('.claude') / '.scaffold-journal'
+
+# New projects are rendered into a hidden sibling directory with this
+# suffix and renamed into place once complete.
+STAGING_SUFFIX = '.scaffold-staging'
+
 
 def substitute_variables(content: str, variables: dict) -> str:
     """
     Substitute template variables in content.
 
-    Variables use {{VARIABLE_NAME}} syntax.
+    Variables use {{VARIABLE_NAME}} syntax. The content is parsed once
+    (and cached) and rendered in a single pass.
+    """
+    return render(compile_template(content), variables)
+
+
+def resolve_project_path(path: str) -> Path:
+    """
+    Absolute project directory for a path argument, with "~" expanded.
+
+    Every entry point (create, plan, update, batch) resolves paths this
+    way, so a plan previews the directory creation writes to.
+    """
+    return Path(path).expanduser().resolve()
+
+
+def _display_path(dest: Path) -> Path:
+    """Path used in "Created:" messages."""
+    return dest.relative_to(dest.parents[len(dest.parents)-1])
+
+
+def _report_unknown(src: Path, names: set, variables: dict):
+    """Warn about placeholders that will be left in the output."""
+    missing = sorted(names - set(variables))
+    if missing:
+        print(f"  Warning: {src.name} uses unknown placeholder(s): {', '.join(missing)}")
+
+
+def _run_parallel(func, items: list, workers: int) -> list:
+    """Apply func to items on a bounded thread pool, preserving order."""
+    if workers > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+    return [func(item) for item in items]
+
+
+def materialize_bundle(
+    bundle: TemplateBundle,
+    project_path: Path,
+    variables: dict,
+    workers: int = DEFAULT_WORKERS,
+    verbose: bool = True,
+    journal: 'ScaffoldJournal' = None,
+    atomic: bool = False,
+    display_path: Path = None
+) -> dict:
     """
-    for key, value in variables.items():
-        placeholder = f"{{{{{key}}}}}"
-        content = content.replace(placeholder, str(value))
-    return content
+    Write a compiled template bundle to project path with variable substitution.
+
+    The bundle already holds the merged template layers and their parsed
+    placeholders, so the template directory is neither walked nor parsed.
+
+    Args:
+        bundle: Compiled template
+        project_path: Directory to write into
+        variables: Substitution variables
+        workers: Files written concurrently
+        verbose: Print each created file and placeholder warnings
+        journal: Records each finished file; files it already lists as
+            finished (and whose size matches) are not written again
+        atomic: Replace each file atomically (temporary file + os.replace)
+            instead of writing it in place
+        display_path: Directory shown in "Created:" messages (default:
+            project_path)
+
+    Returns:
+        Summary dict with the files written, unknown placeholders per file
+        and unused custom variables
+    """
+    for directory in sorted({(project_path / entry['path']).parent for entry in bundle.files}):
+        directory.mkdir(parents=True, exist_ok=True)
+    completed = journal.completed if journal else {}
+
+    def materialize(entry):
+        dest = project_path / entry['path']
+        digest = completed.get(entry['path'])
+        if digest is not None and _has_size(dest, bundle.rendered_size(entry, variables)):
+            return digest
+        if atomic:
+            with tracing.span('template.write', path=entry['path'], bytes=entry['length']):
+                digest = _atomic_write(dest, bundle.segments(entry, variables),
+                                       entry['mode'] if entry['binary'] else None)
+        else:
+            digest = bundle.write_file(entry, dest, variables)
+        if journal:
+            journal.record(entry['path'], digest)
+        return digest
+
+    with tracing.span('template.materialize', template=bundle.template, files=len(bundle.files)):
+        digests = _run_parallel(materialize, bundle.files, workers)
+    save_scaffold_state(project_path, bundle, variables, {
+        entry['path']: digest for entry, digest in zip(bundle.files, digests)
+    })
+
+    used = set()
+    unknown = {}
+    for entry in bundle.files:
+        if entry['binary']:
+            continue
+        names = {name for _start, _end, name in entry['placeholders']}
+        used.update(names)
+        missing = sorted(names - set(variables))
+        if missing:
+            unknown[entry['source']] = missing
+        if verbose:
+            _report_unknown(Path(entry['source']), names, variables)
+            print(f"  Created: {_display_path((display_path or project_path) / entry['path'])}")
+
+    unused = sorted(set(variables) - used - BUILTIN_VARIABLES)
+    if unused and verbose:
+        print(f"  Note: variable(s) not used by any template file: {', '.join(unused)}")
+
+    return {
+        'files': [entry['path'] for entry in bundle.files],
+        'unknown_placeholders': unknown,
+        'unused_variables': unused,
+    }
+
+
+def _has_size(path: Path, size: int) -> bool:
+    try:
+        return path.stat().st_size == size
+    except OSError:
+        return False
+
+
+class ScaffoldJournal:
+    """
+    Progress record of a scaffold, so that an interrupted run can resume.
+
+    A JSON Lines file: the first line holds the template, its bundle hash
+    and the variables the files are rendered with (TIMESTAMP included, so
+    a resumed run renders exactly what the first run would have); every
+    following line names a file that was completely written, with its hash.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.completed = {}
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self, bundle: TemplateBundle, variables: dict) -> dict:
+        """
+        Read the progress of an earlier run of the same scaffold.
+
+        The journal belongs to the same scaffold when the bundle hash and
+        every variable except TIMESTAMP match.
+
+        Returns:
+            The variables of the earlier run, or None if there is no
+            journal or it belongs to a different scaffold
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            header = json.loads(lines[0])
+        except (OSError, ValueError, IndexError):
+            return None
+
+        recorded = header.get('variables') or {}
+        requested = {key: str(value) for key, value in variables.items()}
+        if (header.get('template_hash') != bundle.content_hash
+                or {k: v for k, v in recorded.items() if k != 'TIMESTAMP'}
+                != {k: v for k, v in requested.items() if k != 'TIMESTAMP'}):
+            return None
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                self.completed[record['path']] = record['sha256']
+            except (ValueError, KeyError, TypeError):
+                break  # torn last line of an interrupted run
+        return recorded
+
+    def begin(self, bundle: TemplateBundle, variables: dict):
+        """Start (or restart) the journal with the scaffold's header and the files already completed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        header = {
+            'template': bundle.template,
+            'template_hash': bundle.content_hash,
+            'variables': {key: str(value) for key, value in variables.items()},
+        }
+        self._file.write(json.dumps(header) + '\n')
+        for rel_path, digest in self.completed.items():
+            self._file.write(json.dumps({'path': rel_path, 'sha256': digest}) + '\n')
+        self._file.flush()
+
+    def record(self, rel_path: str, digest: str):
+        """Note that a file has been completely written."""
+        with self._lock:
+            self._file.write(json.dumps({'path': rel_path, 'sha256': digest}) + '\n')
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """Close and delete the journal once the scaffold is complete."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
 
+def staging_path(project_path: Path) -> Path:
+    """Sibling directory a new project is rendered into before it is published."""
+    return project_path.parent / f".{project_path.name}{STAGING_SUFFIX}"
 
-def copy_template_file(src: Path, dest: Path, variables: dict):
+
+def scaffold_project(
+    bundle: TemplateBundle,
+    project_path: Path,
+    variables: dict,
+    workers: int = DEFAULT_WORKERS,
+    verbose: bool = True
+) -> dict:
     """
-    Copy a template file to destination with variable substitution.
+    Write a bundle to a project transactionally and resumably.
+
+    A new project is rendered into a sibling staging directory (see
+    staging_path) and published with a single rename, so the project path
+    either does not exist or holds the complete project. An existing
+    project is updated file by file with atomic replaces.
 
-    If filename ends with .template, remove that extension.
+    Either way a journal records each finished file. When a run is
+    interrupted, the next run for the same template and variables reuses
+    the journal's variables (including TIMESTAMP) and only writes the
+    files that are still missing.
+
+    Returns:
+        The materialize_bundle summary, plus 'resumed': the number of files
+        an earlier run had already written
     """
-    # Determine destination filename
-    if dest.name.endswith('.template'):
-        dest = dest.parent / dest.name[:-9]  # Remove .template extension
+    project_path = Path(project_path)
+    project_path.parent.mkdir(parents=True, exist_ok=True)
+    in_place = project_path.exists()
+    target = project_path if in_place else staging_path(project_path)
+    journal = ScaffoldJournal(target / SCAFFOLD_JOURNAL_FILE)
+
+    recorded = journal.load(bundle, variables) if target.exists() else None
+    if recorded is not None:
+        variables = recorded
+        if verbose and journal.completed:
+            print(f"  Resuming an interrupted scaffold: {len(journal.completed)} of "
+                  f"{len(bundle.files)} file(s) already written")
+    elif not in_place and target.exists():
+        shutil.rmtree(target)  # staging left by a different scaffold
+
+    journal.begin(bundle, variables)
+    try:
+        summary = materialize_bundle(
+            bundle, target, variables, workers, verbose,
+            journal=journal, atomic=in_place, display_path=project_path
+        )
+    finally:
+        journal.close()
+    summary['resumed'] = len(journal.completed)
+    journal.finish()
 
-    # Read source file
+    if not in_place:
+        with tracing.span('project.publish', path=project_path):
+            os.rename(target, project_path)
+            fsync_directory(project_path.parent)
+    return summary
+
+
+def load_scaffold_state(project_path: Path) -> dict:
+    """Read the scaffold state recorded in a project, or {} if there is none."""
     try:
-        content = src.read_text(encoding='utf-8')
-    except UnicodeDecodeError:
-        # Binary file, just copy
-        shutil.copy2(src, dest)
+        with open(project_path / SCAFFOLD_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_scaffold_state(project_path: Path, bundle: TemplateBundle, variables: dict, hashes: dict):
+    """
+    Record what was last rendered into a project.
+
+    The state holds the template, the variables used and the hash of every
+    rendered file, so a later --update can tell files the user has edited
+    apart from files that still match what was scaffolded.
+    """
+    state = {
+        'template': bundle.template,
+        'template_hash': bundle.content_hash,
+        'variables': {key: str(value) for key, value in variables.items()},
+        'files': dict(sorted(hashes.items())),
+    }
+    if state == load_scaffold_state(project_path):
         return
+    content = json.dumps(state, indent=2) + '\n'
+    _atomic_write(project_path / SCAFFOLD_STATE_FILE, [content.encode('utf-8')])
 
-    # Substitute variables
-    content = substitute_variables(content, variables)
 
-    # Write to destination
-    dest.write_text(content, encoding='utf-8')
-    print(f"  Created: {dest.relative_to(dest.parents[len(dest.parents)-1])}")
+def _atomic_write(dest: Path, chunks, mode: int = None) -> str:
+    """
+    Write chunks to dest via a temporary file and os.replace.
 
+    Readers see either the old or the new file, never a partial one. The
+    existing file's permissions are kept unless mode is given.
 
-def copy_template_tree(template_dir: Path, project_path: Path, variables: dict):
+    Returns:
+        SHA-256 hex digest of the written content
     """
-    Recursively copy template directory to project path with variable substitution.
+    digest = hashlib.sha256()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None and dest.exists():
+        mode = stat.S_IMODE(dest.stat().st_mode)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode if mode is not None else DEFAULT_FILE_MODE)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return digest.hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def update_project(
+    path: str,
+    template: str = None,
+    name: str = None,
+    description: str = None,
+    extra_variables: dict = None,
+    verbose: bool = True
+) -> dict:
     """
-    for item in template_dir.rglob('*'):
-        if item.is_file():
-            # Calculate relative path
-            rel_path = item.relative_to(template_dir)
-            dest_path = project_path / rel_path
+    Re-render a project's template and write only the files that changed.
+
+    Each file is rendered in memory and compared with the file on disk and
+    with the hash recorded when it was last scaffolded:
+
+    - matches the new render: left untouched
+    - matches the last render: replaced atomically with the new render
+    - differs from both: modified by the user, left untouched
+    - missing but previously rendered: deleted by the user, left alone
 
-            # Create parent directories
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+    Template, name, description and the other variables default to the
+    ones recorded in the project's scaffold state.
 
-            # Copy file with substitution
-            copy_template_file(item, dest_path, variables)
+    Returns:
+        Dict mapping each status ('created', 'updated', 'unchanged',
+        'modified', 'deleted', 'removed') to a list of relative paths
+    """
+    project_path = resolve_project_path(path)
+    state = load_scaffold_state(project_path)
+    template = template or state.get('template')
+    if not template:
+        raise ValueError(f"{project_path} has no scaffold state; pass a template to update it")
+    template_dir = TEMPLATES_DIR / template
+    if not template_dir.exists():
+        raise ValueError(f"Template '{template}' not found at {template_dir}")
+
+    recorded_variables = state.get('variables', {})
+    variables = dict(recorded_variables)
+    variables.update(extra_variables or {})
+    variables['PROJECT_PATH'] = str(project_path)
+    variables['PROJECT_TYPE'] = template
+    if name:
+        variables['PROJECT_NAME'] = name
+    if description:
+        variables['DESCRIPTION'] = description
+    defaults = project_variables(project_path, template, variables.get('PROJECT_NAME', project_path.name))
+    for key, value in defaults.items():
+        variables.setdefault(key, value)
+
+    bundle = get_bundle(template_dir)
+    recorded = state.get('files', {})
+    hashes = {}
+    changes = {status: [] for status in ('created', 'updated', 'unchanged', 'modified', 'deleted', 'removed')}
+
+    for entry in bundle.files:
+        rel_path = entry['path']
+        dest = project_path / rel_path
+        with tracing.span('template.render', path=rel_path):
+            rendered = bundle.render(entry, variables)
+        new_hash = hashlib.sha256(rendered).hexdigest()
+        last_hash = recorded.get(rel_path)
+        mode = entry['mode'] if entry['binary'] else None
+
+        if not dest.exists():
+            if last_hash:
+                changes['deleted'].append(rel_path)
+                hashes[rel_path] = last_hash
+                continue
+            with tracing.span('template.write', path=rel_path):
+                _atomic_write(dest, [rendered], mode)
+            changes['created'].append(rel_path)
+            hashes[rel_path] = new_hash
+            continue
+
+        disk_hash = _file_sha256(dest)
+        if disk_hash == new_hash:
+            changes['unchanged'].append(rel_path)
+            hashes[rel_path] = new_hash
+        elif last_hash and disk_hash == last_hash:
+            with tracing.span('template.write', path=rel_path):
+                _atomic_write(dest, [rendered], mode)
+            changes['updated'].append(rel_path)
+            hashes[rel_path] = new_hash
+        else:
+            changes['modified'].append(rel_path)
+            if last_hash:
+                hashes[rel_path] = last_hash
+
+    changes['removed'] = sorted(set(recorded) - {entry['path'] for entry in bundle.files})
+
+    save_scaffold_state(project_path, bundle, variables, hashes)
+
+    if verbose:
+        labels = {
+            'created': 'Created',
+            'updated': 'Updated',
+            'modified': 'Kept (modified locally)',
+            'deleted': 'Kept deleted',
+            'removed': 'No longer in template',
+        }
+        for status, label in labels.items():
+            for rel_path in changes[status]:
+                print(f"  {label}: {rel_path}")
+        print(f"\n{len(changes['created']) + len(changes['updated'])} file(s) written, "
+              f"{len(changes['unchanged'])} unchanged, {len(changes['modified'])} modified locally")
+
+    return changes
+
+
+def available_templates() -> list[str]:
+    """Names of the template directories under templates/."""
+    return sorted(t.name for t in TEMPLATES_DIR.iterdir() if t.is_dir())
+
+
+def project_variables(
+    project_path: Path,
+    template: str,
+    name: str,
+    description: str = None,
+    extra_variables: dict = None
+) -> dict:
+    """
+    Build the substitution variables for a project.
+
+    Extra variables are added alongside the built-in ones and cannot
+    override them.
+    """
+    variables = dict(extra_variables or {})
+    variables.update({
+        'PROJECT_NAME': name,
+        'PROJECT_PATH': str(project_path),
+        'PROJECT_TYPE': template,
+        'TIMESTAMP': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'DESCRIPTION': description or f"A {template} project created with Claude Code Mastery"
+    })
+    return variables
 
 
 def create_project(
     path: str,
     template: str,
     name: str,
-    description: str = None
+    description: str = None,
+    on_exists: str = 'prompt',
+    extra_variables: dict = None
 ) -> bool:
     """
     Create a new Claude Code project from a template.
@@ -84,47 +539,48 @@ def create_project(
         template: Template name (base, software-dev, content-creation, etc.)
         name: Display name for the project
         description: Optional project description
+        on_exists: What to do if the path already exists: 'prompt' (ask),
+            'skip' (leave it alone), 'overwrite' or 'fail'
+        extra_variables: Additional template variables
 
     Returns:
-        True if successful, False otherwise
+        True if successful (or skipped), False otherwise
     """
     # Convert to Path objects
-    project_path = Path(path).resolve()
-    script_dir = Path(__file__).parent
-    meta_project_root = script_dir.parent
-    template_dir = meta_project_root / "templates" / template
+    project_path = resolve_project_path(path)
+    template_dir = TEMPLATES_DIR / template
 
     # Validation
     if not template_dir.exists():
         print(f"Error: Template '{template}' not found at {template_dir}", file=sys.stderr)
-        print(f"Available templates: {', '.join([t.name for t in (meta_project_root / 'templates').iterdir() if t.is_dir()])}")
+        print(f"Available templates: {', '.join(available_templates())}")
         return False
 
     if project_path.exists():
-        response = input(f"Warning: {project_path} already exists. Continue and potentially overwrite files? (y/N): ")
-        if response.lower() != 'y':
-            print("Aborted.")
+        if on_exists == 'prompt':
+            response = input(f"Warning: {project_path} already exists. Continue and potentially overwrite files? (y/N): ")
+            if response.lower() != 'y':
+                print("Aborted.")
+                return False
+        elif on_exists == 'skip':
+            print(f"Skipped: {project_path} already exists")
+            return True
+        elif on_exists == 'fail':
+            print(f"Error: {project_path} already exists", file=sys.stderr)
             return False
 
     # Prepare variables for substitution
-    variables = {
-        'PROJECT_NAME': name,
-        'PROJECT_PATH': str(project_path),
-        'PROJECT_TYPE': template,
-        'TIMESTAMP': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'DESCRIPTION': description or f"A {template} project created with Claude Code Mastery"
-    }
+    variables = project_variables(project_path, template, name, description, extra_variables)
 
     print(f"\nCreating project: {name}")
     print(f"Location: {project_path}")
     print(f"Template: {template}\n")
 
-    # Create project directory
-    project_path.mkdir(parents=True, exist_ok=True)
-
-    # Copy template tree
+    # Scaffold from the compiled template bundle (staged, then published)
     try:
-        copy_template_tree(template_dir, project_path, variables)
+        with tracing.span('project.create', template=template, path=project_path):
+            bundle = get_bundle(template_dir)
+            scaffold_project(bundle, project_path, variables)
         print(f"\n✓ Project created successfully at {project_path}")
         print(f"\nNext steps:")
         print(f"  1. cd {project_path}")
@@ -133,10 +589,373 @@ def create_project(
         return True
     except Exception as e:
         print(f"\nError creating project: {e}", file=sys.stderr)
+        print("Files written so far are kept; run the same command again to finish the remaining ones.",
+              file=sys.stderr)
+        return False
+
+
+def plan_project(
+    path: str,
+    template: str,
+    name: str,
+    description: str = None,
+    on_exists: str = 'overwrite',
+    extra_variables: dict = None,
+    bundle: TemplateBundle = None
+) -> dict:
+    """
+    Work out what create_project would write, without writing anything.
+
+    Every file of the template is sized from its placeholders and, when a
+    file already exists at its destination, compared with the rendered
+    output as a stream (files whose size differs are not read at all).
+
+    Args:
+        path: Project directory
+        template: Template name
+        name: Display name for the project
+        description: Optional project description
+        on_exists: What create_project would do with an existing directory
+            ('skip' and 'fail' write nothing)
+        extra_variables: Additional template variables
+        bundle: Template bundle to plan with (default: resolved from template)
+
+    Returns:
+        Plan dict: path, template, exists, outcome ('write', 'skip' or
+        'fail'), files (path, action 'create'/'overwrite'/'unchanged',
+        bytes) and totals (files per action, bytes, bytes_changed).
+        Files are only listed when the outcome is 'write'.
+
+    Raises:
+        ValueError: if the template does not exist
+    """
+    project_path = resolve_project_path(path)
+    if bundle is None:
+        template_dir = TEMPLATES_DIR / template
+        if not template_dir.exists():
+            raise ValueError(f"Template '{template}' not found at {template_dir}")
+        bundle = get_bundle(template_dir)
+
+    exists = project_path.exists()
+    outcome = on_exists if exists and on_exists in ('skip', 'fail') else 'write'
+    variables = project_variables(project_path, template, name, description, extra_variables)
+    files = []
+    totals = {'create': 0, 'overwrite': 0, 'unchanged': 0, 'bytes': 0, 'bytes_changed': 0}
+
+    with tracing.span('project.plan', template=template, path=project_path):
+        for entry in bundle.files if outcome == 'write' else ():
+            dest = project_path / entry['path']
+            size = bundle.rendered_size(entry, variables)
+            action = 'create'
+            if exists:
+                try:
+                    existing_size = dest.stat().st_size
+                except OSError:
+                    existing_size = None
+                if existing_size is not None:
+                    same = existing_size == size and bundle.matches(entry, variables, dest)
+                    action = 'unchanged' if same else 'overwrite'
+            files.append({'path': entry['path'], 'action': action, 'bytes': size})
+            totals[action] += 1
+            totals['bytes'] += size
+            if action != 'unchanged':
+                totals['bytes_changed'] += size
+
+    return {
+        'path': str(project_path),
+        'template': template,
+        'exists': exists,
+        'outcome': outcome,
+        'files': files,
+        'totals': totals,
+    }
+
+
+def format_plan(plan: dict) -> str:
+    """Human-readable listing of a plan_project result."""
+    state = 'existing directory' if plan['exists'] else 'new directory'
+    lines = [f"Plan for {plan['path']} (template {plan['template']}, {state})"]
+    if plan['outcome'] != 'write':
+        lines.append(f"  Nothing would be written: the directory exists and create would {plan['outcome']}")
+        return '\n'.join(lines)
+
+    width = max((len(f['path']) for f in plan['files']), default=0)
+    for f in plan['files']:
+        lines.append(f"  {f['action']:<9}  {f['path']:<{width}}  {f['bytes']:>10,} B")
+    totals = plan['totals']
+    lines.append(
+        f"{totals['create']} to create, {totals['overwrite']} to overwrite, {totals['unchanged']} unchanged; "
+        f"{totals['bytes_changed']:,} of {totals['bytes']:,} bytes changed"
+    )
+    return '\n'.join(lines)
+
+
+def plan_projects_batch(manifest_path: str, on_exists: str = 'fail', workers: int = 8) -> dict:
+    """
+    Plan every project of a batch manifest (see load_batch_manifest).
+
+    Bundles are resolved once per template and projects are planned
+    concurrently; nothing is written.
+
+    Returns:
+        Dict with the manifest, per-project plans (or errors) and totals
+        summed over the projects that would be written
+    """
+    manifest = Path(manifest_path)
+    started = time.perf_counter()
+    entries = load_batch_manifest(manifest)
+
+    templates = available_templates()
+    bundles = {
+        template: get_bundle(TEMPLATES_DIR / template)
+        for template in sorted({e['template'] for e in entries if 'error' not in e})
+        if template in templates
+    }
+
+    def plan_entry(entry: dict) -> dict:
+        try:
+            if 'error' in entry:
+                raise ValueError(entry['error'])
+            if entry['template'] not in bundles:
+                raise ValueError(f"Template '{entry['template']}' not found")
+            plan = plan_project(
+                entry['path'], entry['template'], entry['name'], entry.get('description'),
+                on_exists, entry.get('variables'), bundles[entry['template']]
+            )
+        except (OSError, ValueError) as e:
+            return {'line': entry['line'], 'path': entry.get('path'), 'outcome': 'error', 'error': str(e)}
+        return dict(plan, line=entry['line'])
+
+    plans = _run_parallel(plan_entry, entries, workers)
+
+    totals = {'projects': len(plans), 'write': 0, 'skip': 0, 'fail': 0, 'error': 0,
+              'create': 0, 'overwrite': 0, 'unchanged': 0, 'bytes': 0, 'bytes_changed': 0}
+    for plan in plans:
+        totals[plan['outcome']] += 1
+        if plan['outcome'] == 'write':
+            for key, value in plan['totals'].items():
+                totals[key] += value
+
+    return {
+        'manifest': str(manifest.resolve()),
+        'on_exists': on_exists,
+        'seconds': round(time.perf_counter() - started, 6),
+        'totals': totals,
+        'projects': plans,
+    }
+
+
+def load_batch_manifest(manifest_path: Path, required: tuple = ('path', 'template', 'name')) -> list[dict]:
+    """
+    Read a batch manifest: one JSON object per line with path, template,
+    name and optional description and variables.
+
+    Blank lines and lines starting with # are ignored. Malformed lines are
+    returned as entries with an 'error' key so they show up in the report.
+    """
+    entries = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                entry = json.loads(line)
+                if not isinstance(entry, dict):
+                    raise ValueError("entry must be a JSON object")
+                missing = [key for key in required if not entry.get(key)]
+                if missing:
+                    raise ValueError(f"missing field(s): {', '.join(missing)}")
+                if not isinstance(entry.get('variables', {}), dict):
+                    raise ValueError("'variables' must be an object")
+                check_variable_names(entry.get('variables', {}))
+            except ValueError as e:
+                entry = {'error': str(e)}
+            entry['line'] = line_number
+            entries.append(entry)
+    return entries
+
+
+def _update_batch_entry(entry: dict) -> dict:
+    """Update one project from a batch manifest entry and return its report."""
+    started = time.perf_counter()
+    result = {'line': entry['line'], 'path': entry.get('path')}
+    try:
+        if 'error' in entry:
+            raise ValueError(entry['error'])
+        with tracing.span('project.update', path=entry['path']):
+            changes = update_project(
+                entry['path'], entry.get('template'), entry.get('name'), entry.get('description'),
+                entry.get('variables'), verbose=False
+            )
+        result['status'] = 'updated'
+        result['changes'] = {status: paths for status, paths in changes.items() if paths}
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    finally:
+        result['seconds'] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def _create_batch_entry(entry: dict, bundles: dict, on_exists: str) -> dict:
+    """Create one project from a batch manifest entry and return its report."""
+    started = time.perf_counter()
+    result = {
+        'line': entry['line'],
+        'path': entry.get('path'),
+        'template': entry.get('template'),
+        'name': entry.get('name'),
+    }
+
+    try:
+        if 'error' in entry:
+            raise ValueError(entry['error'])
+        bundle = bundles.get(entry['template'])
+        if bundle is None:
+            raise ValueError(f"Template '{entry['template']}' not found")
+
+        project_path = resolve_project_path(entry['path'])
+        result['path'] = str(project_path)
+        if project_path.exists() and on_exists != 'overwrite':
+            if on_exists == 'skip':
+                result['status'] = 'skipped'
+                return result
+            raise FileExistsError(f"{project_path} already exists")
+
+        variables = project_variables(
+            project_path, entry['template'], entry['name'], entry.get('description'), entry.get('variables')
+        )
+        # Projects already run concurrently, so write each one's files serially
+        with tracing.span('project.create', template=entry['template'], path=project_path):
+            result.update(scaffold_project(bundle, project_path, variables, workers=1, verbose=False))
+        result['status'] = 'created'
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    finally:
+        result['seconds'] = round(time.perf_counter() - started, 6)
+
+    return result
+
+
+def create_projects_batch(
+    manifest_path: str,
+    on_exists: str = 'fail',
+    workers: int = 4,
+    report_path: str = None,
+    update: bool = False
+) -> bool:
+    """
+    Create many projects from a JSON Lines manifest in one process.
+
+    Each template is resolved to its bundle once and shared by every entry
+    that uses it; projects are created concurrently.
+
+    Args:
+        manifest_path: Path to the manifest file
+        on_exists: 'skip', 'overwrite' or 'fail' for existing project paths
+        workers: Number of projects to create concurrently
+        report_path: Where to write the JSON report (default: next to the
+            manifest, with a .report.json suffix)
+        update: Incrementally update existing projects (see update_project)
+            instead of creating them; entries then only need a path
+
+    Returns:
+        True if no entry failed, False otherwise
+    """
+    manifest = Path(manifest_path)
+    report_file = Path(report_path) if report_path else manifest.with_suffix('.report.json')
+    started = time.perf_counter()
+
+    try:
+        entries = load_batch_manifest(manifest, ('path',) if update else ('path', 'template', 'name'))
+    except OSError as e:
+        print(f"Error reading manifest {manifest}: {e}", file=sys.stderr)
         return False
 
+    if update:
+        print(f"Updating {len(entries)} project(s) with {workers} worker(s)...")
+        results = _run_parallel(_update_batch_entry, entries, workers)
+    else:
+        # Resolve each template once for the whole batch
+        templates = available_templates()
+        bundles = {}
+        for template in sorted({e['template'] for e in entries if 'error' not in e}):
+            if template in templates:
+                bundles[template] = get_bundle(TEMPLATES_DIR / template)
+
+        print(f"Creating {len(entries)} project(s) with {workers} worker(s)...")
+        results = _run_parallel(lambda entry: _create_batch_entry(entry, bundles, on_exists), entries, workers)
+
+    counts = {'updated': 0} if update else {'created': 0, 'skipped': 0}
+    counts['failed'] = 0
+    for result in results:
+        counts[result['status']] += 1
+        if result['status'] == 'failed':
+            print(f"  ✗ line {result['line']}: {result['error']}", file=sys.stderr)
+
+    report = {
+        'manifest': str(manifest.resolve()),
+        'on_exists': on_exists,
+        'workers': workers,
+        'seconds': round(time.perf_counter() - started, 6),
+        'summary': counts,
+        'projects': results,
+    }
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{', '.join(f'{count} {status}' for status, count in counts.items())} in {report['seconds']:.2f}s")
+    print(f"Report written to {report_file}")
+    return counts['failed'] == 0
 
-def main():
+
+def _plan_main(parser, args):
+    """Run --plan for a single project or a batch manifest and exit."""
+    if args.update:
+        parser.error("--plan cannot be combined with --update")
+    as_json = args.format == 'json'
+
+    if args.batch:
+        try:
+            result = plan_projects_batch(args.batch, args.on_exists or 'fail', max(1, args.workers))
+        except OSError as e:
+            print(f"Error reading manifest {args.batch}: {e}", file=sys.stderr)
+            sys.exit(1)
+        totals = result['totals']
+        if as_json:
+            print(json.dumps(result, indent=2))
+        else:
+            for plan in result['projects']:
+                if plan['outcome'] == 'error':
+                    print(f"  ✗ line {plan['line']}: {plan['error']}")
+                elif plan['outcome'] == 'write':
+                    t = plan['totals']
+                    print(f"  {plan['path']}: {t['create']} create, {t['overwrite']} overwrite, "
+                          f"{t['unchanged']} unchanged, {t['bytes_changed']:,} bytes")
+                else:
+                    print(f"  {plan['path']}: exists, would {plan['outcome']}")
+            print(f"\n{totals['projects']} project(s): {totals['write']} to write, {totals['skip']} skipped, "
+                  f"{totals['fail']} would fail, {totals['error']} invalid")
+            print(f"{totals['create']} file(s) to create, {totals['overwrite']} to overwrite, "
+                  f"{totals['unchanged']} unchanged; {totals['bytes_changed']:,} of {totals['bytes']:,} bytes changed "
+                  f"(planned in {result['seconds']:.2f}s)")
+        sys.exit(0 if not (totals['fail'] or totals['error']) else 1)
+
+    if not (args.path and args.template and args.name):
+        parser.error("--path, --template and --name are required unless --batch is given")
+    on_exists = args.on_exists if args.on_exists in ('skip', 'fail') else 'overwrite'
+    try:
+        plan = plan_project(args.path, args.template, args.name, args.description, on_exists)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(plan, indent=2) if as_json else format_plan(plan))
+    sys.exit(1 if plan['outcome'] == 'fail' else 0)
+
+
+def main(argv: list[str] = None):
     parser = argparse.ArgumentParser(
         description='Create a new Claude Code project from a template',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -144,25 +963,34 @@ def main():
 Examples:
   python3 init_project.py --path /Users/me/projects/my-app --template software-dev --name "My App"
   python3 init_project.py --path ~/running-tracker --template personal-tracker --name "Running Tracker" --description "Track my running workouts"
+
+  # Create many projects from a JSON Lines manifest, one object per line:
+  # {"path": "/srv/app", "template": "software-dev", "name": "App", "variables": {"OWNER": "me"}}
+  python3 init_project.py --batch projects.jsonl --workers 8 --on-exists skip
+
+  # Push template changes to an existing project (or every project in a manifest)
+  python3 init_project.py --update --path /Users/me/projects/my-app
+  python3 init_project.py --update --batch projects.jsonl
+
+  # Preview what a scaffold would write, for one project or a whole manifest
+  python3 init_project.py --plan --path /Users/me/projects/my-app --template software-dev --name "My App"
+  python3 init_project.py --plan --batch projects.jsonl --format json
         """
     )
 
     parser.add_argument(
         '--path',
-        required=True,
         help='Absolute path where the project should be created'
     )
 
     parser.add_argument(
         '--template',
-        required=True,
         choices=['base', 'software-dev', 'content-creation', 'personal-tracker', 'data-analysis', 'automation'],
         help='Template to use for the project'
     )
 
     parser.add_argument(
         '--name',
-        required=True,
         help='Display name for the project'
     )
 
@@ -171,16 +999,93 @@ Examples:
         help='Optional project description'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--on-exists',
+        choices=['prompt', 'skip', 'overwrite', 'fail'],
+        help='What to do when the project path already exists (default: prompt, or fail with --batch)'
+    )
+
+    parser.add_argument(
+        '--update',
+        action='store_true',
+        help='Re-render an existing project from its template, writing only files that changed '
+             'and leaving locally modified files untouched'
+    )
+
+    parser.add_argument(
+        '--batch',
+        metavar='MANIFEST',
+        help='Create projects listed in a JSON Lines manifest instead of a single project'
+    )
 
-    success = create_project(
-        path=args.path,
-        template=args.template,
-        name=args.name,
-        description=args.description
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Projects to create concurrently in batch mode (default: 4)'
+    )
+
+    parser.add_argument(
+        '--report',
+        help='Where to write the batch JSON report (default: <manifest>.report.json)'
     )
 
-    sys.exit(0 if success else 1)
+    parser.add_argument(
+        '--plan',
+        action='store_true',
+        help='Show which files would be created, overwritten or left unchanged, '
+             'with byte counts, without writing anything'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['human', 'json'],
+        default='human',
+        help='Output format for --plan (default: human)'
+    )
+
+    tracing.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    with tracing.session(args.trace, args.profile):
+        if args.plan:
+            _plan_main(parser, args)
+
+        if args.batch:
+            if args.on_exists == 'prompt':
+                parser.error("--on-exists prompt is not available in batch mode")
+            success = create_projects_batch(
+                manifest_path=args.batch,
+                on_exists=args.on_exists or 'fail',
+                workers=max(1, args.workers),
+                report_path=args.report,
+                update=args.update
+            )
+            sys.exit(0 if success else 1)
+
+        if args.update:
+            if not args.path:
+                parser.error("--update requires --path")
+            try:
+                update_project(args.path, args.template, args.name, args.description)
+            except Exception as e:
+                print(f"Error updating project: {e}", file=sys.stderr)
+                sys.exit(1)
+            sys.exit(0)
+
+        if not (args.path and args.template and args.name):
+            parser.error("--path, --template and --name are required unless --batch is given")
+
+        success = create_project(
+            path=args.path,
+            template=args.template,
+            name=args.name,
+            description=args.description,
+            on_exists=args.on_exists or 'prompt'
+        )
+
+        sys.exit(0 if success else 1)
 
 
 if __name__ == '__main__':
@@ -3,6 +3,9 @@
 MCP Server Installation Helper
 
 Assists with installing MCP servers and updating .mcp.json configuration.
+Servers are registered through a backend: "cli" runs `claude mcp add`,
+"native" writes the project .mcp.json directly without spawning a
+process, and "fake" only records the commands it would run (for tests).
 Uses only Python standard library.
 """
 
@@ -10,8 +13,13 @@ import argparse
 import json
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import tracing
+from mcp_config import McpConfigStore
+
 
 def run_command(command: list[str], dry_run: bool = False) -> tuple[bool, str]:
     """
@@ -29,12 +37,13 @@ def run_command(command: list[str], dry_run: bool = False) -> tuple[bool, str]:
         return True, "Dry run - not executed"
 
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        with tracing.span('subprocess', command=' '.join(command)):
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=True
+            )
         return True, result.stdout
     except subprocess.CalledProcessError as e:
         return False, f"Command failed: {e.stderr}"
@@ -54,26 +63,28 @@ def update_mcp_json(config_path: Path, server_name: str, server_config: dict) ->
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Load existing config or create new
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        else:
-            config = {"mcpServers": {}}
+    return update_mcp_json_servers(config_path, {server_name: server_config})
 
-        # Ensure mcpServers key exists
-        if 'mcpServers' not in config:
-            config['mcpServers'] = {}
 
-        # Add or update server
-        config['mcpServers'][server_name] = server_config
+def update_mcp_json_servers(config_path: Path, servers: dict) -> bool:
+    """
+    Add or update several servers in .mcp.json in one locked, atomic write.
 
-        # Write back to file
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+    Args:
+        config_path: Path to .mcp.json file
+        servers: Mapping of server name to server configuration
 
-        print(f"✓ Updated {config_path} with server '{server_name}'")
+    Returns:
+        True if successful, False otherwise
+    """
+    names = ', '.join(f"'{name}'" for name in servers)
+    try:
+        with tracing.span('mcp.config_write', config=config_path, servers=len(servers)):
+            updated = McpConfigStore(config_path).update_servers(servers)
+        if updated:
+            print(f"✓ Updated {config_path} with server(s) {names}")
+        else:
+            print(f"✓ {config_path} already up to date for server(s) {names}")
         return True
 
     except Exception as e:
@@ -81,6 +92,167 @@ def update_mcp_json(config_path: Path, server_name: str, server_config: dict) ->
         return False
 
 
+def check_server(transport: str, url: str = None, command: str = None):
+    """
+    Check that a server has what its transport needs.
+
+    Raises:
+        ValueError: if the URL or command required by the transport is missing
+    """
+    if transport in ['http', 'sse'] and not url:
+        raise ValueError("URL required for http/sse transport")
+    if transport == 'stdio' and not command:
+        raise ValueError("Command required for stdio transport")
+
+
+def build_add_command(
+    server_name: str,
+    transport: str,
+    url: str = None,
+    command: str = None,
+    args: list[str] = None,
+    env: dict = None,
+    project_scope: bool = False
+) -> list[str]:
+    """
+    Build the `claude mcp add` command for a server.
+
+    Raises:
+        ValueError: if the URL or command required by the transport is missing
+    """
+    check_server(transport, url, command)
+
+    # Correct order: claude mcp add [--scope project] --transport TYPE SERVER_NAME -e KEY=value -- command
+    # The scope goes before the server name: anything after -- belongs to the stdio command.
+    cmd = ['claude', 'mcp', 'add']
+    if project_scope:
+        cmd.extend(['--scope', 'project'])
+    cmd.extend(['--transport', transport, server_name])
+
+    if transport in ['http', 'sse']:
+        cmd.append(url)
+    elif transport == 'stdio':
+        # For stdio: server name is already added, now add -e flags, then --, then command
+        if env:
+            for key, value in env.items():
+                cmd.extend(['-e', f'{key}={value}'])
+        cmd.append('--')
+        cmd.append(command)
+        if args:
+            cmd.extend(args)
+
+    return cmd
+
+
+def build_server_config(
+    transport: str,
+    url: str = None,
+    command: str = None,
+    args: list[str] = None,
+    env: dict = None
+) -> dict:
+    """
+    Build the .mcp.json entry for a server.
+
+    Matches what `claude mcp add --scope project` writes: stdio servers
+    always carry "args" and "env", http/sse servers only a "url".
+    """
+    server_config = {"type": transport}
+
+    if transport in ['http', 'sse']:
+        server_config['url'] = url
+    elif transport == 'stdio':
+        server_config['command'] = command
+        server_config['args'] = list(args or [])
+        server_config['env'] = dict(env or {})
+
+    return server_config
+
+
+class CliBackend:
+    """Registers servers by running `claude mcp add`."""
+
+    name = 'cli'
+    # Project config to maintain when none is given; the CLI keeps its own
+    default_config = None
+
+    def install(self, server: dict, project_scope: bool, dry_run: bool = False, verbose: bool = False) -> tuple[bool, str]:
+        """
+        Register one server.
+
+        Args:
+            server: Server dict with name, transport, url, command, args, env
+            project_scope: Whether a project .mcp.json is being maintained
+            dry_run: If True, print actions but don't execute
+            verbose: Print the command being run
+
+        Returns:
+            (success, output) tuple
+
+        Raises:
+            ValueError: if the server is missing what its transport needs
+        """
+        cmd = build_add_command(
+            server['name'], server['transport'], server.get('url'), server.get('command'),
+            server.get('args'), server.get('env'), project_scope
+        )
+        if verbose:
+            print(f"Executing: {' '.join(cmd)}")
+        return run_command(cmd, dry_run)
+
+
+class NativeBackend:
+    """
+    Registers servers by writing the project .mcp.json directly.
+
+    Produces the same entries as `claude mcp add --scope project` without
+    spawning a process. The write itself is the .mcp.json update every
+    backend gets, so a batch lands in a single transaction.
+    """
+
+    name = 'native'
+    default_config = Path('.mcp.json')
+
+    def install(self, server: dict, project_scope: bool, dry_run: bool = False, verbose: bool = False) -> tuple[bool, str]:
+        check_server(server['transport'], server.get('url'), server.get('command'))
+        if dry_run:
+            print(f"[DRY RUN] Would add '{server['name']}' to the project .mcp.json")
+            return True, "Dry run - not executed"
+        return True, ""
+
+
+class FakeCliBackend:
+    """
+    Records the `claude mcp add` commands it would run instead of running them.
+
+    For tests. Servers named in fail report a failed installation.
+    """
+
+    name = 'fake'
+    default_config = None
+
+    def __init__(self, fail: list[str] = ()):
+        self.commands = []
+        self.fail = set(fail)
+
+    def install(self, server: dict, project_scope: bool, dry_run: bool = False, verbose: bool = False) -> tuple[bool, str]:
+        cmd = build_add_command(
+            server['name'], server['transport'], server.get('url'), server.get('command'),
+            server.get('args'), server.get('env'), project_scope
+        )
+        self.commands.append(cmd)
+        if server['name'] in self.fail:
+            return False, "Command failed: simulated failure"
+        return True, ""
+
+
+BACKENDS = {
+    'cli': CliBackend,
+    'native': NativeBackend,
+    'fake': FakeCliBackend,
+}
+
+
 def install_mcp_server(
     server_name: str,
     transport: str,
@@ -89,7 +261,8 @@ def install_mcp_server(
     args: list[str] = None,
     env: dict = None,
     config_path: str = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    backend=None
 ) -> bool:
     """
     Install an MCP server.
@@ -103,42 +276,25 @@ def install_mcp_server(
         env: Environment variables
         config_path: Path to .mcp.json (optional)
         dry_run: If True, print actions but don't execute
+        backend: Install backend (default: CliBackend)
 
     Returns:
         True if successful, False otherwise
     """
+    backend = backend or CliBackend()
+    project_scope = bool(config_path)
+    config_path = config_path or backend.default_config
+
     print(f"\nInstalling MCP server: {server_name}")
     print(f"Transport: {transport}")
 
-    # Build claude mcp add command
-    # Correct order: claude mcp add --transport TYPE SERVER_NAME -e KEY=value -- command
-    cmd = ['claude', 'mcp', 'add', '--transport', transport, server_name]
-
-    if transport in ['http', 'sse']:
-        if not url:
-            print("Error: URL required for http/sse transport", file=sys.stderr)
-            return False
-        cmd.append(url)
-    elif transport == 'stdio':
-        if not command:
-            print("Error: Command required for stdio transport", file=sys.stderr)
-            return False
-        # For stdio: server name is already added, now add -e flags, then --, then command
-        if env:
-            for key, value in env.items():
-                cmd.extend(['-e', f'{key}={value}'])
-        cmd.append('--')
-        cmd.append(command)
-        if args:
-            cmd.extend(args)
-
-    # Add scope if config_path is provided
-    if config_path:
-        cmd.extend(['--scope', 'project'])
-
-    # Execute installation command
-    print(f"Executing: {' '.join(cmd)}")
-    success, output = run_command(cmd, dry_run)
+    server = {'name': server_name, 'transport': transport, 'url': url, 'command': command, 'args': args, 'env': env}
+    try:
+        with tracing.span('mcp.install', server=server_name, backend=backend.name):
+            success, output = backend.install(server, project_scope, dry_run, verbose=True)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
 
     if success:
         print(f"✓ Installation command executed successfully")
@@ -147,21 +303,8 @@ def install_mcp_server(
 
         # Update .mcp.json if config_path provided
         if config_path and not dry_run:
-            config_file = Path(config_path)
-
-            # Build server config
-            server_config = {"type": transport}
-
-            if transport in ['http', 'sse']:
-                server_config['url'] = url
-            elif transport == 'stdio':
-                server_config['command'] = command
-                if args:
-                    server_config['args'] = args
-                if env:
-                    server_config['env'] = env
-
-            update_mcp_json(config_file, server_name, server_config)
+            server_config = build_server_config(transport, url, command, args, env)
+            update_mcp_json(Path(config_path), server_name, server_config)
 
         return True
     else:
@@ -169,7 +312,147 @@ def install_mcp_server(
         return False
 
 
-def main():
+def check_servers(servers: list):
+    """
+    Check that every server of a batch is an object with a name.
+
+    Raises:
+        ValueError: naming the index of the first bad entry
+    """
+    if not isinstance(servers, list):
+        raise ValueError("expected a list of servers")
+    for i, server in enumerate(servers):
+        if not isinstance(server, dict):
+            raise ValueError(f"server {i}: expected an object, got {type(server).__name__}")
+        if not isinstance(server.get('name'), str) or not server['name']:
+            raise ValueError(f"server {i}: missing 'name'")
+
+
+def load_servers_file(servers_file: Path) -> list[dict]:
+    """
+    Read the servers to install from a JSON file.
+
+    Accepts either a list of {"name", "transport", "url", "command", "args",
+    "env"} objects or an .mcp.json-style {"mcpServers": {name: config}}
+    object, where "type" is the transport.
+
+    Raises:
+        ValueError: if the file is not valid JSON, or an entry is not an
+            object with a name
+    """
+    with open(servers_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and 'mcpServers' in data:
+        if not isinstance(data['mcpServers'], dict):
+            raise ValueError("'mcpServers' must be an object")
+        for name, config in data['mcpServers'].items():
+            if not isinstance(config, dict):
+                raise ValueError(f"server '{name}': expected an object, got {type(config).__name__}")
+        return [
+            {
+                'name': name,
+                'transport': config.get('type', 'stdio'),
+                'url': config.get('url'),
+                'command': config.get('command'),
+                'args': config.get('args'),
+                'env': config.get('env'),
+            }
+            for name, config in data['mcpServers'].items()
+        ]
+
+    if not isinstance(data, list):
+        raise ValueError("expected a list of servers or an object with 'mcpServers'")
+    check_servers(data)
+    return data
+
+
+def _install_one(server: dict, backend, project_scope: bool, dry_run: bool) -> dict:
+    """Install one server of a batch through the backend and report the outcome."""
+    started = time.perf_counter()
+    result = {'name': server.get('name'), 'transport': server.get('transport')}
+    try:
+        if not server.get('name') or server.get('transport') not in ('stdio', 'http', 'sse'):
+            raise ValueError("each server needs a 'name' and a 'transport' of stdio, http or sse")
+        with tracing.span('mcp.install', server=server['name'], backend=backend.name):
+            success, output = backend.install(server, project_scope, dry_run)
+        result['success'] = success
+        if not success:
+            result['error'] = output.strip()
+    except ValueError as e:
+        result['success'] = False
+        result['error'] = str(e)
+    result['seconds'] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def install_mcp_servers(
+    servers: list[dict],
+    config_path: str = None,
+    dry_run: bool = False,
+    workers: int = 4,
+    report_path: str = None,
+    backend=None
+) -> bool:
+    """
+    Install several MCP servers concurrently.
+
+    Installation commands run on a bounded thread pool. The .mcp.json
+    entries of every server that installed successfully are then applied
+    in a single atomic write.
+
+    Args:
+        servers: Server dicts as returned by load_servers_file
+        config_path: Path to .mcp.json (optional)
+        dry_run: If True, print actions but don't execute
+        workers: Maximum concurrent installations
+        report_path: Optional path for a JSON report
+        backend: Install backend (default: CliBackend)
+
+    Returns:
+        True if every server installed successfully, False otherwise
+    """
+    backend = backend or CliBackend()
+    project_scope = bool(config_path)
+    config_path = config_path or backend.default_config
+
+    print(f"Installing {len(servers)} MCP server(s) with {workers} worker(s) using the {backend.name} backend...")
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda server: _install_one(server, backend, project_scope, dry_run), servers))
+
+    config_ok = True
+    if config_path and not dry_run:
+        configs = {
+            server['name']: build_server_config(
+                server['transport'], server.get('url'), server.get('command'), server.get('args'), server.get('env')
+            )
+            for server, result in zip(servers, results) if result['success']
+        }
+        if configs:
+            config_ok = update_mcp_json_servers(Path(config_path), configs)
+
+    print()
+    for result in results:
+        if result['success']:
+            print(f"  ✓ {result['name']} ({result['seconds']:.2f}s)")
+        else:
+            print(f"  ✗ {result['name']} ({result['seconds']:.2f}s): {result['error']}")
+
+    failed = sum(1 for r in results if not r['success'])
+    elapsed = time.perf_counter() - started
+    print(f"\n{len(results) - failed} installed, {failed} failed in {elapsed:.2f}s")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({'seconds': round(elapsed, 6), 'backend': backend.name, 'dry_run': dry_run, 'servers': results}, f, indent=2)
+        print(f"Report written to {report_path}")
+
+    return failed == 0 and config_ok
+
+
+def main(argv: list[str] = None):
     parser = argparse.ArgumentParser(
         description='Install MCP servers and update configuration',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -186,18 +469,22 @@ Examples:
 
   # Dry run (don't actually execute)
   python3 install_mcp.py --server github --transport http --url https://api.githubcopilot.com/mcp/ --dry-run
+
+  # Write the project .mcp.json directly instead of running `claude mcp add`
+  python3 install_mcp.py --server github --transport http --url https://api.githubcopilot.com/mcp/ --backend native
+
+  # Install every server listed in a file (a list of servers or an .mcp.json-style object)
+  python3 install_mcp.py --from-file servers.json --config /path/to/project/.mcp.json --workers 8
         """
     )
 
     parser.add_argument(
         '--server',
-        required=True,
         help='Name of the MCP server'
     )
 
     parser.add_argument(
         '--transport',
-        required=True,
         choices=['stdio', 'http', 'sse'],
         help='Transport type'
     )
@@ -235,29 +522,79 @@ Examples:
         help='Print commands but do not execute'
     )
 
-    args = parser.parse_args()
-
-    # Parse environment variables
-    env_dict = None
-    if args.env:
-        env_dict = {}
-        for env_var in args.env:
-            if '=' in env_var:
-                key, value = env_var.split('=', 1)
-                env_dict[key] = value
-
-    success = install_mcp_server(
-        server_name=args.server,
-        transport=args.transport,
-        url=args.url,
-        command=args.command,
-        args=args.args,
-        env=env_dict,
-        config_path=args.config,
-        dry_run=args.dry_run
+    parser.add_argument(
+        '--from-file',
+        metavar='SERVERS_JSON',
+        help='Install every server listed in a JSON file instead of a single server'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Concurrent installations with --from-file (default: 4)'
     )
 
-    sys.exit(0 if success else 1)
+    parser.add_argument(
+        '--report',
+        help='Write a JSON report of a --from-file run to this path'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=sorted(BACKENDS),
+        default='cli',
+        help='How servers are registered: cli runs `claude mcp add`, native writes the '
+             'project .mcp.json directly, fake only records commands (default: cli)'
+    )
+
+    tracing.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+    backend = BACKENDS[args.backend]()
+
+    with tracing.session(args.trace, args.profile):
+        if args.from_file:
+            try:
+                servers = load_servers_file(Path(args.from_file))
+            except (OSError, ValueError) as e:
+                print(f"Error reading {args.from_file}: {e}", file=sys.stderr)
+                sys.exit(1)
+            success = install_mcp_servers(
+                servers,
+                config_path=args.config,
+                dry_run=args.dry_run,
+                workers=args.workers,
+                report_path=args.report,
+                backend=backend
+            )
+            sys.exit(0 if success else 1)
+
+        if not (args.server and args.transport):
+            parser.error("--server and --transport are required unless --from-file is given")
+
+        # Parse environment variables
+        env_dict = None
+        if args.env:
+            env_dict = {}
+            for env_var in args.env:
+                if '=' in env_var:
+                    key, value = env_var.split('=', 1)
+                    env_dict[key] = value
+
+        success = install_mcp_server(
+            server_name=args.server,
+            transport=args.transport,
+            url=args.url,
+            command=args.command,
+            args=args.args,
+            env=env_dict,
+            config_path=args.config,
+            dry_run=args.dry_run,
+            backend=backend
+        )
+
+        sys.exit(0 if success else 1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+MCP Config Store
+
+Safe access to .mcp.json for concurrent installers: reads and
+read-modify-write transactions are serialized with an advisory lock,
+writes go to a temporary file that is fsynced and swapped in with
+os.replace, and a transaction that changes nothing does not write at all.
+Uses only Python standard library.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from fsutil import DEFAULT_FILE_MODE, fsync_directory
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
+
+class McpConfigStore:
+    """
+    A .mcp.json file guarded by an advisory lock.
+
+    The lock is taken on a hidden sidecar file beside the config
+    (.mcp.json.lock, or .<name>.lock for other names) rather than on the
+    config itself, because os.replace swaps in a new inode on every write.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        hidden = self.path.name if self.path.name.startswith('.') else f".{self.path.name}"
+        self.lock_path = self.path.with_name(f"{hidden}.lock")
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        if fcntl is None or (not exclusive and not self.lock_path.exists()):
+            yield
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {"mcpServers": {}}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read(self) -> dict:
+        """
+        Read the current configuration.
+
+        Returns {"mcpServers": {}} if the file does not exist.
+
+        Raises:
+            json.JSONDecodeError: if the file is not valid JSON
+        """
+        with self._locked(exclusive=False):
+            return self._load()
+
+    def _write(self, config: dict):
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.path.exists():
+                os.chmod(tmp_name, self.path.stat().st_mode & 0o7777)
+            else:
+                os.chmod(tmp_name, DEFAULT_FILE_MODE)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        fsync_directory(self.path.parent)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Read-modify-write the configuration under an exclusive lock.
+
+        Yields the configuration dict (with an "mcpServers" object) to be
+        modified in place. On a clean exit it is written back atomically if,
+        and only if, it differs from what was read.
+
+        Raises:
+            ValueError: if the file is not a JSON object, or its
+                "mcpServers" is not an object
+        """
+        with self._locked(exclusive=True):
+            config = self._load()
+            if not isinstance(config, dict):
+                raise ValueError(f"{self.path} must contain a JSON object, not {type(config).__name__}")
+            config.setdefault('mcpServers', {})
+            if not isinstance(config['mcpServers'], dict):
+                raise ValueError(f"'mcpServers' in {self.path} must be an object")
+            original = json.dumps(config, sort_keys=True)
+            yield config
+            if json.dumps(config, sort_keys=True) != original:
+                self._write(config)
+
+    def update_servers(self, servers: dict) -> bool:
+        """
+        Add or replace several servers in one transaction.
+
+        Returns:
+            True if the file was written, False if it already matched
+        """
+        with self.transaction() as config:
+            before = json.dumps(config, sort_keys=True)
+            config['mcpServers'].update(servers)
+            return json.dumps(config, sort_keys=True) != before
+
+    def remove_servers(self, names: list[str]) -> bool:
+        """
+        Remove servers in one transaction.
+
+        Returns:
+            True if the file was written, False if none of them were present
+        """
+        with self.transaction() as config:
+            removed = [config['mcpServers'].pop(name) for name in names if name in config['mcpServers']]
+            return bool(removed)
+
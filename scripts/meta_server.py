@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Meta Worker Service
+
+A long-lived JSON-RPC 2.0 service for callers that create and validate
+projects all day. Templates are compiled and mapped once, the registry
+store stays open, and the scripts stay imported, so a request pays none
+of the startup costs. Requests are newline-delimited JSON over a Unix
+socket or stdin/stdout and run concurrently on a thread pool; responses
+carry the request id and may arrive out of order.
+
+Methods: ping, templates, create, plan, update, validate, install, search,
+stats (per-method latency histograms) and shutdown.
+Uses only Python standard library.
+"""
+
+import inspect
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Projects whose validation cache is kept in memory (least recently used first out)
+VALIDATION_CACHE_PROJECTS = 256
+
+
+class RpcError(Exception):
+    """An error returned to the caller as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class _CapturedOutput(io.TextIOBase):
+    """
+    sys.stdout/sys.stderr replacement that captures per thread.
+
+    The scripts report through print(); while a request is being handled,
+    whatever its thread prints is collected for the response. Output from
+    other threads goes to the fallback stream.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def begin(self):
+        self._local.buffer = io.StringIO()
+
+    def end(self) -> str:
+        buffer = getattr(self._local, 'buffer', None)
+        self._local.buffer = None
+        return buffer.getvalue() if buffer else ''
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._fallback.write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._fallback.flush()
+
+    def writable(self) -> bool:
+        return True
+
+
+class LatencyHistogram:
+    """Thread-safe per-method request latency histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods = {}
+
+    def record(self, method: str, seconds: float, ok: bool):
+        ms = seconds * 1000
+        with self._lock:
+            entry = self._methods.setdefault(method, {
+                'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            })
+            entry['count'] += 1
+            entry['errors'] += 0 if ok else 1
+            entry['total_ms'] += ms
+            entry['max_ms'] = max(entry['max_ms'], ms)
+            index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if ms <= bound), len(LATENCY_BUCKETS_MS))
+            entry['buckets'][index] += 1
+
+    def snapshot(self) -> dict:
+        """Histograms by method: counts per "le" bucket bound (ms), plus count, mean, max."""
+        labels = [str(bound) for bound in LATENCY_BUCKETS_MS] + ['+Inf']
+        with self._lock:
+            return {
+                method: {
+                    'count': entry['count'],
+                    'errors': entry['errors'],
+                    'mean_ms': round(entry['total_ms'] / entry['count'], 3),
+                    'max_ms': round(entry['max_ms'], 3),
+                    'buckets': dict(zip(labels, entry['buckets'])),
+                }
+                for method, entry in self._methods.items()
+            }
+
+
+class MetaService:
+    """
+    The request handlers, with the warm state they share.
+
+    Args:
+        workers: Requests handled concurrently
+        registry_path: Registry markdown file for search (default: auto-detect)
+    """
+
+    def __init__(self, workers: int = 8, registry_path: Path = None):
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='meta-rpc')
+        self.histogram = LatencyHistogram()
+        self.registry_path = registry_path
+        self.started = time.time()
+        self.stopped = threading.Event()
+        self._registries = threading.local()
+        self._validator_version = None
+        self._validation_caches = OrderedDict()  # project dir -> (lock, ValidationCache)
+        self._validation_lock = threading.Lock()
+        self._stdout = _CapturedOutput(sys.stdout)
+        self._stderr = _CapturedOutput(sys.stderr)
+        self.methods = {
+            'ping': self.ping,
+            'templates': self.templates,
+            'create': self.create,
+            'plan': self.plan,
+            'update': self.update,
+            'validate': self.validate,
+            'install': self.install,
+            'search': self.search,
+            'stats': self.stats,
+            'shutdown': self.shutdown,
+        }
+
+    def warm_up(self):
+        """Import the scripts and compile and map every template bundle."""
+        import init_project  # noqa: F401
+        import install_mcp  # noqa: F401
+        import validate_project  # noqa: F401
+        from template_bundle import TEMPLATES_DIR, get_bundle
+
+        for template_dir in sorted(p for p in TEMPLATES_DIR.iterdir() if p.is_dir()):
+            get_bundle(template_dir)
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+
+    # Request handling
+
+    def handle(self, request) -> dict:
+        """Run one JSON-RPC request; returns the response (None for notifications)."""
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or not isinstance(request.get('method'), str):
+            return _error_response(request.get('id') if isinstance(request, dict) else None,
+                                   INVALID_REQUEST, 'Invalid request')
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params', {})
+
+        started = time.perf_counter()
+        ok = False
+        self._stdout.begin()
+        self._stderr.begin()
+        try:
+            handler = self.methods.get(method)
+            if handler is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, 'params must be an object')
+            try:
+                inspect.signature(handler).bind(**params)
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, f"{method}: {e}")
+            result = handler(**params)
+            ok = True
+        except RpcError as e:
+            error = (e.code, str(e))
+        except Exception as e:
+            error = (INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+        finally:
+            output = self._stdout.end() + self._stderr.end()
+            self.histogram.record(method, time.perf_counter() - started, ok)
+
+        if 'id' not in request:
+            return None
+        if not ok:
+            response = _error_response(request_id, *error)
+            response['error']['data'] = {'output': output}
+            return response
+        if isinstance(result, dict) and output:
+            result = dict(result, output=output)
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def submit(self, line: str, respond):
+        """Parse a request line and handle it on the pool; respond(response) is called when done."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            respond(_error_response(None, PARSE_ERROR, f"Parse error: {e}"))
+            return
+
+        def run():
+            response = self.handle(request)
+            if response is not None:
+                respond(response)
+
+        self.pool.submit(run)
+
+    # Methods
+
+    def ping(self) -> dict:
+        return {'pong': True, 'pid': os.getpid(), 'uptime': round(time.time() - self.started, 3)}
+
+    def templates(self) -> dict:
+        from init_project import available_templates
+        return {'templates': available_templates()}
+
+    def create(self, path: str, template: str, name: str, description: str = None,
+               on_exists: str = 'fail', variables: dict = None) -> dict:
+        from init_project import create_project
+        if on_exists not in ('skip', 'overwrite', 'fail'):
+            raise RpcError(INVALID_PARAMS, "on_exists must be skip, overwrite or fail")
+        _check_variables(variables)
+        return {'success': create_project(path, template, name, description, on_exists, variables)}
+
+    def plan(self, path: str, template: str, name: str, description: str = None,
+             on_exists: str = 'overwrite', variables: dict = None) -> dict:
+        from init_project import plan_project
+        _check_variables(variables)
+        try:
+            return plan_project(path, template, name, description, on_exists, variables)
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+
+    def update(self, path: str, template: str = None, name: str = None,
+               description: str = None, variables: dict = None) -> dict:
+        from init_project import update_project
+        _check_variables(variables)
+        return {'success': True, 'files': update_project(path, template, name, description, variables)}
+
+    def validate(self, path: str, use_cache: bool = True) -> dict:
+        from validate_project import collect_project_report
+        project_dir = Path(path).resolve()
+        if not use_cache:
+            return collect_project_report(project_dir, use_cache=False).to_dict()
+        lock, cache = self._validation_cache(project_dir)
+        with lock:
+            return collect_project_report(project_dir, cache=cache).to_dict()
+
+    def _validation_cache(self, project_dir: Path):
+        """
+        The (lock, ValidationCache) kept in memory for a project.
+
+        The validator version is computed once per service and the cache
+        file is read only the first time a project is validated; the lock
+        serializes runs on the same project.
+        """
+        from validate_project import ValidationCache, validator_version
+
+        with self._validation_lock:
+            if self._validator_version is None:
+                self._validator_version = validator_version()
+            entry = self._validation_caches.get(project_dir)
+            if entry is None:
+                entry = (threading.Lock(), ValidationCache(project_dir, version=self._validator_version))
+                self._validation_caches[project_dir] = entry
+                if len(self._validation_caches) > VALIDATION_CACHE_PROJECTS:
+                    self._validation_caches.popitem(last=False)
+            else:
+                self._validation_caches.move_to_end(project_dir)
+            return entry
+
+    def install(self, servers: list, config_path: str = None, backend: str = 'native',
+                dry_run: bool = False, workers: int = 4) -> dict:
+        from install_mcp import BACKENDS, check_servers, install_mcp_servers
+        if backend not in BACKENDS:
+            raise RpcError(INVALID_PARAMS, f"backend must be one of {', '.join(sorted(BACKENDS))}")
+        try:
+            check_servers(servers)
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+        success = install_mcp_servers(servers, config_path, dry_run, workers, backend=BACKENDS[backend]())
+        return {'success': success}
+
+    def search(self, query: str, k: int = 10, category: str = None) -> dict:
+        from search_registry import search
+
+        # SQLite connections stay with the thread that opened them
+        store = getattr(self._registries, 'store', None)
+        if store is None:
+            from update_registry import open_registry
+            store = self._registries.store = open_registry(self.registry_path)
+        return {'results': [dict(server, score=round(score, 4)) for score, server in search(store, query, k, category)]}
+
+    def stats(self) -> dict:
+        return {'uptime': round(time.time() - self.started, 3), 'latency': self.histogram.snapshot()}
+
+    def shutdown(self) -> dict:
+        self.stopped.set()
+        return {'stopping': True}
+
+
+def _check_variables(variables: dict):
+    """Reject template variables that are not an object of valid names."""
+    from template_engine import check_variable_names
+    if variables is None:
+        return
+    if not isinstance(variables, dict):
+        raise RpcError(INVALID_PARAMS, 'variables must be an object')
+    try:
+        check_variable_names(variables)
+    except ValueError as e:
+        raise RpcError(INVALID_PARAMS, str(e))
+
+
+def _error_response(request_id, code: int, message: str) -> dict:
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def _encode(response: dict) -> bytes:
+    return (json.dumps(response, default=str) + '\n').encode('utf-8')
+
+
+def serve_stdio(service: MetaService):
+    """Serve requests from stdin, writing responses to the original stdout."""
+    out = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    sys.stdout.flush()
+    # Anything printed outside a request must not corrupt the response stream
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    write_lock = threading.Lock()
+
+    def respond(response: dict):
+        with write_lock:
+            out.write(_encode(response))
+            out.flush()
+
+    def read():
+        for line in sys.stdin:
+            if service.stopped.is_set():
+                break
+            if line.strip():
+                service.submit(line, respond)
+        service.stopped.set()  # end of input
+
+    service.warm_up()
+    # Requests run on the pool, so a shutdown lands after its line was read;
+    # wait for the flag rather than for the next line to check it.
+    threading.Thread(target=read, name='meta-stdin', daemon=True).start()
+    service.stopped.wait()
+    service.pool.shutdown(wait=True)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        service = self.server.service
+        write_lock = threading.Lock()
+
+        def respond(response: dict):
+            with write_lock:
+                try:
+                    self.wfile.write(_encode(response))
+                    self.wfile.flush()
+                except OSError:
+                    pass  # the client went away
+
+        for line in self.rfile:
+            if line.strip():
+                service.submit(line.decode('utf-8'), respond)
+            if service.stopped.is_set():
+                break
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def serve_socket(service: MetaService, socket_path: Path):
+    """Serve requests on a Unix socket until a shutdown request."""
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        # Refuse to take over a socket a live server is still answering
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+            raise RuntimeError(f"A server is already listening on {socket_path}")
+        except (ConnectionRefusedError, FileNotFoundError):
+            socket_path.unlink()
+        finally:
+            probe.close()
+
+    service.warm_up()
+    server = _UnixServer(str(socket_path), _ConnectionHandler)
+    server.service = service
+    os.chmod(socket_path, 0o600)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"Listening on {socket_path} (pid {os.getpid()})", file=sys.__stderr__, flush=True)
+    try:
+        service.stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.pool.shutdown(wait=True)
+        socket_path.unlink(missing_ok=True)
+
+
+def call(socket_path: Path, method: str, params: dict = None, timeout: float = 300) -> dict:
+    """
+    Send one request to a running server and return its response.
+
+    Raises:
+        OSError: if the server cannot be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(_encode({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}))
+        with sock.makefile('rb') as reader:
+            return json.loads(reader.readline())
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Run the warm JSON-RPC worker service, or send it one request',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on a Unix socket
+  python3 meta_server.py --socket /tmp/claude-meta.sock
+
+  # Serve newline-delimited JSON-RPC on stdin/stdout
+  python3 meta_server.py --stdio
+
+  # Send a request to a running server
+  python3 meta_server.py --socket /tmp/claude-meta.sock --call validate --params '{"path": "/path/to/project"}'
+  python3 meta_server.py --socket /tmp/claude-meta.sock --call stats
+        """
+    )
+
+    transport = parser.add_mutually_exclusive_group(required=True)
+    transport.add_argument('--socket', help='Unix socket path')
+    transport.add_argument('--stdio', action='store_true', help='Serve on stdin/stdout')
+
+    parser.add_argument('--workers', type=int, default=8, help='Requests handled concurrently (default: 8)')
+    parser.add_argument('--registry', help='Registry markdown file for search (default: auto-detect)')
+    parser.add_argument('--call', metavar='METHOD', help='Send one request to the server on --socket and print the response')
+    parser.add_argument('--params', default='{}', help='JSON params for --call')
+
+    args = parser.parse_args(argv)
+
+    if args.call:
+        if not args.socket:
+            parser.error("--call requires --socket")
+        try:
+            response = call(Path(args.socket), args.call, json.loads(args.params))
+        except ValueError as e:
+            parser.error(f"--params is not valid JSON: {e}")
+        except OSError as e:
+            print(f"Error: cannot reach server at {args.socket}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(response, indent=2))
+        sys.exit(0 if 'result' in response else 1)
+
+    service = MetaService(args.workers, Path(args.registry) if args.registry else None)
+    try:
+        if args.stdio:
+            serve_stdio(service)
+        else:
+            serve_socket(service, Path(args.socket))
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.__stderr__)
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Permission Pattern Compiler
+
+Parses the allow/ask/deny permission patterns of .claude/settings.json
+(e.g. "Bash(npm run:*)", "Read(./src/**)", "WebFetch(domain:example.com)")
+into rules, compiles them into per-tool indexes for fast matching, and
+lints them for malformed, duplicate and shadowed entries.
+Uses only Python standard library.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+
+# Tools whose specifier is a gitignore-style path pattern.
+PATH_TOOLS = {'Read', 'Edit', 'Write', 'MultiEdit', 'NotebookEdit', 'NotebookRead', 'Glob', 'Grep', 'LS'}
+
+# Rule lists in settings.json, in order of precedence.
+PERMISSION_LISTS = ('deny', 'ask', 'allow')
+
+TOOL_NAME_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*')
+
+
+class PermissionRule(NamedTuple):
+    """
+    A parsed permission pattern.
+
+    kind is one of:
+        any     - the bare tool name, matches every use of the tool
+        exact   - the argument must equal value
+        prefix  - the argument must start with value ("cmd:*" patterns)
+        glob    - value is a regex compiled from "*" wildcards
+        path    - value is a regex compiled from a gitignore-style path
+        domain  - the URL host must equal (or, for "*.", end with) value
+
+    Every argument the rule matches starts with `literal`; `open_ended`
+    means it matches every argument that starts with `literal`.
+    """
+    tool: str
+    kind: str
+    value: str
+    source: str
+    literal: str = ''
+    open_ended: bool = False
+
+
+class PermissionPatternError(ValueError):
+    """Raised for a pattern that cannot be parsed."""
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a command pattern where "*" matches any characters."""
+    return '.*'.join(re.escape(part) for part in pattern.split('*'))
+
+
+def _path_to_regex(pattern: str) -> str:
+    """
+    Translate a gitignore-style path pattern.
+
+    "**" matches across directories, "*" and "?" within one path segment.
+    A pattern without wildcards also matches everything below it.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    regex = ''.join(parts)
+    if not any(c in pattern for c in '*?'):
+        regex = f"{regex.rstrip('/')}(?:/.*)?"
+    return regex
+
+
+def normalize_path_pattern(pattern: str, project_dir: Path = None) -> str:
+    """
+    Resolve a path pattern from settings.json.
+
+    "//path" is absolute, "~/path" is relative to the home directory, and
+    "/path", "./path" and "path" are relative to the project.
+    """
+    if pattern.startswith('//'):
+        return pattern[1:]
+    if pattern.startswith('~'):
+        return os.path.expanduser(pattern)
+    pattern = pattern.lstrip('/')
+    while pattern.startswith('./'):
+        pattern = pattern[2:]
+    if project_dir is not None:
+        return f"{Path(project_dir).as_posix().rstrip('/')}/{pattern}"
+    return pattern
+
+
+def normalize_path_argument(path: str, project_dir: Path = None) -> str:
+    """Resolve a path passed to a tool the same way as path patterns."""
+    path = os.path.expanduser(path)
+    if project_dir is not None:
+        return Path(os.path.normpath(Path(project_dir) / path)).as_posix()
+    path = os.path.normpath(path)
+    return Path(path).as_posix()
+
+
+def parse_pattern(pattern, project_dir: Path = None) -> PermissionRule:
+    """
+    Parse one permission pattern into a PermissionRule.
+
+    Raises:
+        PermissionPatternError: if the pattern is malformed
+    """
+    if not isinstance(pattern, str):
+        raise PermissionPatternError("not a string")
+    text = pattern.strip()
+    if not text:
+        raise PermissionPatternError("empty pattern")
+
+    if '(' not in text:
+        if not TOOL_NAME_PATTERN.fullmatch(text):
+            raise PermissionPatternError(f"invalid tool name: {text!r}")
+        return PermissionRule(text, 'any', '', pattern, '', True)
+
+    tool, _, rest = text.partition('(')
+    if not rest.endswith(')'):
+        raise PermissionPatternError("missing closing parenthesis")
+    specifier = rest[:-1]
+    if not TOOL_NAME_PATTERN.fullmatch(tool):
+        raise PermissionPatternError(f"invalid tool name: {tool!r}")
+    if not specifier:
+        raise PermissionPatternError("empty specifier '()'; use the bare tool name to match everything")
+    if specifier.count('(') != specifier.count(')'):
+        raise PermissionPatternError("unbalanced parentheses")
+
+    if tool == 'WebFetch':
+        if not specifier.startswith('domain:') or not specifier[7:]:
+            raise PermissionPatternError("WebFetch patterns must look like WebFetch(domain:example.com)")
+        domain = specifier[7:].lower()
+        return PermissionRule(tool, 'domain', domain, pattern, domain)
+
+    if tool in PATH_TOOLS:
+        path = normalize_path_pattern(specifier, project_dir)
+        literal = re.split(r'[*?]', path, maxsplit=1)[0]
+        if literal == path:
+            # A plain path matches itself and everything below it
+            literal, open_ended = path.rstrip('/') + '/', True
+        else:
+            open_ended = path == literal + '**' and literal.endswith('/')
+        return PermissionRule(tool, 'path', _path_to_regex(path), pattern, literal, open_ended)
+
+    if specifier.find(':*') not in (-1, len(specifier) - 2):
+        raise PermissionPatternError("':*' is only allowed at the end of a pattern")
+    if specifier.endswith(':*'):
+        return PermissionRule(tool, 'prefix', specifier[:-2], pattern, specifier[:-2], True)
+    if specifier.endswith('*') and specifier.count('*') == 1:
+        # "git *" is a plain prefix match
+        return PermissionRule(tool, 'prefix', specifier[:-1], pattern, specifier[:-1], True)
+    if '*' in specifier:
+        literal = specifier.split('*', 1)[0]
+        return PermissionRule(tool, 'glob', _glob_to_regex(specifier), pattern, literal)
+    return PermissionRule(tool, 'exact', specifier, pattern, specifier)
+
+
+# Keys in prefix trie nodes (characters are one-character strings).
+_OPEN_RULE = None   # open-ended rule whose literal ends at this node
+_PATTERNS = 0       # wildcard rules whose literal prefix ends at this node
+
+
+class _ToolIndex:
+    """
+    All rules of one list (allow, ask or deny) for a single tool.
+
+    Exact arguments are a dict lookup. Every other rule is stored in a
+    prefix trie under its literal prefix: walking the argument through the
+    trie finds open-ended rules directly and only tries the wildcard
+    regexes whose literal prefix the argument actually starts with.
+    """
+
+    def __init__(self):
+        self.any = None
+        self.exact = {}
+        self.trie = {}
+        self.domains = {}
+        self.wildcard_domains = {}
+
+    def _node(self, literal: str) -> dict:
+        node = self.trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        return node
+
+    def add(self, rule: PermissionRule):
+        if rule.kind == 'any':
+            self.any = self.any or rule
+        elif rule.kind == 'exact':
+            self.exact.setdefault(rule.value, rule)
+        elif rule.kind == 'domain':
+            if rule.value.startswith('*.'):
+                self.wildcard_domains.setdefault(rule.value[2:], rule)
+            else:
+                self.domains.setdefault(rule.value, rule)
+        elif rule.open_ended:
+            self._node(rule.literal).setdefault(_OPEN_RULE, rule)
+            if rule.kind == 'path':
+                # A plain directory path also matches the directory itself
+                self.exact.setdefault(rule.literal.rstrip('/'), rule)
+        else:
+            self._node(rule.literal).setdefault(_PATTERNS, []).append((re.compile(rule.value, re.DOTALL), rule))
+
+    def match(self, argument: str) -> PermissionRule:
+        """First rule matching argument, or None."""
+        if self.any is not None:
+            return self.any
+        if argument is None:
+            return None
+
+        rule = self.exact.get(argument)
+        if rule is not None:
+            return rule
+
+        node = self.trie
+        position = 0
+        while node is not None:
+            rule = node.get(_OPEN_RULE)
+            if rule is not None:
+                return rule
+            for regex, rule in node.get(_PATTERNS, ()):
+                if regex.fullmatch(argument):
+                    return rule
+            if position == len(argument):
+                break
+            node = node.get(argument[position])
+            position += 1
+
+        if self.domains or self.wildcard_domains:
+            host = (urlsplit(argument).hostname if '://' in argument else argument.split('/')[0]) or ''
+            labels = host.lower().split('.')
+            rule = self.domains.get(host.lower())
+            if rule is not None:
+                return rule
+            for i in range(1, len(labels)):
+                rule = self.wildcard_domains.get('.'.join(labels[i:]))
+                if rule is not None:
+                    return rule
+        return None
+
+
+class CompiledPermissions:
+    """
+    Permission rules indexed by list and tool name.
+
+    Lookups go straight to the rules for the queried tool: a dict for exact
+    arguments and a prefix trie for prefix, wildcard and path patterns.
+    """
+
+    def __init__(self, project_dir: Path = None):
+        self.project_dir = project_dir
+        self.rules = {name: [] for name in PERMISSION_LISTS}
+        self.errors = []
+        self._index = {name: {} for name in PERMISSION_LISTS}
+
+    def add(self, list_name: str, pattern):
+        try:
+            rule = parse_pattern(pattern, self.project_dir)
+        except PermissionPatternError as e:
+            self.errors.append((list_name, pattern, str(e)))
+            return
+        self.rules[list_name].append(rule)
+        self._index[list_name].setdefault(rule.tool, _ToolIndex()).add(rule)
+
+    def _lookup(self, list_name: str, tool: str, argument: str) -> PermissionRule:
+        index = self._index[list_name]
+        candidates = [tool]
+        if tool.startswith('mcp__'):
+            # mcp__server matches every tool of that server
+            candidates.append('__'.join(tool.split('__')[:2]))
+        for name in candidates:
+            tool_index = index.get(name)
+            if tool_index is not None:
+                rule = tool_index.match(argument)
+                if rule is not None:
+                    return rule
+        return None
+
+    def check(self, tool: str, argument: str = None) -> tuple[str, PermissionRule]:
+        """
+        Decide a tool use.
+
+        Deny rules win over ask rules, which win over allow rules.
+
+        Returns:
+            (decision, rule) where decision is 'deny', 'ask' or 'allow' and
+            rule is the matching rule; ('ask', None) if nothing matches
+        """
+        if argument is not None and tool in PATH_TOOLS:
+            argument = normalize_path_argument(argument, self.project_dir)
+        for list_name in PERMISSION_LISTS:
+            rule = self._lookup(list_name, tool, argument)
+            if rule is not None:
+                return list_name, rule
+        return 'ask', None
+
+    def duplicates(self) -> list[tuple[str, str]]:
+        """(list name, pattern) for every rule repeated within its list."""
+        found = []
+        for list_name, rules in self.rules.items():
+            seen = set()
+            for rule in rules:
+                key = (rule.tool, rule.kind, rule.value)
+                if key in seen:
+                    found.append((list_name, rule.source))
+                seen.add(key)
+        return found
+
+    def shadowed(self) -> list[tuple[PermissionRule, PermissionRule]]:
+        """(allow rule, deny rule) pairs where the deny covers everything the allow matches."""
+        found = []
+        for allow in self.rules['allow']:
+            for deny in self.rules['deny']:
+                if _covers(deny, allow):
+                    found.append((allow, deny))
+                    break
+        return found
+
+
+def _covers(deny: PermissionRule, allow: PermissionRule) -> bool:
+    """True if deny matches every argument allow can match (conservatively)."""
+    same_tool = deny.tool == allow.tool or (
+        allow.tool.startswith('mcp__') and deny.tool == '__'.join(allow.tool.split('__')[:2])
+    )
+    if not same_tool:
+        return False
+    if deny.kind == 'any':
+        return True
+    if allow.kind == 'any':
+        return False
+    if (deny.kind, deny.value) == (allow.kind, allow.value):
+        return True
+    if allow.kind == 'exact':
+        index = _ToolIndex()
+        index.add(deny)
+        return index.match(allow.value) is not None
+    if allow.kind == 'domain':
+        return False
+    return deny.open_ended and allow.literal.startswith(deny.literal)
+
+
+def load_settings_permissions(settings_files: list[Path]) -> dict:
+    """Merge the permission lists of several settings files."""
+    merged = {name: [] for name in PERMISSION_LISTS}
+    for settings_file in settings_files:
+        if not settings_file.exists():
+            continue
+        with open(settings_file, 'r', encoding='utf-8') as f:
+            permissions = json.load(f).get('permissions', {})
+        for name in PERMISSION_LISTS:
+            merged[name].extend(permissions.get(name, []))
+    return merged
+
+
+def compile_permissions(permissions: dict, project_dir: Path = None) -> CompiledPermissions:
+    """Compile a settings.json "permissions" object."""
+    compiled = CompiledPermissions(project_dir)
+    for list_name in PERMISSION_LISTS:
+        entries = permissions.get(list_name, [])
+        if not isinstance(entries, list):
+            compiled.errors.append((list_name, entries, f"'{list_name}' must be a list"))
+            continue
+        for pattern in entries:
+            compiled.add(list_name, pattern)
+    return compiled
+
+
+def compile_project_permissions(project_dir: Path) -> CompiledPermissions:
+    """Compile the merged permissions of a project's settings.json and settings.local.json."""
+    project_dir = Path(project_dir).resolve()
+    claude_dir = project_dir / '.claude'
+    permissions = load_settings_permissions([claude_dir / 'settings.json', claude_dir / 'settings.local.json'])
+    return compile_permissions(permissions, project_dir)
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Query and lint Claude Code permission patterns',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 permissions.py check-permission Bash "npm run test" --project /path/to/project
+  python3 permissions.py check-permission Read ./src/app.py
+  python3 permissions.py lint --project /path/to/project
+        """
+    )
+
+    parser.add_argument(
+        '--project',
+        default='.',
+        help='Project whose .claude/settings.json (and settings.local.json) to load (default: .)'
+    )
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    check_parser = subparsers.add_parser('check-permission', help='Decide whether a tool use is allowed')
+    check_parser.add_argument('tool', help='Tool name, e.g. Bash, Read, mcp__github__create_issue')
+    check_parser.add_argument('argument', nargs='?', help='Command, path or URL passed to the tool')
+
+    subparsers.add_parser('lint', help='Report malformed, duplicate and shadowed patterns')
+
+    args = parser.parse_args(argv)
+
+    try:
+        compiled = compile_project_permissions(Path(args.project))
+    except (OSError, ValueError) as e:
+        print(f"Error loading settings: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command == 'check-permission':
+        started = time.perf_counter()
+        decision, rule = compiled.check(args.tool, args.argument)
+        elapsed_us = (time.perf_counter() - started) * 1_000_000
+        matched = f" (matched {rule.source!r})" if rule else " (no matching rule)"
+        print(f"{decision}{matched} in {elapsed_us:.1f} µs")
+        sys.exit(0 if decision == 'allow' else 1)
+
+    problems = 0
+    for list_name, pattern, reason in compiled.errors:
+        print(f"  ✗ {list_name}: {pattern!r}: {reason}")
+        problems += 1
+    for list_name, pattern in compiled.duplicates():
+        print(f"  ⚠ {list_name}: {pattern!r} is listed more than once")
+        problems += 1
+    for allow, deny in compiled.shadowed():
+        print(f"  ⚠ allow: {allow.source!r} can never apply, it is shadowed by deny {deny.source!r}")
+        problems += 1
+    if not problems:
+        print("✓ No problems found")
+    sys.exit(1 if compiled.errors else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+MCP Registry Fetcher
+
+Fetches MCP server listings from registry sources. Sources are fetched
+concurrently on a thread pool, connections are kept alive and reused per
+host, and every response is kept in an on-disk cache so that later runs
+send conditional requests (If-None-Match / If-Modified-Since) and an
+unchanged source costs a 304.
+Uses only Python standard library.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import tracing
+
+
+META_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = ['https://registry.modelcontextprotocol.io/v0/servers']
+DEFAULT_HTTP_CACHE_DIR = META_PROJECT_ROOT / '.cache' / 'registry-http'
+USER_AGENT = 'Claude-Code-Meta/1.0'
+MAX_REDIRECTS = 5
+MAX_PAGES = 100
+
+# Registry package types and the command that runs them
+PACKAGE_RUNNERS = {
+    'npm': ('npx', ['-y']),
+    'pypi': ('uvx', []),
+    'oci': ('docker', ['run', '-i', '--rm']),
+}
+
+REMOTE_TRANSPORTS = {
+    'streamable-http': 'http',
+    'http': 'http',
+    'sse': 'sse',
+}
+
+
+class HttpCache:
+    """
+    On-disk cache of HTTP responses, one JSON file per URL.
+
+    Each entry holds the body together with the ETag and Last-Modified
+    validators needed to revalidate it.
+    """
+
+    def __init__(self, cache_dir: Path = None):
+        self.cache_dir = Path(cache_dir or DEFAULT_HTTP_CACHE_DIR)
+
+    def _entry_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> dict:
+        """Cached entry for url ({"url", "etag", "last_modified", "body"}), or None."""
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def put(self, url: str, body: str, etag: str = None, last_modified: str = None):
+        """Store a response; responses without validators are not cached."""
+        if not etag and not last_modified:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {'url': url, 'etag': etag, 'last_modified': last_modified, 'body': body}
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, self._entry_path(url))
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+
+class FetchStats:
+    """Thread-safe counts of how fetches were answered."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.not_modified = 0
+        self.failed = 0
+        self.failed_sources = []
+
+    def count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def summary(self) -> str:
+        return f"{self.fetched} fetched, {self.not_modified} not modified (304), {self.failed} failed"
+
+
+# Keep-alive connections, one per (scheme, host) per thread
+_connections = threading.local()
+
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    pool = getattr(_connections, 'pool', None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(netloc, timeout=timeout)
+        elif scheme == 'http':
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        else:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        pool[(scheme, netloc)] = conn
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str):
+    conn = getattr(_connections, 'pool', {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _request(url: str, headers: dict, timeout: float) -> tuple[int, dict, bytes, str]:
+    """
+    GET url over a pooled connection, following redirects.
+
+    A connection the server closed while idle is reopened once.
+
+    Returns:
+        (status, lowercased headers, body, final url) tuple
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        target = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        for attempt in range(2):
+            conn = _connection(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request('GET', target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _drop_connection(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+            except Exception:
+                _drop_connection(parts.scheme, parts.netloc)
+                raise
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+        if response.status in (301, 302, 303, 307, 308) and 'location' in response_headers:
+            url = urljoin(url, response_headers['location'])
+            continue
+        return response.status, response_headers, body, url
+    raise ValueError(f"Too many redirects fetching {url}")
+
+
+def fetch_url(url: str, timeout: int = 10, cache: HttpCache = None, stats: FetchStats = None) -> str:
+    """
+    Fetch content from a URL.
+
+    With a cache, a previously seen URL is revalidated with a conditional
+    request and the cached body is returned on 304 Not Modified.
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        cache: Optional HttpCache
+        stats: Optional FetchStats to count the outcome in
+
+    Returns:
+        Content as string, or None if failed
+    """
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'identity'}
+    cached = cache.get(url) if cache else None
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    with tracing.span('fetch_url', 'http', url=url) as span:
+        try:
+            status, response_headers, body, _final_url = _request(url, headers, timeout)
+            span.set(status=status, bytes=len(body))
+            if status == 304 and cached:
+                if stats:
+                    stats.count('not_modified')
+                return cached['body']
+            if status != 200:
+                raise ValueError(f"HTTP {status}")
+            text = body.decode('utf-8')
+        except Exception as e:
+            print(f"Error fetching {url}: {e}", file=sys.stderr)
+            if stats:
+                stats.count('failed')
+            return None
+
+        if cache:
+            cache.put(url, text, response_headers.get('etag'), response_headers.get('last-modified'))
+        if stats:
+            stats.count('fetched')
+        return text
+
+
+def _page_url(url: str, cursor: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != 'cursor'] + [('cursor', cursor)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def _server_entry(item: dict) -> dict:
+    """Convert one registry server object to a registry server dict."""
+    server = item.get('server', item)
+    name = server.get('name')
+    if not name:
+        return None
+
+    entry = {'name': name, 'purpose': server.get('description') or 'N/A'}
+    repository = server.get('repository') or {}
+    docs = server.get('websiteUrl') or server.get('website_url') or repository.get('url')
+    if docs:
+        entry['docs'] = docs
+
+    for remote in server.get('remotes') or []:
+        transport = REMOTE_TRANSPORTS.get(remote.get('type') or remote.get('transport_type'))
+        if transport and remote.get('url'):
+            entry['transport'] = transport
+            entry['config'] = {'type': transport, 'url': remote['url']}
+            return entry
+
+    for package in server.get('packages') or []:
+        registry_type = package.get('registryType') or package.get('registry_name')
+        identifier = package.get('identifier') or package.get('name')
+        if registry_type not in PACKAGE_RUNNERS or not identifier:
+            continue
+        command, args = PACKAGE_RUNNERS[registry_type]
+        args = args + [identifier]
+        entry['transport'] = 'stdio'
+        entry['install'] = ' '.join([command] + args)
+        entry['config'] = {'type': 'stdio', 'command': command, 'args': args}
+        return entry
+
+    return entry
+
+
+def parse_registry_json(text: str) -> tuple[list[dict], str]:
+    """
+    Parse one page of an MCP registry server listing.
+
+    Accepts the registry's {"servers": [...], "metadata": {"nextCursor"}}
+    pages (entries either bare or wrapped as {"server": {...}}) as well as a
+    plain list of servers.
+
+    Returns:
+        (servers, next cursor or None) tuple
+
+    Raises:
+        ValueError: if the text is not a server listing
+    """
+    data = json.loads(text)
+    if isinstance(data, list):
+        items, metadata = data, {}
+    elif isinstance(data, dict) and isinstance(data.get('servers'), list):
+        items, metadata = data['servers'], data.get('metadata') or {}
+    else:
+        raise ValueError("expected a list of servers or an object with 'servers'")
+
+    servers = [s for s in (_server_entry(item) for item in items if isinstance(item, dict)) if s]
+    cursor = metadata.get('nextCursor') or metadata.get('next_cursor')
+    return servers, cursor
+
+
+def fetch_source(url: str, timeout: int = 10, cache: HttpCache = None, stats: FetchStats = None) -> list[dict]:
+    """
+    Fetch every page of one registry source.
+
+    Returns:
+        Servers of the source, or None if it could not be fetched or parsed
+    """
+    servers = []
+    page_url = url
+    for _ in range(MAX_PAGES):
+        text = fetch_url(page_url, timeout, cache, stats)
+        if text is None:
+            return None
+        try:
+            page, cursor = parse_registry_json(text)
+        except ValueError as e:
+            print(f"Error parsing {page_url}: {e}", file=sys.stderr)
+            return None
+        servers.extend(page)
+        if not cursor:
+            break
+        page_url = _page_url(url, cursor)
+    return servers
+
+
+def fetch_sources(
+    sources: list[str],
+    workers: int = 8,
+    timeout: int = 10,
+    cache_dir: Path = None,
+    use_cache: bool = True
+) -> tuple[list[dict], FetchStats]:
+    """
+    Fetch several registry sources concurrently.
+
+    Servers listed by more than one source are kept from the first source
+    that lists them. Sources that could not be fetched are listed in
+    stats.failed_sources.
+
+    Returns:
+        (servers, stats) tuple
+    """
+    cache = HttpCache(cache_dir) if use_cache else None
+    stats = FetchStats()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sources) or 1))) as pool:
+        results = list(pool.map(lambda url: fetch_source(url, timeout, cache, stats), sources))
+
+    merged = {}
+    for url, servers in zip(sources, results):
+        if servers is None:
+            stats.failed_sources.append(url)
+        for server in servers or []:
+            merged.setdefault(server['name'], server)
+    return list(merged.values()), stats
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Fetch MCP servers from registry sources and print them as JSON'
+    )
+
+    parser.add_argument(
+        '--source',
+        action='append',
+        help=f'Registry URL to fetch (repeatable, default: {DEFAULT_SOURCES[0]})'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Sources fetched concurrently (default: 8)'
+    )
+
+    parser.add_argument(
+        '--no-http-cache',
+        action='store_true',
+        help='Do not use or update the on-disk response cache'
+    )
+
+    args = parser.parse_args(argv)
+
+    servers, stats = fetch_sources(args.source or DEFAULT_SOURCES, args.workers, use_cache=not args.no_http_cache)
+    print(json.dumps(servers, indent=2))
+    print(stats.summary(), file=sys.stderr)
+    sys.exit(0 if not stats.failed else 1)
+
+
+if __name__ == '__main__':
+    main()
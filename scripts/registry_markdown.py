@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Markdown Registry Parser
+
+Reads MCP servers back out of Markdown: both the registry that
+registry_store renders (## Category / ### name) and the hand-written
+docs/mcp-server-guide.md (### Category / #### name). The file is read in
+a single pass, line by line, with plain string operations only, so the
+cost is linear in its size.
+Uses only Python standard library.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Iterable
+
+
+# Field labels whose key is not simply the label in snake_case
+FIELD_KEYS = {
+    'install': 'install',
+    'installation': 'install',
+    'config': 'config',
+    'configuration': 'config',
+}
+
+
+def field_key(label: str) -> str:
+    """Server dict key of a "- **Label**:" field: "Use cases" -> "use_cases"."""
+    key = label.strip().lower().replace(' ', '_')
+    return FIELD_KEYS.get(key, key)
+
+
+def field_label(key: str) -> str:
+    """Label a server dict key is rendered with: "use_cases" -> "Use cases"."""
+    return key.replace('_', ' ').capitalize()
+
+
+def format_value(value: str) -> str:
+    """
+    Inline form of a field value that parses back to exactly value.
+
+    A value plain Markdown would not keep intact (several lines,
+    surrounding whitespace or a leading quote) is written as a JSON string.
+    """
+    if not isinstance(value, str):
+        return str(value)
+    if '\n' in value or '\r' in value or value != value.strip() or value.startswith('"'):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _inline_value(value: str) -> str:
+    """Inverse of format_value: unquote a JSON string value."""
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            return value
+        if isinstance(decoded, str):
+            return decoded
+    return value
+
+
+def _heading(line: str) -> tuple[int, str]:
+    """(level, text) of an ATX heading line, or (0, None)."""
+    level = len(line) - len(line.lstrip('#'))
+    if 0 < level <= 6 and line[level:level + 1] == ' ':
+        return level, line[level + 1:].strip()
+    return 0, None
+
+
+def _field(line: str) -> tuple[str, str]:
+    """(label, value) of a "- **Label**: value" line, or (None, None)."""
+    if not line.startswith('- **'):
+        return None, None
+    end = line.find('**:', 4)
+    if end == -1:
+        return None, None
+    return line[4:end], line[end + 3:].strip()
+
+
+def _code_value(key: str, lines: list[str]):
+    """Value of a field given as a fenced code block."""
+    if key == 'config':
+        try:
+            return json.loads('\n'.join(lines))
+        except ValueError:
+            return None
+    # Shell commands: fold backslash line continuations into one line
+    return ' '.join(line.strip().rstrip('\\').strip() for line in lines if line.strip())
+
+
+def parse_registry_markdown(lines: Iterable[str]) -> list[dict]:
+    """
+    Parse servers out of Markdown registry lines.
+
+    A server is a heading followed by "- **Field**: value" lines that
+    include a Purpose (possibly empty); its category is the nearest
+    enclosing heading (below the document title), or "Other". A field with
+    no inline value takes the fenced code block that follows it (a JSON
+    config or shell install command), or is empty if none follows; an
+    inline `code` install command is unwrapped and a JSON string value
+    (see format_value) is decoded. Fenced blocks elsewhere are skipped, so
+    commented shell lines are never mistaken for headings.
+
+    For any server with a name, category, purpose and transport (lower
+    case) whose other fields are strings or a JSON config,
+    parse_registry_markdown(render_markdown_body([server])) == [server].
+
+    Args:
+        lines: Lines of the Markdown file, with or without line endings
+
+    Returns:
+        Server dicts in document order
+    """
+    servers = []
+    headings = {}  # level -> text of the current heading at that level
+    server = None
+    server_level = 0
+    pending_key = None  # field waiting for its fenced block
+    fence = None  # (indent, collected lines, key or None) while inside a fence
+
+    def finish():
+        if server is not None and 'purpose' in server:
+            servers.append(server)
+
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        stripped = line.lstrip()
+
+        if fence is not None:
+            indent, block, key = fence
+            if stripped.startswith('```'):
+                if key is not None and server is not None:
+                    value = _code_value(key, block)
+                    if value is not None:
+                        server[key] = value
+                    elif server.get(key) == '':
+                        del server[key]
+                fence = None
+            else:
+                block.append(line[indent:] if line[:indent].isspace() else line.lstrip())
+            continue
+
+        if stripped.startswith('```'):
+            fence = (len(line) - len(stripped), [], pending_key)
+            pending_key = None
+            continue
+
+        level, text = _heading(line)
+        if level:
+            finish()
+            headings[level] = text
+            for deeper in [lvl for lvl in headings if lvl > level]:
+                del headings[deeper]
+            server, server_level, pending_key = None, level, None
+            continue
+
+        label, value = _field(line)
+        if label is None:
+            if stripped and not stripped.startswith('---'):
+                pending_key = None
+            continue
+
+        if server is None:
+            if not server_level:
+                continue
+            parents = [lvl for lvl in headings if 1 < lvl < server_level]
+            server = {
+                'name': headings[server_level],
+                'category': headings[max(parents)] if parents else 'Other',
+            }
+
+        key = field_key(label)
+        pending_key = None
+        if not value:
+            pending_key = key
+            server[key] = ''
+        elif len(value) > 1 and value[0] == '"' and value[-1] == '"':
+            server[key] = _inline_value(value)
+        elif key == 'transport':
+            server[key] = value.lower()
+        elif len(value) > 1 and value[0] == '`' and value[-1] == '`' and key == 'install':
+            server[key] = value[1:-1]
+        else:
+            server[key] = value
+
+    finish()
+    return servers
+
+
+def load_registry_markdown(path: Path) -> list[dict]:
+    """Parse the servers of a Markdown registry file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_registry_markdown(f)
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Print the MCP servers described in Markdown files as JSON'
+    )
+
+    parser.add_argument(
+        'files',
+        nargs='+',
+        help='Markdown registry files (e.g. mcp_servers.md, docs/mcp-server-guide.md)'
+    )
+
+    args = parser.parse_args(argv)
+
+    servers = []
+    for file in args.files:
+        try:
+            servers.extend(load_registry_markdown(Path(file)))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error reading {file}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    print(json.dumps(servers, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+MCP Registry Store
+
+The canonical MCP server registry, kept in SQLite with indexes on server
+name and category. Fetched servers are merged in with upserts, and the
+Markdown registry is a view rendered from the store, rewritten only when
+its content changes. The store also keeps the inverted index used by
+search_registry.py, updated together with every server it changes.
+Uses only Python standard library.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from registry_markdown import field_key, field_label, format_value, load_registry_markdown, parse_registry_markdown
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS servers (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL,
+    custom INTEGER NOT NULL DEFAULT 0,
+    source TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS servers_category ON servers (category, name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_docs (
+    name TEXT PRIMARY KEY,
+    length REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS search_postings (
+    term TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tf REAL NOT NULL,
+    length REAL NOT NULL,
+    PRIMARY KEY (term, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS search_postings_name ON search_postings (name);
+"""
+
+# Searchable fields and how much a term occurrence in each counts
+SEARCH_FIELDS = {
+    'name': 3.0,
+    'category': 2.0,
+    'purpose': 1.0,
+    'use_cases': 1.0,
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset(
+    'a an and are as at be by for from in into is it of on or the to with mcp server servers'.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into search terms.
+
+    Lowercases, splits on anything that is not a letter or digit, drops
+    stopwords and strips a plural "s" so "databases" matches "database".
+    """
+    terms = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def _search_terms(server: dict) -> tuple[dict, float]:
+    """Weighted term frequencies and weighted length of a server."""
+    frequencies = {}
+    length = 0.0
+    for field, weight in SEARCH_FIELDS.items():
+        value = server.get(field, 'Other' if field == 'category' else '')
+        for term in tokenize(str(value)):
+            frequencies[term] = frequencies.get(term, 0.0) + weight
+            length += weight
+    return frequencies, length
+
+
+DEFAULT_REGISTRY_PATH = (
+    Path(__file__).resolve().parent.parent / '.claude' / 'skills' / 'project-creator' / 'references' / 'mcp_servers.md'
+)
+
+
+def default_store_path(registry_path: Path) -> Path:
+    """The store kept next to a Markdown registry: mcp_servers.md -> mcp_servers.db."""
+    return Path(registry_path).with_suffix('.db')
+
+
+def _server_data(server: dict) -> str:
+    return json.dumps(server, separators=(',', ':'))
+
+
+class RegistryStore:
+    """
+    A registry database.
+
+    Servers are stored as JSON documents keyed by name. Servers marked
+    "custom" are local customizations and are never replaced by fetched
+    data.
+
+    A read-only store opens an existing database without writing to it, so
+    it never waits on the write lock a refresh holds.
+    """
+
+    def __init__(self, path: Path, read_only: bool = False):
+        self.path = Path(path)
+        self.read_only = read_only
+        if read_only:
+            self.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM servers').fetchone()[0]
+
+    def get(self, name: str) -> dict:
+        """A server by name, or None."""
+        row = self.conn.execute('SELECT data FROM servers WHERE name = ?', (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def servers(self, category: str = None) -> list[dict]:
+        """All servers (or those of one category), ordered by category and name."""
+        if category is None:
+            rows = self.conn.execute('SELECT data FROM servers ORDER BY category, name')
+        else:
+            rows = self.conn.execute('SELECT data FROM servers WHERE category = ? ORDER BY name', (category,))
+        return [json.loads(data) for (data,) in rows]
+
+    def categories(self) -> list[str]:
+        return [c for (c,) in self.conn.execute('SELECT DISTINCT category FROM servers ORDER BY category')]
+
+    def upsert(self, servers: list[dict], source: str = None) -> dict:
+        """
+        Insert new servers and update changed ones in one transaction.
+
+        A stored server marked "custom" is kept as-is; otherwise it is
+        replaced when the incoming data differs.
+
+        Args:
+            servers: Server dicts, each with a "name"
+            source: Where the servers came from, recorded with each row
+
+        Returns:
+            {"inserted", "updated", "unchanged", "kept_custom"} counts
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'kept_custom': 0}
+        rows = []
+        stored = self._stored([server['name'] for server in servers])
+        with self.conn:
+            for server in servers:
+                data = _server_data(server)
+                existing = stored.get(server['name'])
+                if existing is None:
+                    counts['inserted'] += 1
+                elif existing[1]:
+                    counts['kept_custom'] += 1
+                    continue
+                elif existing[0] == data:
+                    counts['unchanged'] += 1
+                    continue
+                else:
+                    counts['updated'] += 1
+                rows.append(server)
+            self._write(rows, source)
+        return counts
+
+    def import_local(self, servers: list[dict], source: str = 'markdown') -> dict:
+        """
+        Merge servers read back from the Markdown registry.
+
+        New servers are inserted. For a stored server, the parsed entry is
+        compared field by field with the stored server as it reads back from
+        its own rendered entry: only fields that differ were edited by hand.
+        Those edits (including removed fields) are applied on top of the
+        stored data and the server is marked "custom", so fetched data no
+        longer replaces it. Fields the Markdown cannot represent exactly
+        keep their stored values.
+
+        Returns:
+            {"inserted", "customized", "unchanged"} counts
+        """
+        counts = {'inserted': 0, 'customized': 0, 'unchanged': 0}
+        stored = self._stored([server['name'] for server in servers])
+        rows = []
+        with self.conn:
+            for server in servers:
+                existing = stored.get(server['name'])
+                if existing is None:
+                    counts['inserted'] += 1
+                    rows.append(server)
+                    continue
+                current = json.loads(existing[0])
+                round_trip = parse_registry_markdown(render_markdown_body([current]).splitlines())
+                baseline = round_trip[0] if round_trip else {}
+                changed = {key: value for key, value in server.items() if baseline.get(key) != value}
+                removed = [key for key in baseline if key not in server]
+                if not changed and not removed:
+                    counts['unchanged'] += 1
+                    continue
+                counts['customized'] += 1
+                edited = {key: value for key, value in current.items() if key not in removed}
+                edited.update(changed, custom=True)
+                rows.append(edited)
+            self._write(rows, source)
+        return counts
+
+    def _write(self, servers: list[dict], source: str):
+        """Insert or replace servers and their search index entries (inside a transaction)."""
+        now = time.time()
+        self.conn.executemany(
+            'INSERT INTO servers (name, category, data, custom, source, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET category = excluded.category, data = excluded.data, '
+            'custom = excluded.custom, source = excluded.source, updated_at = excluded.updated_at',
+            [
+                (server['name'], server.get('category', 'Other'), _server_data(server),
+                 1 if server.get('custom') else 0, source, now)
+                for server in servers
+            ]
+        )
+        self._index(servers)
+
+    def _stored(self, names: list[str]) -> dict:
+        """Stored (data, custom) of the given servers that exist, by name."""
+        stored = {}
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT name, data, custom FROM servers WHERE name IN ({','.join('?' * len(chunk))})", chunk
+            )
+            stored.update((name, (data, custom)) for name, data, custom in rows)
+        return stored
+
+    def remove(self, names: list[str]) -> int:
+        """Delete servers by name; returns how many were removed."""
+        params = [(n,) for n in names]
+        with self.conn:
+            cursor = self.conn.executemany('DELETE FROM servers WHERE name = ?', params)
+            removed = cursor.rowcount
+            self.conn.executemany('DELETE FROM search_postings WHERE name = ?', params)
+            self.conn.executemany('DELETE FROM search_docs WHERE name = ?', params)
+        return removed
+
+    def _index(self, servers: list[dict]):
+        """Replace the search index entries of servers (inside a transaction)."""
+        postings = []
+        docs = []
+        for server in servers:
+            frequencies, length = _search_terms(server)
+            docs.append((server['name'], length))
+            # The document length is repeated in its postings so queries need no join
+            postings.extend((term, server['name'], tf, length) for term, tf in frequencies.items())
+        self.conn.executemany('DELETE FROM search_postings WHERE name = ?', [(d[0],) for d in docs])
+        self.conn.executemany(
+            'INSERT INTO search_docs (name, length) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET length = excluded.length',
+            docs
+        )
+        self.conn.executemany('INSERT INTO search_postings (term, name, tf, length) VALUES (?, ?, ?, ?)', postings)
+
+    def search_index_complete(self) -> bool:
+        """Whether the search index covers every server."""
+        return self.conn.execute('SELECT COUNT(*) FROM search_docs').fetchone()[0] == self.count()
+
+    def ensure_search_index(self) -> bool:
+        """
+        Rebuild the search index if it does not cover every server.
+
+        Only needed for stores written before the index existed.
+
+        Returns:
+            True if the index was rebuilt
+        """
+        if self.search_index_complete():
+            return False
+        with self.conn:
+            self.conn.execute('DELETE FROM search_postings')
+            self.conn.execute('DELETE FROM search_docs')
+            self._index(self.servers())
+        return True
+
+    def get_meta(self, key: str, default: str = None) -> str:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO meta (key, value) VALUES (?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                (key, value)
+            )
+
+    def write_markdown(self, registry_path: Path, force: bool = False) -> bool:
+        """
+        Render the store to a Markdown registry.
+
+        The file is only rewritten when the rendered servers differ from
+        what was last written (or the file is missing).
+
+        Returns:
+            True if the file was written, False if it was already current
+        """
+        registry_path = Path(registry_path)
+        body = render_markdown_body(self.servers())
+        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        key = f"markdown_hash:{registry_path.resolve()}"
+
+        if not force and registry_path.exists() and self.get_meta(key) == body_hash:
+            return False
+
+        _write_text_atomic(registry_path, registry_header() + body)
+        self.set_meta(key, body_hash)
+        self.set_meta(f"markdown_stat:{registry_path.resolve()}", _stat_signature(registry_path))
+        return True
+
+    def sync_markdown(self, registry_path: Path) -> dict:
+        """
+        Read a Markdown registry back into the store if it was edited.
+
+        Only local file I/O; safe to call on every read.
+
+        Returns:
+            import_local counts, or None if the file needed no import
+        """
+        registry_path = Path(registry_path)
+        if not self.markdown_edited(registry_path):
+            return None
+        counts = self.import_local(load_registry_markdown(registry_path))
+        self.set_meta(f"markdown_stat:{registry_path.resolve()}", _stat_signature(registry_path))
+        return counts
+
+    def markdown_edited(self, registry_path: Path) -> bool:
+        """
+        Whether a Markdown registry exists and was not last written by this store.
+
+        That is the case for hand edits and for a registry that predates
+        the store; either way it should be read back with import_local.
+        """
+        registry_path = Path(registry_path)
+        if not registry_path.exists():
+            return False
+        return self.get_meta(f"markdown_stat:{registry_path.resolve()}") != _stat_signature(registry_path)
+
+
+def _stat_signature(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+# Fields with a fixed place in the rendered entry
+RENDERED_FIELDS = frozenset(['name', 'category', 'purpose', 'transport', 'install', 'config', 'use_cases', 'docs', 'custom'])
+
+
+def registry_header(updated: datetime = None) -> str:
+    updated = updated or datetime.now()
+    return (
+        "# MCP Server Registry\n\n"
+        f"Last updated: {updated.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        "Curated registry of MCP servers organized by category.\n\n"
+    )
+
+
+def render_markdown_body(servers: list[dict]) -> str:
+    """
+    Render servers as the category sections of the Markdown registry.
+
+    Servers are grouped by category (default "Other"); categories and the
+    servers within them are sorted by name. Text fields beyond the standard
+    ones (e.g. "required") are rendered after them, so registry_markdown
+    reads them back.
+    """
+    categories = {}
+    for server in servers:
+        categories.setdefault(server.get('category', 'Other'), []).append(server)
+
+    parts = []
+    add = parts.append
+    for category in sorted(categories):
+        add(f"## {category}\n\n")
+        for server in sorted(categories[category], key=lambda s: s['name']):
+            add(f"### {server['name']}\n\n")
+            add(f"- **Purpose**: {format_value(server.get('purpose', 'N/A'))}\n")
+            add(f"- **Transport**: {server.get('transport', 'stdio')}\n")
+
+            if 'install' in server:
+                install = format_value(server['install'])
+                add(f"- **Install**: {install if install != server['install'] else f'`{install}`'}\n")
+
+            if 'config' in server:
+                add(f"- **Config**:\n```json\n{json.dumps(server['config'], indent=2)}\n```\n")
+
+            if 'use_cases' in server:
+                add(f"- **Use cases**: {format_value(server['use_cases'])}\n")
+
+            if 'docs' in server:
+                add(f"- **Docs**: {format_value(server['docs'])}\n")
+
+            for key, value in server.items():
+                if key not in RENDERED_FIELDS and isinstance(value, str) and field_key(field_label(key)) == key:
+                    add(f"- **{field_label(key)}**: {format_value(value)}\n")
+
+            add("\n")
+
+    return ''.join(parts)
+
+
+def _write_text_atomic(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Inspect and edit the MCP server registry store'
+    )
+
+    parser.add_argument(
+        '--store',
+        required=True,
+        help='Path to the registry database'
+    )
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='Print servers as JSON')
+    list_parser.add_argument('--category', help='Only servers of this category')
+
+    import_parser = subparsers.add_parser('import', help='Upsert servers from a JSON list or a Markdown registry')
+    import_parser.add_argument('file', help='JSON file with a list of server objects, or a .md registry')
+    import_parser.add_argument('--custom', action='store_true', help='Mark servers as local customizations')
+
+    render_parser = subparsers.add_parser('render', help='Render the store to a Markdown registry')
+    render_parser.add_argument('registry', help='Markdown file to write')
+    render_parser.add_argument('--force', action='store_true', help='Write even if unchanged')
+
+    args = parser.parse_args(argv)
+
+    with RegistryStore(Path(args.store)) as store:
+        if args.command == 'list':
+            print(json.dumps(store.servers(args.category), indent=2))
+        elif args.command == 'import':
+            try:
+                if args.file.endswith('.md'):
+                    servers = load_registry_markdown(Path(args.file))
+                else:
+                    with open(args.file, 'r', encoding='utf-8') as f:
+                        servers = json.load(f)
+                if not isinstance(servers, list) or not all(isinstance(s, dict) and s.get('name') for s in servers):
+                    raise ValueError("expected a list of objects with a 'name'")
+            except (OSError, ValueError) as e:
+                print(f"Error reading {args.file}: {e}", file=sys.stderr)
+                sys.exit(1)
+            if args.custom:
+                servers = [dict(s, custom=True) for s in servers]
+            if args.file.endswith('.md') and not args.custom:
+                counts = store.import_local(servers, source=args.file)
+            else:
+                counts = store.upsert(servers, source=args.file)
+            print(', '.join(f"{n} {k.replace('_', ' ')}" for k, n in counts.items()))
+        elif args.command == 'render':
+            if store.write_markdown(Path(args.registry), force=args.force):
+                print(f"✓ Rendered {store.count()} server(s) to {args.registry}")
+            else:
+                print(f"{args.registry} is already current")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+MCP Registry Search
+
+Ranks the servers in the registry store against a free-text query with
+BM25 over their name, purpose, use cases and category. The inverted index
+is kept in the store and updated whenever update_registry changes a
+server, so a query only reads the postings of its own terms.
+Uses only Python standard library.
+"""
+
+import heapq
+import json
+import math
+import sys
+from pathlib import Path
+
+from registry_store import RegistryStore, tokenize
+from update_registry import open_registry
+
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def search(store: RegistryStore, query: str, k: int = 10, category: str = None) -> list[tuple[float, dict]]:
+    """
+    Find the servers that best match a query.
+
+    Args:
+        store: Registry store to search
+        query: Free-text query
+        k: Number of results
+        category: Only return servers of this category
+
+    Returns:
+        Up to k (score, server) tuples, best match first
+    """
+    terms = sorted(set(tokenize(query)))
+    if not terms:
+        return []
+
+    doc_count, total_length = store.conn.execute(
+        'SELECT COUNT(*), TOTAL(length) FROM search_docs'
+    ).fetchone()
+    if not doc_count:
+        return []
+    average_length = total_length / doc_count or 1.0
+
+    placeholders = ','.join('?' * len(terms))
+    rows = store.conn.execute(
+        f'SELECT term, name, tf, length FROM search_postings WHERE term IN ({placeholders})',
+        terms
+    ).fetchall()
+
+    document_frequency = {}
+    for term, _name, _tf, _length in rows:
+        document_frequency[term] = document_frequency.get(term, 0) + 1
+    idf = {
+        term: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+
+    scores = {}
+    for term, name, tf, length in rows:
+        norm = K1 * (1 - B + B * length / average_length)
+        scores[name] = scores.get(name, 0.0) + idf[term] * tf * (K1 + 1) / (tf + norm)
+
+    if category is not None:
+        allowed = {
+            name for (name,) in store.conn.execute('SELECT name FROM servers WHERE category = ?', (category,))
+        }
+        scores = {name: score for name, score in scores.items() if name in allowed}
+
+    best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], item[0]))
+    return [(score, store.get(name)) for name, score in best]
+
+
+def main(argv: list[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Search the MCP server registry'
+    )
+
+    parser.add_argument(
+        'query',
+        nargs='+',
+        help='What the server should do, e.g. "postgres database queries"'
+    )
+
+    parser.add_argument(
+        '--registry',
+        help='Path to the registry markdown file (default: auto-detect)'
+    )
+
+    parser.add_argument(
+        '--store',
+        help='Path to the registry database (default: next to the registry markdown file)'
+    )
+
+    parser.add_argument(
+        '--no-refresh',
+        action='store_true',
+        help='Do not start a background refresh when the registry is due'
+    )
+
+    parser.add_argument(
+        '-k', '--top',
+        type=int,
+        default=10,
+        help='Number of results (default: 10)'
+    )
+
+    parser.add_argument(
+        '--category',
+        help='Only return servers of this category'
+    )
+
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print results as JSON'
+    )
+
+    args = parser.parse_args(argv)
+
+    # Searches the current snapshot; a due refresh runs in the background
+    with open_registry(
+        Path(args.registry) if args.registry else None,
+        Path(args.store) if args.store else None,
+        refresh=not args.no_refresh
+    ) as store:
+        if not store.count():
+            print("Registry is empty; run update_registry.py (a background refresh may already be running).", file=sys.stderr)
+            sys.exit(1)
+        results = search(store, ' '.join(args.query), args.top, args.category)
+
+    if args.json:
+        print(json.dumps([dict(server, score=round(score, 4)) for score, server in results], indent=2))
+    elif not results:
+        print("No matching servers.")
+    else:
+        for rank, (score, server) in enumerate(results, 1):
+            print(f"{rank}. {server['name']} ({server.get('category', 'Other')}, score {score:.2f})")
+            print(f"   {server.get('purpose', 'N/A')}")
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
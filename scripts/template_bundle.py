@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Template Bundle Compiler
+
+Packs a template directory into a single indexed bundle file: a JSON
+manifest (path, mode, binary flag and placeholder byte offsets for every
+file) followed by one data blob. Bundles are keyed by a hash of the
+template content and only rebuilt when the template changes, so
+scaffolding reads one file instead of walking and re-parsing the template.
+
+A template may extend another by naming it in a template.json
+({"extends": "base"}). The layers are merged when the bundle is compiled:
+a file in a later layer replaces the same file of its parent, except for
+APPEND_FILES, which keep the parent's lines and add the child's. The
+bundle holds the resolved tree and is keyed by a hash of the whole layer
+chain, so a deep template scaffolds as fast as a flat one.
+Uses only Python standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+
+import tracing
+from template_engine import PLACEHOLDER_PATTERN
+
+
+BUNDLE_MAGIC = b'CCMBNDL1'
+BUNDLE_HEADER = struct.Struct('>8sQ')  # magic, manifest length
+
+META_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATES_DIR = META_PROJECT_ROOT / 'templates'
+DEFAULT_CACHE_DIR = META_PROJECT_ROOT / '.cache' / 'templates'
+
+PLACEHOLDER_BYTES_PATTERN = re.compile(PLACEHOLDER_PATTERN.pattern.encode('ascii'))
+
+# Per-template settings file; not part of the rendered tree
+TEMPLATE_CONFIG = 'template.json'
+
+# Destination file names merged across layers by appending the child's
+# content to the parent's instead of replacing it
+APPEND_FILES = {'.gitignore'}
+
+# Longest extends chain; deeper chains are almost certainly a mistake
+MAX_LAYERS = 16
+
+
+class TemplateBundle:
+    """
+    A compiled template opened for reading.
+
+    The bundle file is memory-mapped; file contents are served as slices of
+    the mapping without copying the blob into Python objects.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            header = self._file.read(BUNDLE_HEADER.size)
+            magic, manifest_length = BUNDLE_HEADER.unpack(header)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError(f"Not a template bundle: {self.path}")
+            self.manifest = json.loads(self._file.read(manifest_length).decode('utf-8'))
+            self._data_offset = BUNDLE_HEADER.size + manifest_length
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._map)
+        # Also runs when a bundle dropped from the cache is garbage collected
+        self._close = weakref.finalize(self, _close_mapping, self._view, self._map, self._file)
+
+    @property
+    def template(self) -> str:
+        return self.manifest['template']
+
+    @property
+    def layers(self) -> list[str]:
+        """Names of the merged templates, root template first."""
+        return self.manifest.get('layers', [self.template])
+
+    @property
+    def content_hash(self) -> str:
+        return self.manifest['hash']
+
+    @property
+    def files(self) -> list[dict]:
+        return self.manifest['files']
+
+    def content(self, entry: dict) -> memoryview:
+        """Raw stored bytes of a file (before substitution)."""
+        start = self._data_offset + entry['offset']
+        return self._view[start:start + entry['length']]
+
+    def segments(self, entry: dict, variables: dict):
+        """
+        Yield the rendered output of a file as a sequence of byte chunks.
+
+        Placeholders without a matching variable are left as-is.
+        """
+        data = self.content(entry)
+        position = 0
+        for start, end, name in entry['placeholders']:
+            if name not in variables:
+                continue
+            yield data[position:start]
+            yield str(variables[name]).encode('utf-8')
+            position = end
+        yield data[position:]
+
+    def render(self, entry: dict, variables: dict) -> bytes:
+        """Rendered output of a file."""
+        return b''.join(self.segments(entry, variables))
+
+    def rendered_size(self, entry: dict, variables: dict) -> int:
+        """Size of a file's rendered output, computed from its placeholders without rendering it."""
+        size = entry['length']
+        for start, end, name in entry['placeholders']:
+            if name in variables:
+                size += len(str(variables[name]).encode('utf-8')) - (end - start)
+        return size
+
+    def matches(self, entry: dict, variables: dict, path: Path) -> bool:
+        """
+        Whether the file at path holds exactly the rendered output.
+
+        The output is compared segment by segment against the file and
+        stops at the first difference; nothing is written.
+        """
+        with open(path, 'rb') as f:
+            for chunk in self.segments(entry, variables):
+                if f.read(len(chunk)) != chunk:
+                    return False
+            return f.read(1) == b''
+
+    def write_file(self, entry: dict, dest: Path, variables: dict) -> str:
+        """
+        Write a rendered file to dest.
+
+        Files without placeholders are copied straight out of the bundle
+        with sendfile where the platform supports it.
+
+        Returns:
+            SHA-256 hex digest of the written content
+        """
+        digest = hashlib.sha256()
+        with tracing.span('template.write', path=entry['path'], bytes=entry['length']), open(dest, 'wb') as out:
+            if not entry['placeholders'] and _sendfile(self._file, out, self._data_offset + entry['offset'], entry['length']):
+                digest.update(self.content(entry))
+            else:
+                for chunk in self.segments(entry, variables):
+                    digest.update(chunk)
+                    out.write(chunk)
+        if entry['binary']:
+            os.chmod(dest, entry['mode'])
+        return digest.hexdigest()
+
+    def close(self):
+        self._close()
+
+
+def _close_mapping(view: memoryview, mapping: mmap.mmap, file):
+    view.release()
+    mapping.close()
+    file.close()
+
+
+def _sendfile(src_file, dest_file, offset: int, count: int) -> bool:
+    """Copy count bytes at offset from src_file to dest_file in the kernel."""
+    sendfile = getattr(os, 'sendfile', None)
+    if sendfile is None:
+        return False
+    try:
+        while count > 0:
+            sent = sendfile(dest_file.fileno(), src_file.fileno(), offset, count)
+            if sent == 0:
+                return False
+            offset += sent
+            count -= sent
+        return True
+    except OSError:
+        return False
+
+
+def _template_files(template_dir: Path) -> list[tuple[str, Path, os.stat_result]]:
+    """All files in a template directory as sorted (relative path, path, stat) tuples."""
+    files = []
+    for root, _dirs, filenames in os.walk(template_dir):
+        for filename in filenames:
+            path = Path(root) / filename
+            files.append((path.relative_to(template_dir).as_posix(), path, path.stat()))
+    files.sort(key=lambda f: f[0])
+    return files
+
+
+def template_config(template_dir: Path) -> dict:
+    """
+    Settings of a template from its template.json ({} if it has none).
+
+    Raises:
+        ValueError: if template.json is not a JSON object
+    """
+    config_path = Path(template_dir) / TEMPLATE_CONFIG
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Invalid {config_path}: {e}")
+    if not isinstance(config, dict):
+        raise ValueError(f"Invalid {config_path}: expected a JSON object")
+    return config
+
+
+def template_layers(template_dir: Path) -> list[Path]:
+    """
+    The layer chain of a template, root template first.
+
+    Parents named by "extends" are sibling directories of the template.
+
+    Raises:
+        ValueError: if a parent is missing or the chain loops
+    """
+    template_dir = Path(template_dir).resolve()
+    layers = [template_dir]
+    while True:
+        parent = template_config(layers[-1]).get('extends')
+        if not parent:
+            break
+        parent_dir = (layers[-1].parent / parent).resolve()
+        if parent_dir in layers:
+            chain = ' -> '.join(layer.name for layer in layers + [parent_dir])
+            raise ValueError(f"Template inheritance loop: {chain}")
+        if not parent_dir.is_dir():
+            raise ValueError(f"Template '{layers[-1].name}' extends '{parent}', which does not exist")
+        if len(layers) >= MAX_LAYERS:
+            raise ValueError(f"Template '{template_dir.name}' has more than {MAX_LAYERS} layers")
+        layers.append(parent_dir)
+    layers.reverse()
+    return layers
+
+
+def resolve_template_files(template_dir: Path) -> dict[str, list[tuple[str, Path, os.stat_result]]]:
+    """
+    Merge the layers of a template into one file map.
+
+    Returns:
+        Destination path -> the (relative path, path, stat) sources that
+        make up the file, sorted by destination. A file has one source
+        unless it is one of APPEND_FILES present in several layers, whose
+        sources are listed root layer first.
+    """
+    merged = {}
+    for layer in template_layers(template_dir):
+        for rel_path, path, st in _template_files(layer):
+            if rel_path == TEMPLATE_CONFIG:
+                continue
+            dest = _destination_name(rel_path)
+            if dest in merged and dest.rsplit('/', 1)[-1] in APPEND_FILES:
+                merged[dest].append((rel_path, path, st))
+            else:
+                merged[dest] = [(rel_path, path, st)]
+    return dict(sorted(merged.items()))
+
+
+def template_fingerprint(template_dir: Path) -> str:
+    """
+    Cheap change detector for a template and its parents based on file stats.
+
+    Used to skip content hashing when nothing has been touched.
+    """
+    digest = hashlib.sha256()
+    for layer in template_layers(template_dir):
+        digest.update(f"{layer}\n".encode('utf-8'))
+        for rel_path, _path, st in _template_files(layer):
+            digest.update(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_mode}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def template_hash(template_dir: Path) -> str:
+    """Content hash of a template's layer chain: layer names, paths, modes and file bytes."""
+    digest = hashlib.sha256(BUNDLE_MAGIC)
+    for layer in template_layers(template_dir):
+        digest.update(f"layer\0{layer.name}\n".encode('utf-8'))
+        for rel_path, path, st in _template_files(layer):
+            digest.update(f"{rel_path}\0{stat.S_IMODE(st.st_mode)}\0{st.st_size}\n".encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _destination_name(rel_path: str) -> str:
+    if rel_path.endswith('.template'):
+        return rel_path[:-9]
+    return rel_path
+
+
+def _encode_file(path: Path) -> tuple[bytes, bool]:
+    """
+    Stored representation of a template file.
+
+    Text files are stored exactly as init_project would write them (UTF-8,
+    universal newlines); anything that is not UTF-8 is stored raw.
+    """
+    try:
+        text = path.read_text(encoding='utf-8')
+    except UnicodeDecodeError:
+        return path.read_bytes(), True
+    return text.encode('utf-8'), False
+
+
+def append_layers(parts: list[bytes]) -> bytes:
+    """Content of an APPEND_FILES file: the layers' contents, separated by a blank line."""
+    content = b''
+    for data in parts:
+        if content:
+            content += b'\n' if content.endswith(b'\n') else b'\n\n'
+        content += data
+    return content
+
+
+def compile_bundle(template_dir: Path, bundle_path: Path, content_hash: str = None) -> Path:
+    """
+    Compile a template directory, merged with its parents, into a bundle file.
+
+    Args:
+        template_dir: Template directory to pack
+        bundle_path: Where to write the bundle
+        content_hash: Precomputed template_hash, if already known
+
+    Returns:
+        Path to the written bundle
+    """
+    template_dir = Path(template_dir)
+    with tracing.span('template.compile', template=template_dir.name):
+        return _compile_bundle(template_dir, bundle_path, content_hash)
+
+
+def _compile_bundle(template_dir: Path, bundle_path: Path, content_hash: str) -> Path:
+    files = []
+    blobs = []
+    offset = 0
+
+    layers = template_layers(template_dir)
+    for dest, sources in resolve_template_files(template_dir).items():
+        rel_path, path, st = sources[-1]
+        data, binary = _encode_file(path)
+        if len(sources) > 1:
+            parts = [_encode_file(source[1]) for source in sources]
+            if not any(part_binary for _data, part_binary in parts):
+                data = append_layers([part for part, _binary in parts])
+        placeholders = []
+        if not binary:
+            placeholders = [
+                [m.start(), m.end(), m.group(1).decode('ascii')]
+                for m in PLACEHOLDER_BYTES_PATTERN.finditer(data)
+            ]
+        files.append({
+            'source': rel_path,
+            'path': dest,
+            'mode': stat.S_IMODE(st.st_mode),
+            'binary': binary,
+            'offset': offset,
+            'length': len(data),
+            'placeholders': placeholders,
+        })
+        blobs.append(data)
+        offset += len(data)
+
+    manifest = {
+        'template': template_dir.name,
+        'layers': [layer.name for layer in layers],
+        'hash': content_hash or template_hash(template_dir),
+        'files': files,
+    }
+    manifest_bytes = json.dumps(manifest, separators=(',', ':')).encode('utf-8')
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=bundle_path.parent, prefix=bundle_path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, len(manifest_bytes)))
+            f.write(manifest_bytes)
+            for data in blobs:
+                f.write(data)
+        os.replace(tmp_name, bundle_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return bundle_path
+
+
+def _load_index(cache_dir: Path) -> dict:
+    try:
+        with open(cache_dir / 'index.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(cache_dir: Path, index: dict):
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix='index.json', suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp_name, cache_dir / 'index.json')
+
+
+# (cache dir, template dir) -> the open bundle of its current content
+_open_bundles = {}
+_lock = threading.Lock()
+
+
+def get_bundle(template_dir: Path, cache_dir: Path = None, force: bool = False) -> TemplateBundle:
+    """
+    Return an up-to-date bundle for a template directory, compiling if needed.
+
+    The stat fingerprint decides whether the template could have changed;
+    only then is its content hashed. A bundle with a matching content hash
+    is reused, otherwise a new one is compiled. The open bundle of each
+    template is kept for the life of the process; when the template
+    changes, the previous one is dropped and its mapping is closed once no
+    caller still holds it.
+    """
+    template_dir = Path(template_dir).resolve()
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    key = str(template_dir)
+
+    with _lock, tracing.span('template.bundle', template=template_dir.name):
+        index = _load_index(cache_dir)
+        entry = index.get(key, {})
+        fingerprint = template_fingerprint(template_dir)
+        bundle_path = cache_dir / entry['bundle'] if 'bundle' in entry else None
+
+        if force or entry.get('fingerprint') != fingerprint or not bundle_path.exists():
+            content_hash = template_hash(template_dir)
+            bundle_path = cache_dir / f"{template_dir.name}-{content_hash[:16]}.bundle"
+            if force or not bundle_path.exists():
+                compile_bundle(template_dir, bundle_path, content_hash)
+            previous = entry.get('bundle')
+            if previous and previous != bundle_path.name:
+                try:
+                    (cache_dir / previous).unlink(missing_ok=True)
+                except OSError:  # still mapped, on platforms that forbid it
+                    pass
+            index[key] = {'fingerprint': fingerprint, 'hash': content_hash, 'bundle': bundle_path.name}
+            _save_index(cache_dir, index)
+
+        open_key = (str(cache_dir), key)
+        bundle = _open_bundles.get(open_key)
+        if bundle is None or bundle.path != bundle_path:
+            # A request still writing from the old bundle keeps it alive;
+            # otherwise its mapping and file are closed right here.
+            _open_bundles.pop(open_key, None)
+            bundle = TemplateBundle(bundle_path)
+            _open_bundles[open_key] = bundle
+        return bundle
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(
+        description='Compile project templates into cached bundles'
+    )
+
+    parser.add_argument(
+        'templates',
+        nargs='*',
+        help='Template names to compile (default: all templates)'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        help=f'Bundle cache directory (default: {DEFAULT_CACHE_DIR})'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild bundles even if the templates are unchanged'
+    )
+
+    args = parser.parse_args(argv)
+
+    names = args.templates or sorted(t.name for t in TEMPLATES_DIR.iterdir() if t.is_dir())
+    success = True
+    for name in names:
+        template_dir = TEMPLATES_DIR / name
+        if not template_dir.is_dir():
+            print(f"Error: Template '{name}' not found at {template_dir}", file=sys.stderr)
+            success = False
+            continue
+        try:
+            bundle = get_bundle(template_dir, args.cache_dir, force=args.force)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            success = False
+            continue
+        layers = f" ({' <- '.join(bundle.layers)})" if len(bundle.layers) > 1 else ''
+        print(f"✓ {name}{layers}: {len(bundle.files)} file(s), hash {bundle.content_hash[:16]} -> {bundle.path}")
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
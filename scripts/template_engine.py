@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Template Engine
+
+Single-pass renderer for {{VARIABLE_NAME}} templates.
+Each template is parsed once into literal and placeholder segments and
+rendered with a single join, instead of rescanning the content once per
+variable.
+Uses only Python standard library.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# Variable names a {{PLACEHOLDER}} can refer to
+VARIABLE_NAME_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(' + VARIABLE_NAME_PATTERN.pattern + r')\}\}')
+
+
+class CompiledTemplate(NamedTuple):
+    """
+    Parsed template.
+
+    `literals` always has one more element than `names`: the rendered output
+    is literals[0] + value(names[0]) + literals[1] + ... + literals[-1].
+    """
+    literals: tuple
+    names: tuple
+
+
+@lru_cache(maxsize=256)
+def compile_template(content: str) -> CompiledTemplate:
+    """
+    Parse template content into literal and placeholder segments.
+
+    Results are cached by content, so identical templates are parsed once.
+    """
+    literals = []
+    names = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(content):
+        literals.append(content[position:match.start()])
+        names.append(match.group(1))
+        position = match.end()
+    literals.append(content[position:])
+    return CompiledTemplate(tuple(literals), tuple(names))
+
+
+def check_variable_names(variables: dict):
+    """
+    Reject variables no placeholder can refer to.
+
+    Raises:
+        ValueError: naming every variable that does not match
+            VARIABLE_NAME_PATTERN (e.g. "api-key" or "db.host")
+    """
+    invalid = sorted(name for name in variables if not VARIABLE_NAME_PATTERN.fullmatch(name))
+    if invalid:
+        raise ValueError(
+            f"invalid variable name(s): {', '.join(invalid)} "
+            "(use letters, digits and underscores, not starting with a digit)"
+        )
+
+
+def render(template: CompiledTemplate, variables: dict) -> str:
+    """
+    Render a compiled template in one pass.
+
+    Placeholders without a matching variable are left as-is.
+    """
+    literals = template.literals
+    if not template.names:
+        return literals[0]
+
+    parts = [literals[0]]
+    for name, literal in zip(template.names, literals[1:]):
+        if name in variables:
+            parts.append(str(variables[name]))
+        else:
+            parts.append(f"{{{{{name}}}}}")
+        parts.append(literal)
+    return ''.join(parts)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tracing and Profiling Hooks
+
+A shared instrumentation surface for the scripts. Code marks its hot
+paths with spans:
+
+    with tracing.span('template.write', path=rel_path):
+        ...
+
+and every script's main() accepts --trace FILE, which records the spans
+in Chrome trace-event format (open in chrome://tracing or Perfetto), and
+--profile FILE, which dumps cProfile statistics for pstats.
+
+While no trace is being recorded, span() returns a shared no-op context
+manager: no clock reads, no event records and no locking.
+Uses only Python standard library.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class _NullSpan:
+    """The span returned while tracing is off; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start_ns')
+
+    def __init__(self, tracer, name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is SystemExit:
+            self.args['exit_code'] = exc.code
+        elif exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.record(self.name, self.category, self.start_ns, time.perf_counter_ns(), self.args)
+        return False
+
+    def set(self, **args):
+        """Attach more arguments to the span, e.g. a result known only at the end."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects completed spans as Chrome trace events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._threads = {}
+        self.events = []
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, args: dict):
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start_ns - self._origin_ns) / 1000,
+            'dur': (end_ns - start_ns) / 1000,
+            'pid': os.getpid(),
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = {key: value if isinstance(value, (int, float, bool)) else str(value)
+                             for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            names = [
+                {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': ident, 'args': {'name': name}}
+                for ident, name in self._threads.items()
+            ]
+            return {'traceEvents': names + sorted(self.events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}
+
+    def write(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+            f.write('\n')
+
+
+# The tracer spans are recorded into, or None while tracing is off
+_tracer = None
+
+
+def enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _tracer is not None
+
+
+def span(name: str, category: str = 'meta', **args):
+    """
+    Context manager timing a block as a trace span.
+
+    Args:
+        name: Span name, dotted by area (e.g. "validate.check")
+        category: Trace category
+        **args: Values shown with the span (converted to str unless numeric)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args)
+
+
+def add_arguments(parser):
+    """Add the --trace and --profile options to a script's argument parser."""
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help='Record timing spans to FILE in Chrome trace-event format'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help='Profile the run with cProfile and dump the statistics to FILE'
+    )
+
+
+@contextmanager
+def session(trace_path: str = None, profile_path: str = None):
+    """
+    Record spans and/or profile for the duration of the block.
+
+    The trace and profile are written when the block exits, including via
+    sys.exit(). cProfile only sees the thread that opened the session;
+    spans are recorded from every thread.
+
+    Args:
+        trace_path: Where to write the Chrome trace (None: no tracing)
+        profile_path: Where to dump cProfile statistics (None: no profiling)
+    """
+    global _tracer
+
+    if not trace_path and not profile_path:
+        yield
+        return
+
+    previous = _tracer
+    if trace_path:
+        _tracer = Tracer()
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    tracer = _tracer
+    try:
+        with span('main', 'meta', argv=' '.join(sys.argv)):
+            yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            print(f"Profile written to {profile_path} (python3 -m pstats {profile_path})", file=sys.stderr)
+        if trace_path:
+            _tracer = previous
+            tracer.write(Path(trace_path))
+            print(f"Trace written to {trace_path} ({len(tracer.events)} spans)", file=sys.stderr)
@@ -3,20 +3,57 @@
 MCP Server Registry Updater
 
 Automatically updates the MCP server registry from web sources.
+
+Each source has its own TTL; a refresh only fetches sources whose jittered
+due time has passed. Refreshes can run in a detached background process
+(or as a daemon) guarded by a PID lock file, while readers use
+open_registry, which returns the last published snapshot immediately,
+read-only, and schedules a background refresh when it is due
+(stale-while-revalidate). Hand edits to the Markdown registry are read
+back in by the refresh.
 Uses only Python standard library.
 """
 
+import hashlib
 import json
+import os
+import random
+import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+
+try:
+    import fcntl
+except ImportError:  # Windows: background refreshes are not locked
+    fcntl = None
+
+import tracing
+from registry_fetch import META_PROJECT_ROOT, DEFAULT_SOURCES, fetch_sources
+from registry_store import DEFAULT_REGISTRY_PATH, RegistryStore, default_store_path, registry_header, render_markdown_body
+
+
+DEFAULT_TTL_HOURS = 7 * 24
+TTL_JITTER = 0.1  # due times are spread by +/-10% so sources don't refresh in lockstep
+RETRY_AFTER_SECONDS = 15 * 60  # a failed source is retried after this long, jittered
+REFRESH_STATE_DIR = META_PROJECT_ROOT / '.cache' / 'registry-refresh'
 
 
-def check_registry_age(registry_path: Path) -> tuple[bool, int]:
+def check_registry_age(
+    registry_path: Path,
+    refreshed_at: float = None,
+    max_age_days: float = DEFAULT_TTL_HOURS / 24
+) -> tuple[bool, int]:
     """
-    Check if the registry file is stale (older than 7 days).
+    Check if the registry file is stale (older than max_age_days).
+
+    Args:
+        registry_path: Path to the registry markdown file
+        refreshed_at: Time of the last refresh, if known; the file is only
+            rewritten when its content changes, so its mtime can be older
+        max_age_days: Age after which the registry is stale
 
     Returns:
         (is_stale, age_in_days) tuple
@@ -24,85 +61,54 @@ def check_registry_age(registry_path: Path) -> tuple[bool, int]:
     if not registry_path.exists():
         return True, 999  # File doesn't exist, definitely stale
 
-    modified_time = datetime.fromtimestamp(registry_path.stat().st_mtime)
+    modified_time = datetime.fromtimestamp(max(registry_path.stat().st_mtime, refreshed_at or 0))
     age = datetime.now() - modified_time
     age_days = age.days
 
-    return age_days > 7, age_days
+    return age / timedelta(days=1) > max_age_days, age_days
 
 
-def fetch_url(url: str, timeout: int = 10) -> str:
-    """
-    Fetch content from a URL.
+def _jittered(seconds: float) -> float:
+    return seconds * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER)
 
-    Args:
-        url: URL to fetch
-        timeout: Request timeout in seconds
 
-    Returns:
-        Content as string, or None if failed
+def configured_sources(store: RegistryStore, sources: list[str] = None) -> list[str]:
     """
-    try:
-        headers = {
-            'User-Agent': 'Claude-Code-Meta/1.0'
-        }
-        req = Request(url, headers=headers)
-        with urlopen(req, timeout=timeout) as response:
-            return response.read().decode('utf-8')
-    except URLError as e:
-        print(f"Error fetching {url}: {e}", file=sys.stderr)
-        return None
-    except Exception as e:
-        print(f"Unexpected error fetching {url}: {e}", file=sys.stderr)
-        return None
-
-
-def parse_mcp_servers_from_web() -> list[dict]:
+    The sources to refresh: those given (which are remembered), else the
+    ones last used with this store, else the defaults.
     """
-    Fetch and parse MCP servers from web sources.
+    if sources:
+        if json.loads(store.get_meta('sources', 'null') or 'null') != list(sources):
+            store.set_meta('sources', json.dumps(list(sources)))
+        return list(sources)
+    return json.loads(store.get_meta('sources', 'null') or 'null') or DEFAULT_SOURCES
 
-    This is a placeholder implementation. In a real system, you would:
-    1. Fetch from modelcontextprotocol.io registry
-    2. Parse GitHub repositories
-    3. Check official Claude documentation
 
-    Returns:
-        List of server dictionaries
+def source_ttl(store: RegistryStore, url: str, ttl_hours: float = None, source_ttls: dict = None) -> float:
     """
-    servers = []
-
-    # Placeholder: In reality, you would fetch and parse from actual sources
-    # For now, return empty list to avoid breaking the script
-    print("Note: Web fetching not yet implemented. Using local registry only.")
-
-    return servers
-
-
-def merge_servers(local_servers: list[dict], web_servers: list[dict]) -> list[dict]:
+    TTL of a source in hours: from source_ttls, else ttl_hours, else the
+    one last used for it, else the default. The result is remembered, so
+    background refreshes keep the TTLs given on the command line.
     """
-    Merge local and web server lists, preserving local customizations.
+    if source_ttls and url in source_ttls:
+        hours = source_ttls[url]
+    elif ttl_hours is not None:
+        hours = ttl_hours
+    else:
+        return float(store.get_meta(f"source_ttl:{url}", str(DEFAULT_TTL_HOURS)))
+    store.set_meta(f"source_ttl:{url}", str(hours))
+    return hours
 
-    Args:
-        local_servers: Servers from local registry
-        web_servers: Servers fetched from web
 
-    Returns:
-        Merged server list
-    """
-    # Create dict by server name for easy lookup
-    merged = {s['name']: s for s in local_servers}
+def due_sources(store: RegistryStore, sources: list[str], now: float = None) -> list[str]:
+    """Sources whose due time has passed (or that were never fetched)."""
+    now = time.time() if now is None else now
+    return [url for url in sources if float(store.get_meta(f"source_due:{url}", '0')) <= now]
 
-    # Add new servers from web
-    for server in web_servers:
-        name = server['name']
-        if name not in merged:
-            merged[name] = server
-        else:
-            # Update web-sourced fields but keep local customizations
-            if 'custom' not in merged[name]:
-                merged[name] = server
 
-    return list(merged.values())
+def next_due(store: RegistryStore, sources: list[str]) -> float:
+    """Earliest due time among sources."""
+    return min(float(store.get_meta(f"source_due:{url}", '0')) for url in sources)
 
 
 def format_registry_markdown(servers: list[dict]) -> str:
@@ -115,98 +121,277 @@ def format_registry_markdown(servers: list[dict]) -> str:
     Returns:
         Formatted Markdown string
     """
-    # Group by category
-    categories = {}
-    for server in servers:
-        category = server.get('category', 'Other')
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(server)
-
-    # Build Markdown
-    md = "# MCP Server Registry\n\n"
-    md += f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md += "Curated registry of MCP servers organized by category.\n\n"
-
-    for category in sorted(categories.keys()):
-        md += f"## {category}\n\n"
-        for server in sorted(categories[category], key=lambda s: s['name']):
-            md += f"### {server['name']}\n\n"
-            md += f"- **Purpose**: {server.get('purpose', 'N/A')}\n"
-            md += f"- **Transport**: {server.get('transport', 'stdio')}\n"
-
-            if 'install' in server:
-                md += f"- **Install**: `{server['install']}`\n"
-
-            if 'config' in server:
-                md += f"- **Config**:\n```json\n{json.dumps(server['config'], indent=2)}\n```\n"
-
-            if 'use_cases' in server:
-                md += f"- **Use cases**: {server['use_cases']}\n"
-
-            if 'docs' in server:
-                md += f"- **Docs**: {server['docs']}\n"
-
-            md += "\n"
-
-    return md
-
-
-def update_registry(registry_path: Path, force: bool = False) -> bool:
+    return registry_header() + render_markdown_body(servers)
+
+
+def update_registry(
+    registry_path: Path,
+    force: bool = False,
+    sources: list[str] = None,
+    workers: int = 8,
+    use_cache: bool = True,
+    store_path: Path = None,
+    ttl_hours: float = None,
+    source_ttls: dict = None
+) -> bool:
     """
     Update the MCP server registry.
 
+    Hand edits to the Markdown registry are read back in first, whether or
+    not a source is due. Only sources whose due time has passed are
+    fetched. Fetched servers are
+    upserted into the registry store in one transaction, and the Markdown
+    registry is re-rendered from the store (atomically) if its content
+    changed. Each fetched source is then due again after its TTL, jittered;
+    a source that failed is retried sooner.
+
     Args:
         registry_path: Path to the registry markdown file
-        force: Force update even if not stale
+        force: Fetch every source, whether due or not
+        sources: Registry URLs to fetch (default: those last used with the
+            store, else the official MCP registry)
+        workers: Sources fetched concurrently
+        use_cache: Use the on-disk HTTP response cache
+        store_path: Registry database (default: next to the markdown file)
+        ttl_hours: Time between refreshes of a source (default: the TTL
+            last used for it, else DEFAULT_TTL_HOURS)
+        source_ttls: Per-source TTLs in hours, by URL
 
     Returns:
-        True if updated, False otherwise
+        True if the registry was refreshed, False otherwise
     """
     print(f"Checking registry: {registry_path}")
 
-    # Check if update needed
-    is_stale, age_days = check_registry_age(registry_path)
-
-    if not force and not is_stale:
-        print(f"Registry is current (age: {age_days} days). No update needed.")
-        return False
+    with RegistryStore(store_path or default_store_path(registry_path)) as store:
+        # Load local registry, reading back the Markdown if it was edited by hand
+        with tracing.span('registry.sync', registry=registry_path):
+            counts = store.sync_markdown(registry_path)
+            store.ensure_search_index()
+        if counts:
+            print(
+                f"Local registry from {registry_path}: {counts['inserted']} new, "
+                f"{counts['customized']} edited (kept as custom), {counts['unchanged']} unchanged"
+            )
+
+        sources = configured_sources(store, sources)
+
+        # Check if update needed
+        due = list(sources) if force else due_sources(store, sources)
+
+        if not due:
+            refreshed_at = store.get_meta('refreshed_at')
+            _, age_days = check_registry_age(registry_path, float(refreshed_at) if refreshed_at else None)
+            wait = timedelta(seconds=int(next_due(store, sources) - time.time()))
+            print(f"Registry is current (age: {age_days} days, next source due in {wait}). No update needed.")
+            return False
+
+        print(f"Refreshing {len(due)} of {len(sources)} source(s)...")
+        local_count = store.count()
+        print(f"Registry store: {local_count} server(s) in {store.path}")
+
+        # Fetch from web
+        print("Fetching servers from web sources...")
+        with tracing.span('registry.fetch', sources=len(due)):
+            web_servers, stats = fetch_sources(due, workers=workers, use_cache=use_cache)
+        print(f"Fetched {len(web_servers)} server(s) from {len(due)} source(s): {stats.summary()}")
+
+        now = time.time()
+        for url in due:
+            delay = source_ttl(store, url, ttl_hours, source_ttls) * 3600
+            if url in stats.failed_sources:
+                delay = min(RETRY_AFTER_SECONDS, delay)
+            store.set_meta(f"source_due:{url}", str(now + _jittered(delay)))
+
+        if not web_servers and not local_count:
+            print("Warning: No servers found from web or local registry.", file=sys.stderr)
+            return False
+
+        # Merge
+        with tracing.span('registry.upsert', servers=len(web_servers)):
+            counts = store.upsert(web_servers, source='web')
+        print(
+            f"Merged: {counts['inserted']} new, {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged, {counts['kept_custom']} kept (custom)"
+        )
+        store.set_meta('refreshed_at', str(now))
+
+        # Render Markdown from the store
+        try:
+            with tracing.span('registry.render', registry=registry_path):
+                written = store.write_markdown(registry_path)
+            if written:
+                print(f"✓ Registry updated successfully at {registry_path}")
+            else:
+                print(f"✓ Registry content unchanged; {registry_path} not rewritten")
+            return True
+        except Exception as e:
+            print(f"Error writing registry: {e}", file=sys.stderr)
+            return False
+
+
+def refresh_state_paths(registry_path: Path) -> tuple[Path, Path]:
+    """(lock file, log file) of background refreshes of a registry."""
+    key = hashlib.sha256(str(Path(registry_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return REFRESH_STATE_DIR / f"{key}.lock", REFRESH_STATE_DIR / f"{key}.log"
+
+
+@contextmanager
+def refresh_lock(registry_path: Path):
+    """
+    Hold the refresh lock of a registry, without waiting for it.
 
-    print(f"Registry is stale (age: {age_days} days). Updating...")
+    Yields True with the lock held (and this process's PID written to the
+    lock file), or False if another refresh holds it.
+    """
+    lock_path, _log_path = refresh_state_paths(registry_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+        lock_file.truncate(0)
+        lock_file.write(f"{os.getpid()}\n")
+        lock_file.flush()
+        try:
+            yield True
+        finally:
+            lock_file.truncate(0)
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def refresh_running(registry_path: Path) -> int:
+    """PID of the process refreshing a registry, or 0 if none is."""
+    lock_path, _log_path = refresh_state_paths(registry_path)
+    if fcntl is None or not lock_path.exists():
+        return 0
+    with open(lock_path, 'r') as lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except OSError:
+            return int(lock_file.read().strip() or 0) or -1
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    return 0
+
+
+def _refresh_args(
+    registry_path: Path,
+    sources: list[str] = None,
+    store_path: Path = None,
+    ttl_hours: float = None,
+    source_ttls: dict = None,
+    use_cache: bool = True
+) -> list[str]:
+    args = ['--registry', str(Path(registry_path).resolve())]
+    if ttl_hours is not None:
+        args.extend(['--ttl', str(ttl_hours)])
+    for url in sources or []:
+        args.extend(['--source', url])
+    for url, hours in (source_ttls or {}).items():
+        args.extend(['--source-ttl', f"{url}={hours}"])
+    if store_path:
+        args.extend(['--store', str(Path(store_path).resolve())])
+    if not use_cache:
+        args.append('--no-http-cache')
+    return args
+
+
+def start_background_refresh(registry_path: Path, **options) -> int:
+    """
+    Start a detached process that refreshes the due sources of a registry.
 
-    # Load local registry
-    local_servers = []
-    if registry_path.exists():
-        print("Loading local registry...")
-        # Note: Parsing Markdown is complex. For now, we'll just preserve the file
-        # In a real implementation, you would parse the existing Markdown
-        local_servers = []  # Placeholder
+    The process outlives the caller and logs to the refresh log file. If a
+    refresh is already running, nothing is started.
 
-    # Fetch from web
-    print("Fetching servers from web sources...")
-    web_servers = parse_mcp_servers_from_web()
+    Args:
+        registry_path: Path to the registry markdown file
+        **options: sources, store_path, ttl_hours, source_ttls, use_cache
 
-    if not web_servers and not local_servers:
-        print("Warning: No servers found from web or local registry.", file=sys.stderr)
-        return False
+    Returns:
+        PID of the started (or already running) refresh process
+    """
+    running = refresh_running(registry_path)
+    if running:
+        return running
+
+    _lock_path, log_path = refresh_state_paths(registry_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), '--refresh-due'] + _refresh_args(registry_path, **options)
+    with open(log_path, 'a') as log:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True
+        )
+    return process.pid
+
+
+def open_registry(registry_path: Path = None, store_path: Path = None, refresh: bool = True, **options) -> RegistryStore:
+    """
+    Open the registry for reading without waiting on the network.
 
-    # Merge
-    merged_servers = merge_servers(local_servers, web_servers)
+    Returns the last published snapshot right away, opened read-only so it
+    never waits on a running refresh. If any source is due, or the Markdown
+    registry was edited since it was last read in, a background refresh is
+    started (stale-while-revalidate). Only when there is no store yet is it
+    created and filled from the Markdown registry here.
 
-    # Format as Markdown
-    markdown = format_registry_markdown(merged_servers)
+    Args:
+        registry_path: Path to the registry markdown file (default: auto-detect)
+        store_path: Registry database (default: next to the markdown file)
+        refresh: Start a background refresh when the snapshot is stale
+        **options: sources, ttl_hours, source_ttls, use_cache for the refresh
 
-    # Write to file
-    try:
-        registry_path.write_text(markdown, encoding='utf-8')
-        print(f"✓ Registry updated successfully at {registry_path}")
-        return True
-    except Exception as e:
-        print(f"Error writing registry: {e}", file=sys.stderr)
-        return False
+    Returns:
+        An open, read-only RegistryStore; close it when done
+    """
+    registry_path = Path(registry_path or DEFAULT_REGISTRY_PATH)
+    path = Path(store_path or default_store_path(registry_path))
+    if not path.exists():
+        with RegistryStore(path) as store:
+            store.sync_markdown(registry_path)
+            store.ensure_search_index()
+    store = RegistryStore(path, read_only=True)
+    if refresh and (
+        # Given sources are remembered by the refresh, not by this read-only store
+        due_sources(store, options.get('sources') or configured_sources(store))
+        or store.markdown_edited(registry_path)
+        or not store.search_index_complete()
+    ):
+        start_background_refresh(registry_path, store_path=store_path, **options)
+    return store
+
+
+def run_daemon(registry_path: Path, poll_seconds: float = 3600, **options) -> bool:
+    """
+    Keep a registry fresh: refresh due sources, sleep until the next is due.
 
+    Sleeps at most poll_seconds at a time, so TTL changes and hand edits
+    are picked up.
 
-def main():
+    Returns:
+        False if another refresh process already holds the lock
+    """
+    store_path = options.get('store_path') or default_store_path(registry_path)
+    with refresh_lock(registry_path) as locked:
+        if not locked:
+            print(f"A refresh is already running (pid {refresh_running(registry_path)}).", file=sys.stderr)
+            return False
+        print(f"Registry refresh daemon started (pid {os.getpid()})")
+        while True:
+            update_registry(registry_path, **options)
+            with RegistryStore(store_path) as store:
+                wait = next_due(store, configured_sources(store, options.get('sources'))) - time.time()
+            time.sleep(min(max(wait, 1.0), poll_seconds))
+
+
+def main(argv: list[str] = None):
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -224,18 +409,116 @@ def main():
         help='Force update even if registry is current'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--source',
+        action='append',
+        metavar='URL',
+        help=f'Registry URL to fetch; repeat for several sources (default: {DEFAULT_SOURCES[0]})'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Sources fetched concurrently (default: 8)'
+    )
+
+    parser.add_argument(
+        '--no-http-cache',
+        action='store_true',
+        help='Do not use or update the on-disk HTTP response cache'
+    )
+
+    parser.add_argument(
+        '--store',
+        help='Path to the registry database (default: the registry path with a .db suffix)'
+    )
+
+    parser.add_argument(
+        '--ttl',
+        type=float,
+        metavar='HOURS',
+        help=f'Time between refreshes of a source, jittered by +/-{TTL_JITTER:.0%} '
+             f'(default: the TTL last used, else {DEFAULT_TTL_HOURS})'
+    )
+
+    parser.add_argument(
+        '--source-ttl',
+        action='append',
+        default=[],
+        metavar='URL=HOURS',
+        help='TTL for one source; repeat for several'
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+
+    mode.add_argument(
+        '--background',
+        action='store_true',
+        help='Refresh due sources in a detached process and return immediately'
+    )
+
+    mode.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Keep running, refreshing each source when it is due'
+    )
+
+    # Used by --background for the detached process itself
+    mode.add_argument(
+        '--refresh-due',
+        action='store_true',
+        help=argparse.SUPPRESS
+    )
+
+    tracing.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    source_ttls = {}
+    for spec in args.source_ttl:
+        url, separator, hours = spec.rpartition('=')
+        try:
+            source_ttls[url] = float(hours)
+        except ValueError:
+            separator = ''
+        if not separator or not url:
+            parser.error(f"--source-ttl expects URL=HOURS, got {spec!r}")
 
     # Determine registry path
     if args.registry:
         registry_path = Path(args.registry)
     else:
         # Auto-detect from script location
-        script_dir = Path(__file__).parent
-        registry_path = script_dir.parent / '.claude' / 'skills' / 'project-creator' / 'references' / 'mcp_servers.md'
-
-    success = update_registry(registry_path, force=args.force)
-    sys.exit(0 if success else 1)
+        registry_path = DEFAULT_REGISTRY_PATH
+
+    options = {
+        'sources': args.source,
+        'store_path': Path(args.store) if args.store else None,
+        'ttl_hours': args.ttl,
+        'source_ttls': source_ttls,
+        'use_cache': not args.no_http_cache,
+    }
+
+    with tracing.session(args.trace, args.profile):
+        if args.background:
+            pid = start_background_refresh(registry_path, **options)
+            print(f"Registry refresh running in the background (pid {pid}), log: {refresh_state_paths(registry_path)[1]}")
+            sys.exit(0)
+
+        if args.daemon:
+            sys.exit(0 if run_daemon(registry_path, workers=args.workers, **options) else 1)
+
+        with refresh_lock(registry_path) as locked:
+            if not locked:
+                if args.refresh_due:
+                    sys.exit(0)
+                print(f"Error: A registry refresh is already running (pid {refresh_running(registry_path)}).", file=sys.stderr)
+                sys.exit(1)
+            if args.refresh_due:
+                print(f"--- Background refresh at {datetime.now().isoformat(timespec='seconds')} (pid {os.getpid()})")
+            success = update_registry(registry_path, force=args.force, workers=args.workers, **options)
+        sys.exit(0 if success or args.refresh_due else 1)
 
 
 if __name__ == '__main__':
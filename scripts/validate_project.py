@@ -7,11 +7,142 @@ Uses only Python standard library.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import tracing
+from frontmatter import FrontmatterError, read_frontmatter
+from mcp_config import McpConfigStore
+from permissions import compile_permissions
+
+
+CACHE_FILE = Path('.claude') / '.validate-cache'
+
+# Directories never searched for projects in --recursive mode.
+PRUNED_DIRS = {'.git', 'node_modules', '.venv', 'venv', '__pycache__', '.tox', '.claude'}
+
+# A file whose mtime is this close to when it was validated may still be
+# changing within the filesystem's timestamp granularity, so its stat
+# alone is not trusted on the next run.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+# Modules whose code decides validation results.
+VALIDATOR_SOURCES = [
+    Path(__file__),
+    Path(__file__).with_name('frontmatter.py'),
+    Path(__file__).with_name('permissions.py'),
+    Path(__file__).with_name('mcp_config.py'),
+]
+
+
+def validator_version() -> str:
+    """Hash of the validator source, so cached results expire when it changes."""
+    digest = hashlib.sha256()
+    for source in VALIDATOR_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    Persistent per-file validation results for a project.
+
+    Results are keyed by check name and relative path and are reused while
+    the file's size and mtime_ns are unchanged, or while its content hash
+    still matches when the stat has changed. A long-lived caller can keep
+    the cache and pass it to collect_project_report for every run.
+
+    Args:
+        project_dir: Resolved project directory
+        enabled: Load and use the cache (False: run every validator)
+        version: Validator version (default: validator_version(), which
+            hashes the validator sources)
+    """
+
+    def __init__(self, project_dir: Path, enabled: bool = True, version: str = None):
+        self.project_dir = project_dir
+        self.path = project_dir / CACHE_FILE
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._version = version or validator_version()
+        self._entries = self._load() if enabled else {}
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != self._version:
+            return {}
+        return data.get('entries', {})
+
+    def run(self, check: str, file_path: Path, validator) -> tuple[bool, str]:
+        """Return validator(file_path), reusing a cached result when the file is unchanged."""
+        if not self.enabled:
+            return validator(file_path)
+
+        key = f"{check}:{file_path.relative_to(self.project_dir).as_posix()}"
+        try:
+            st = file_path.stat()
+        except OSError:
+            return validator(file_path)
+
+        entry = self._entries.get(key)
+        if entry and entry['size'] == st.st_size:
+            stat_matches = entry['mtime_ns'] == st.st_mtime_ns and entry['mtime_ns'] + RACY_WINDOW_NS < entry['checked_ns']
+            if stat_matches or entry['sha256'] == _file_sha256(file_path):
+                if not stat_matches:
+                    entry['mtime_ns'] = st.st_mtime_ns
+                    entry['checked_ns'] = time.time_ns()
+                    self._dirty = True
+                self.hits += 1
+                return tuple(entry['result'])
+
+        self.misses += 1
+        result = validator(file_path)
+        self._entries[key] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'checked_ns': time.time_ns(),
+            'sha256': _file_sha256(file_path),
+            'result': list(result),
+        }
+        self._dirty = True
+        return result
+
+    def save(self):
+        """Write the cache back if anything changed and .claude/ exists."""
+        if not self.enabled or not self._dirty or not self.path.parent.is_dir():
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': self._version, 'entries': self._entries}, f)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
 
 def validate_json(file_path: Path) -> tuple[bool, str]:
     """Validate JSON file syntax."""
@@ -28,45 +159,20 @@ def validate_json(file_path: Path) -> tuple[bool, str]:
 def validate_yaml_frontmatter(file_path: Path) -> tuple[bool, str]:
     """Validate YAML frontmatter in Markdown files."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-
-        # Check if file starts with ---
-        if not content.startswith('---\n'):
-            return False, "Missing YAML frontmatter (should start with ---)"
-
-        # Find closing ---
-        lines = content.split('\n')
-        closing_index = None
-        for i, line in enumerate(lines[1:], start=1):
-            if line.strip() == '---':
-                closing_index = i
-                break
-
-        if closing_index is None:
-            return False, "YAML frontmatter not properly closed (missing second ---)"
-
-        # Extract frontmatter
-        frontmatter = '\n'.join(lines[1:closing_index])
-
-        # Basic YAML validation (check for key: value pattern)
-        required_fields = {'name', 'description'}
-        found_fields = set()
-
-        for line in frontmatter.split('\n'):
-            line = line.strip()
-            if ':' in line:
-                key = line.split(':')[0].strip()
-                found_fields.add(key)
-
-        missing = required_fields - found_fields
-        if missing:
-            return False, f"Missing required frontmatter fields: {', '.join(missing)}"
-
-        return True, "Valid YAML frontmatter"
-
+        fields = read_frontmatter(file_path)
+    except FrontmatterError as e:
+        return False, str(e)
     except Exception as e:
         return False, f"Error reading file: {e}"
 
+    # Basic YAML validation (check for key: value pattern)
+    required_fields = {'name', 'description'}
+    missing = required_fields - set(fields)
+    if missing:
+        return False, f"Missing required frontmatter fields: {', '.join(missing)}"
+
+    return True, "Valid YAML frontmatter"
+
 
 def validate_permissions(settings_file: Path) -> tuple[bool, str]:
     """Validate permission patterns in settings.json."""
@@ -77,20 +183,11 @@ def validate_permissions(settings_file: Path) -> tuple[bool, str]:
         if 'permissions' not in settings:
             return True, "No permissions configured"
 
-        permissions = settings['permissions']
-
-        # Validate allow patterns
-        if 'allow' in permissions:
-            for pattern in permissions['allow']:
-                # Basic pattern validation
-                if not isinstance(pattern, str):
-                    return False, f"Invalid permission pattern (not a string): {pattern}"
-
-        # Validate deny patterns
-        if 'deny' in permissions:
-            for pattern in permissions['deny']:
-                if not isinstance(pattern, str):
-                    return False, f"Invalid permission pattern (not a string): {pattern}"
+        # Parse every allow/ask/deny pattern
+        compiled = compile_permissions(settings['permissions'], settings_file.parent.parent)
+        if compiled.errors:
+            _list_name, pattern, reason = compiled.errors[0]
+            return False, f"Invalid permission pattern ({reason}): {pattern}"
 
         return True, "Valid permissions"
 
@@ -98,11 +195,34 @@ def validate_permissions(settings_file: Path) -> tuple[bool, str]:
         return False, f"Error validating permissions: {e}"
 
 
+def lint_permissions(settings_file: Path) -> tuple[bool, str]:
+    """Check settings.json for duplicate allow/deny entries and allows shadowed by denies."""
+    try:
+        with open(settings_file, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+
+        compiled = compile_permissions(settings.get('permissions', {}), settings_file.parent.parent)
+        problems = [
+            f"'{pattern}' is listed more than once in {list_name}"
+            for list_name, pattern in compiled.duplicates()
+        ]
+        problems.extend(
+            f"allow '{allow.source}' is shadowed by deny '{deny.source}'"
+            for allow, deny in compiled.shadowed()
+        )
+        if problems:
+            return False, '; '.join(problems)
+
+        return True, "No duplicate or shadowed rules"
+
+    except Exception as e:
+        return False, f"Error checking permission rules: {e}"
+
+
 def validate_mcp_config(mcp_file: Path) -> tuple[bool, str]:
     """Validate .mcp.json configuration."""
     try:
-        with open(mcp_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = McpConfigStore(mcp_file).read()
 
         if 'mcpServers' not in config:
             return False, "Missing 'mcpServers' key"
@@ -134,40 +254,125 @@ def validate_mcp_config(mcp_file: Path) -> tuple[bool, str]:
         return False, f"Error validating MCP config: {e}"
 
 
-def validate_project(project_path: str) -> bool:
+# Human-readable section headers for each validation phase, in run order.
+PHASES = {
+    'required-files': 'Checking required files...',
+    'json': 'Validating JSON files...',
+    'skills': 'Validating skills...',
+    'agents': 'Validating agents...',
+}
+
+
+class ProjectReport:
     """
-    Validate a Claude Code project.
+    Results of validating one project.
 
-    Returns:
-        True if validation passes, False otherwise
+    Every check appends a finding dict with phase, check id, file, status
+    ('pass', 'error', 'warning' or 'info'), message, a human-readable
+    text line and its duration. All output formats are rendered from
+    these findings.
     """
-    project_dir = Path(project_path).resolve()
 
-    if not project_dir.exists():
-        print(f"Error: Project directory does not exist: {project_dir}", file=sys.stderr)
-        return False
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self.findings = []
+        self.phase_seconds = {}
+        self.cache = {'enabled': False, 'hits': 0, 'misses': 0}
+        self.seconds = 0.0
+
+    def add(self, phase: str, check: str, file: str, status: str, message: str, text: str, seconds: float = 0.0):
+        self.findings.append({
+            'phase': phase,
+            'check': check,
+            'file': file,
+            'status': status,
+            'message': message,
+            'text': text,
+            'seconds': round(seconds, 6),
+        })
+
+    def run(self, check: str, file_path: Path, validator, cache: ValidationCache) -> tuple[bool, str, float]:
+        """Run one per-file validator through the cache and time it."""
+        started = time.perf_counter()
+        with tracing.span('validate.check', check=check, file=file_path) as span:
+            valid, message = cache.run(check, file_path, validator)
+            span.set(valid=valid)
+        return valid, message, time.perf_counter() - started
+
+    @property
+    def errors(self) -> list[dict]:
+        return [f for f in self.findings if f['status'] == 'error']
+
+    @property
+    def warnings(self) -> list[dict]:
+        return [f for f in self.findings if f['status'] == 'warning']
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    def check_seconds(self) -> dict:
+        """Total time spent in each check id."""
+        totals = {}
+        for finding in self.findings:
+            totals[finding['check']] = round(totals.get(finding['check'], 0.0) + finding['seconds'], 6)
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            'project': str(self.project_dir),
+            'success': self.success,
+            'errors': len(self.errors),
+            'warnings': len(self.warnings),
+            'findings': self.findings,
+            'timings': {
+                'total': round(self.seconds, 6),
+                'phases': self.phase_seconds,
+                'checks': self.check_seconds(),
+            },
+            'cache': self.cache,
+        }
+
+
+def collect_project_report(project_dir: Path, use_cache: bool = True, cache: ValidationCache = None) -> ProjectReport:
+    """
+    Run every validation check on a project and collect the results.
 
-    print(f"Validating project: {project_dir}\n")
+    Args:
+        project_dir: Resolved path to an existing project directory
+        use_cache: Reuse results for files unchanged since the last run
+        cache: ValidationCache of project_dir kept from earlier runs
+            (default: load it from the project's cache file)
 
-    errors = []
-    warnings = []
+    Returns:
+        ProjectReport with one finding per check
+    """
+    report = ProjectReport(project_dir)
+    if cache is None:
+        cache = ValidationCache(project_dir, enabled=use_cache)
+    hits, misses = cache.hits, cache.misses
+    started = time.perf_counter()
 
     # Check required files
+    phase = 'required-files'
+    phase_started = time.perf_counter()
     required_files = [
         '.claude/settings.json',
         '.claude/CLAUDE.md'
     ]
 
-    print("Checking required files...")
     for file_rel in required_files:
         file_path = project_dir / file_rel
         if not file_path.exists():
-            errors.append(f"Missing required file: {file_rel}")
+            report.add(phase, 'required-file', file_rel, 'error', 'Missing required file',
+                       f"Missing required file: {file_rel}")
         else:
-            print(f"  ✓ {file_rel}")
+            report.add(phase, 'required-file', file_rel, 'pass', 'Present', f"  ✓ {file_rel}")
+    report.phase_seconds[phase] = round(time.perf_counter() - phase_started, 6)
 
     # Validate JSON files
-    print("\nValidating JSON files...")
+    phase = 'json'
+    phase_started = time.perf_counter()
     json_files = [
         '.claude/settings.json',
         '.mcp.json'
@@ -176,97 +381,377 @@ def validate_project(project_path: str) -> bool:
     for file_rel in json_files:
         file_path = project_dir / file_rel
         if file_path.exists():
-            valid, message = validate_json(file_path)
+            valid, message, seconds = report.run('json-syntax', file_path, validate_json, cache)
             if valid:
-                print(f"  ✓ {file_rel}: {message}")
+                report.add(phase, 'json-syntax', file_rel, 'pass', message, f"  ✓ {file_rel}: {message}", seconds)
 
                 # Additional validation for specific files
                 if file_rel == '.claude/settings.json':
-                    valid_perms, perms_message = validate_permissions(file_path)
-                    if valid_perms:
-                        print(f"    ✓ Permissions: {perms_message}")
+                    valid, message, seconds = report.run('permissions', file_path, validate_permissions, cache)
+                    if valid:
+                        report.add(phase, 'permissions', file_rel, 'pass', message,
+                                   f"    ✓ Permissions: {message}", seconds)
+
+                        valid, message, seconds = report.run('permission-rules', file_path, lint_permissions, cache)
+                        if valid:
+                            report.add(phase, 'permission-rules', file_rel, 'pass', message,
+                                       f"    ✓ Permission rules: {message}", seconds)
+                        else:
+                            report.add(phase, 'permission-rules', file_rel, 'warning', message,
+                                       f"{file_rel}: {message}", seconds)
                     else:
-                        errors.append(f"{file_rel}: {perms_message}")
+                        report.add(phase, 'permissions', file_rel, 'error', message, f"{file_rel}: {message}", seconds)
 
                 elif file_rel == '.mcp.json':
-                    valid_mcp, mcp_message = validate_mcp_config(file_path)
-                    if valid_mcp:
-                        print(f"    ✓ MCP config: {mcp_message}")
+                    valid, message, seconds = report.run('mcp-config', file_path, validate_mcp_config, cache)
+                    if valid:
+                        report.add(phase, 'mcp-config', file_rel, 'pass', message,
+                                   f"    ✓ MCP config: {message}", seconds)
                     else:
-                        errors.append(f"{file_rel}: {mcp_message}")
+                        report.add(phase, 'mcp-config', file_rel, 'error', message, f"{file_rel}: {message}", seconds)
             else:
-                errors.append(f"{file_rel}: {message}")
+                report.add(phase, 'json-syntax', file_rel, 'error', message, f"{file_rel}: {message}", seconds)
+    report.phase_seconds[phase] = round(time.perf_counter() - phase_started, 6)
 
     # Validate skills
-    print("\nValidating skills...")
+    phase = 'skills'
+    phase_started = time.perf_counter()
     skills_dir = project_dir / '.claude' / 'skills'
     if skills_dir.exists():
-        skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir()]
+        skill_dirs = sorted(d for d in skills_dir.iterdir() if d.is_dir())
         if skill_dirs:
             for skill_dir in skill_dirs:
                 skill_md = skill_dir / 'SKILL.md'
+                file_rel = skill_md.relative_to(project_dir).as_posix()
                 if skill_md.exists():
-                    valid, message = validate_yaml_frontmatter(skill_md)
+                    valid, message, seconds = report.run('skill-frontmatter', skill_md,
+                                                         validate_yaml_frontmatter, cache)
                     if valid:
-                        print(f"  ✓ {skill_dir.name}/SKILL.md: {message}")
+                        report.add(phase, 'skill-frontmatter', file_rel, 'pass', message,
+                                   f"  ✓ {skill_dir.name}/SKILL.md: {message}", seconds)
                     else:
-                        errors.append(f"Skill '{skill_dir.name}': {message}")
+                        report.add(phase, 'skill-frontmatter', file_rel, 'error', message,
+                                   f"Skill '{skill_dir.name}': {message}", seconds)
                 else:
-                    warnings.append(f"Skill '{skill_dir.name}' missing SKILL.md")
+                    report.add(phase, 'skill-missing', file_rel, 'warning', 'Missing SKILL.md',
+                               f"Skill '{skill_dir.name}' missing SKILL.md")
         else:
-            print("  No skills found")
+            report.add(phase, 'skills-present', '.claude/skills', 'info', 'No skills found', "  No skills found")
     else:
-        print("  Skills directory does not exist")
+        report.add(phase, 'skills-present', '.claude/skills', 'info', 'Skills directory does not exist',
+                   "  Skills directory does not exist")
+    report.phase_seconds[phase] = round(time.perf_counter() - phase_started, 6)
 
     # Validate agents
-    print("\nValidating agents...")
+    phase = 'agents'
+    phase_started = time.perf_counter()
     agents_dir = project_dir / '.claude' / 'agents'
     if agents_dir.exists():
-        agent_files = list(agents_dir.glob('*.md'))
+        agent_files = sorted(agents_dir.glob('*.md'))
         if agent_files:
             for agent_file in agent_files:
-                valid, message = validate_yaml_frontmatter(agent_file)
+                file_rel = agent_file.relative_to(project_dir).as_posix()
+                valid, message, seconds = report.run('agent-frontmatter', agent_file,
+                                                     validate_yaml_frontmatter, cache)
                 if valid:
-                    print(f"  ✓ {agent_file.name}: {message}")
+                    report.add(phase, 'agent-frontmatter', file_rel, 'pass', message,
+                               f"  ✓ {agent_file.name}: {message}", seconds)
                 else:
-                    errors.append(f"Agent '{agent_file.name}': {message}")
+                    report.add(phase, 'agent-frontmatter', file_rel, 'error', message,
+                               f"Agent '{agent_file.name}': {message}", seconds)
         else:
-            print("  No agents found")
+            report.add(phase, 'agents-present', '.claude/agents', 'info', 'No agents found', "  No agents found")
     else:
-        print("  Agents directory does not exist")
+        report.add(phase, 'agents-present', '.claude/agents', 'info', 'Agents directory does not exist',
+                   "  Agents directory does not exist")
+    report.phase_seconds[phase] = round(time.perf_counter() - phase_started, 6)
 
-    # Print summary
-    print("\n" + "="*60)
+    if cache.enabled:
+        cache.save()
+        report.cache = {'enabled': True, 'hits': cache.hits - hits, 'misses': cache.misses - misses}
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def format_summary(report: ProjectReport) -> str:
+    """The error/warning summary section of the human-readable report."""
+    lines = []
+    errors = report.errors
+    warnings = report.warnings
     if errors:
-        print(f"\n❌ Validation failed with {len(errors)} error(s):\n")
-        for error in errors:
-            print(f"  • {error}")
+        lines.append(f"\n❌ Validation failed with {len(errors)} error(s):\n")
+        lines.extend(f"  • {error['text']}" for error in errors)
 
     if warnings:
-        print(f"\n⚠️  {len(warnings)} warning(s):\n")
-        for warning in warnings:
-            print(f"  • {warning}")
+        lines.append(f"\n⚠️  {len(warnings)} warning(s):\n")
+        lines.extend(f"  • {warning['text']}" for warning in warnings)
 
     if not errors and not warnings:
-        print("\n✓ All validations passed!")
+        lines.append("\n✓ All validations passed!")
+
+    if report.cache['enabled']:
+        lines.append(f"\nCache: {report.cache['hits']} hit(s), {report.cache['misses']} miss(es)")
+
+    return '\n'.join(lines)
 
-    return len(errors) == 0
 
+def format_human(report: ProjectReport) -> str:
+    """Render a project report in the human-readable layout."""
+    lines = [f"Validating project: {report.project_dir}\n"]
+    for index, (phase, header) in enumerate(PHASES.items()):
+        lines.append(('\n' if index else '') + header)
+        for finding in report.findings:
+            if finding['phase'] == phase and finding['status'] in ('pass', 'info'):
+                lines.append(finding['text'])
 
-def main():
+    lines.append("\n" + "="*60)
+    lines.append(format_summary(report))
+    return '\n'.join(lines)
+
+
+def format_json(reports: list[ProjectReport]) -> str:
+    """Render project reports as a JSON document."""
+    return json.dumps({
+        'success': all(r.success for r in reports),
+        'projects': [r.to_dict() for r in reports],
+    }, indent=2)
+
+
+def format_junit(reports: list[ProjectReport]) -> str:
+    """
+    Render project reports as JUnit XML.
+
+    Each project is a test suite and each check on a file a test case;
+    errors are failures and warnings are reported in system-out.
+    """
+    root = ET.Element('testsuites', {
+        'name': 'validate_project',
+        'tests': str(sum(len(r.findings) for r in reports)),
+        'failures': str(sum(len(r.errors) for r in reports)),
+        'time': f"{sum(r.seconds for r in reports):.6f}",
+    })
+    for report in reports:
+        suite = ET.SubElement(root, 'testsuite', {
+            'name': str(report.project_dir),
+            'tests': str(len(report.findings)),
+            'failures': str(len(report.errors)),
+            'time': f"{report.seconds:.6f}",
+        })
+        for finding in report.findings:
+            case = ET.SubElement(suite, 'testcase', {
+                'classname': f"{finding['phase']}.{finding['check']}",
+                'name': finding['file'],
+                'time': f"{finding['seconds']:.6f}",
+            })
+            if finding['status'] == 'error':
+                failure = ET.SubElement(case, 'failure', {'type': finding['check'], 'message': finding['message']})
+                failure.text = finding['text']
+            elif finding['status'] == 'warning':
+                ET.SubElement(case, 'system-out').text = f"warning: {finding['text']}"
+    ET.indent(root)
+    return ET.tostring(root, encoding='unicode', xml_declaration=True)
+
+
+def format_sarif(reports: list[ProjectReport]) -> str:
+    """Render the errors and warnings of project reports as SARIF 2.1.0."""
+    results = []
+    rules = set()
+    for report in reports:
+        for finding in report.findings:
+            if finding['status'] not in ('error', 'warning'):
+                continue
+            rules.add(finding['check'])
+            results.append({
+                'ruleId': finding['check'],
+                'level': finding['status'],
+                'message': {'text': finding['message']},
+                'locations': [{
+                    'physicalLocation': {
+                        'artifactLocation': {'uri': (report.project_dir / finding['file']).as_uri()}
+                    }
+                }],
+            })
+
+    sarif = {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {
+                'name': 'validate_project',
+                'rules': [{'id': rule} for rule in sorted(rules)],
+            }},
+            'results': results,
+            'invocations': [{
+                'executionSuccessful': True,
+                'properties': {'timings': {str(r.project_dir): r.to_dict()['timings'] for r in reports}},
+            }],
+        }],
+    }
+    return json.dumps(sarif, indent=2)
+
+
+FORMATTERS = {
+    'json': format_json,
+    'junit': format_junit,
+    'sarif': format_sarif,
+}
+
+
+def validate_project(project_path: str, use_cache: bool = True, output_format: str = 'human') -> bool:
+    """
+    Validate a Claude Code project.
+
+    Args:
+        project_path: Path to the project
+        use_cache: Reuse results for files unchanged since the last run
+        output_format: 'human', 'json', 'junit' or 'sarif'
+
+    Returns:
+        True if validation passes, False otherwise
+    """
+    project_dir = Path(project_path).resolve()
+
+    if not project_dir.exists():
+        print(f"Error: Project directory does not exist: {project_dir}", file=sys.stderr)
+        return False
+
+    with tracing.span('validate.project', project=project_dir):
+        report = collect_project_report(project_dir, use_cache=use_cache)
+    if output_format == 'human':
+        print(format_human(report))
+    else:
+        print(FORMATTERS[output_format]([report]))
+
+    return report.success
+
+
+def find_projects(root: Path) -> list[Path]:
+    """
+    Find every directory under root containing .claude/settings.json.
+
+    Walks with os.scandir in a single pass, without following symlinks and
+    without descending into PRUNED_DIRS.
+    """
+    projects = []
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name == '.claude' and os.path.isfile(os.path.join(entry.path, 'settings.json')):
+                projects.append(Path(directory))
+            if entry.name not in PRUNED_DIRS:
+                stack.append(entry.path)
+    return sorted(projects)
+
+
+def validate_tree(root: str, use_cache: bool = True, jobs: int = None, output_format: str = 'human') -> bool:
+    """
+    Validate every Claude Code project found under root in parallel.
+
+    Args:
+        root: Directory to search for projects
+        use_cache: Reuse per-file results for unchanged files
+        jobs: Worker processes (default: CPU count)
+        output_format: 'human', 'json', 'junit' or 'sarif'
+
+    Returns:
+        True if every project passes, False otherwise
+    """
+    root_dir = Path(root).resolve()
+    if not root_dir.is_dir():
+        print(f"Error: Directory does not exist: {root_dir}", file=sys.stderr)
+        return False
+
+    projects = find_projects(root_dir)
+    human = output_format == 'human'
+    if not projects and human:
+        print(f"No Claude Code projects found under {root_dir}")
+        return True
+
+    if human:
+        print(f"Validating {len(projects)} project(s) under {root_dir}\n")
+
+    with tracing.span('validate.tree', projects=len(projects)), ProcessPoolExecutor(max_workers=jobs) as pool:
+        reports = list(pool.map(collect_project_report, projects, [use_cache] * len(projects)))
+
+    if not human:
+        print(FORMATTERS[output_format](reports))
+        return all(r.success for r in reports)
+
+    for report in reports:
+        print(f"  {'✓' if report.success else '✗'} {report.project_dir} (exit {0 if report.success else 1})")
+
+    # Show the summary section of each failing project's report
+    failed = [r for r in reports if not r.success]
+    for report in failed:
+        print("\n" + "="*60)
+        print(f"{report.project_dir}")
+        print(format_summary(report).strip())
+
+    print("\n" + "="*60)
+    print(f"\n{len(reports) - len(failed)} passed, {len(failed)} failed")
+    return not failed
+
+
+def main(argv: list[str] = None):
     parser = argparse.ArgumentParser(
         description='Validate a Claude Code project structure and configuration'
     )
 
     parser.add_argument(
         'path',
+        nargs='?',
         help='Path to the Claude Code project to validate'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--recursive',
+        metavar='ROOT',
+        help='Validate every project (directory with .claude/settings.json) under ROOT'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Worker processes for --recursive (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['human', 'json', 'junit', 'sarif'],
+        default='human',
+        help='Output format (default: human)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Validate every file instead of reusing cached results'
+    )
+
+    tracing.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    with tracing.session(args.trace, args.profile):
+        if args.recursive:
+            success = validate_tree(args.recursive, use_cache=not args.no_cache, jobs=args.jobs,
+                                    output_format=args.format)
+            sys.exit(0 if success else 1)
+
+        if not args.path:
+            parser.error("a project path or --recursive ROOT is required")
 
-    success = validate_project(args.path)
-    sys.exit(0 if success else 1)
+        success = validate_project(args.path, use_cache=not args.no_cache, output_format=args.format)
+        sys.exit(0 if success else 1)
 
 
 if __name__ == '__main__':
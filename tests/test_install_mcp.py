@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP server installation
+
+Runs batch installs through FakeCliBackend (no `claude` process is
+started) and NativeBackend against a temporary .mcp.json.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from install_mcp import FakeCliBackend, NativeBackend, build_server_config, install_mcp_servers, load_servers_file  # noqa: E402
+from mcp_config import McpConfigStore  # noqa: E402
+
+
+SERVERS = [
+    {'name': 'github', 'transport': 'http', 'url': 'https://api.githubcopilot.com/mcp/'},
+    {'name': 'postgres', 'transport': 'stdio', 'command': 'npx',
+     'args': ['-y', '@modelcontextprotocol/server-postgres'], 'env': {'PGHOST': 'localhost'}},
+    {'name': 'events', 'transport': 'sse', 'url': 'https://events.example/sse'},
+    {'name': 'broken', 'transport': 'stdio'},  # no command
+    {'name': 'flaky', 'transport': 'http', 'url': 'https://flaky.example/mcp'},
+]
+
+
+def expected_config(server: dict) -> dict:
+    return build_server_config(
+        server['transport'], server.get('url'), server.get('command'), server.get('args'), server.get('env')
+    )
+
+
+class InstallServersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.tmp.name) / '.mcp.json'
+        self.report_path = Path(self.tmp.name) / 'report.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def install(self, servers: list[dict], backend, **kwargs) -> bool:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return install_mcp_servers(
+                servers, config_path=str(self.config_path), report_path=str(self.report_path),
+                backend=backend, **kwargs
+            )
+
+    def read_config(self) -> dict:
+        return json.loads(self.config_path.read_text(encoding='utf-8'))['mcpServers']
+
+    def test_batch_results_per_server(self):
+        backend = FakeCliBackend(fail=['flaky'])
+        self.assertFalse(self.install(SERVERS, backend, workers=3))
+
+        report = json.loads(self.report_path.read_text(encoding='utf-8'))
+        self.assertEqual(report['backend'], 'fake')
+        results = {r['name']: r for r in report['servers']}
+        self.assertEqual([r['name'] for r in report['servers']], [s['name'] for s in SERVERS])
+        self.assertEqual({name: r['success'] for name, r in results.items()},
+                         {'github': True, 'postgres': True, 'events': True, 'broken': False, 'flaky': False})
+        self.assertIn('Command required', results['broken']['error'])
+        self.assertIn('simulated failure', results['flaky']['error'])
+
+        # Every valid server got a `claude mcp add --scope project` command
+        self.assertEqual(sorted(cmd[cmd.index('--transport') + 2] for cmd in backend.commands),
+                         ['events', 'flaky', 'github', 'postgres'])
+        for cmd in backend.commands:
+            self.assertEqual(cmd[:5], ['claude', 'mcp', 'add', '--scope', 'project'])
+
+        # Only the servers that installed are written
+        self.assertEqual(self.read_config(), {s['name']: expected_config(s) for s in SERVERS[:3]})
+
+    def test_config_written_once(self):
+        with mock.patch.object(McpConfigStore, '_write', autospec=True, side_effect=McpConfigStore._write) as write:
+            self.assertTrue(self.install(SERVERS[:3], FakeCliBackend(), workers=3))
+        self.assertEqual(write.call_count, 1)
+
+        # Nothing changed: no write at all
+        with mock.patch.object(McpConfigStore, '_write', autospec=True, side_effect=McpConfigStore._write) as write:
+            self.assertTrue(self.install(SERVERS[:3], FakeCliBackend(), workers=3))
+        self.assertEqual(write.call_count, 0)
+
+    def test_dry_run_writes_nothing(self):
+        self.assertTrue(self.install(SERVERS[:3], FakeCliBackend(), dry_run=True))
+        self.assertFalse(self.config_path.exists())
+
+    def test_native_backend_writes_build_server_config(self):
+        self.assertTrue(self.install(SERVERS[:3], NativeBackend()))
+        self.assertEqual(self.read_config(), {s['name']: expected_config(s) for s in SERVERS[:3]})
+
+    def test_native_matches_fake(self):
+        self.install(SERVERS[:3], FakeCliBackend())
+        fake = self.read_config()
+        self.config_path.unlink()
+        self.install(SERVERS[:3], NativeBackend())
+        self.assertEqual(self.read_config(), fake)
+
+    def test_existing_servers_are_kept(self):
+        self.config_path.write_text(json.dumps({'mcpServers': {'local': {'type': 'stdio', 'command': 'x'}}}))
+        self.install(SERVERS[:1], NativeBackend())
+        self.assertEqual(set(self.read_config()), {'local', 'github'})
+
+
+class LoadServersFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.servers_file = Path(self.tmp.name) / 'servers.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self, data) -> list[dict]:
+        self.servers_file.write_text(json.dumps(data), encoding='utf-8')
+        return load_servers_file(self.servers_file)
+
+    def test_list_and_mcp_servers_forms(self):
+        self.assertEqual(self.load(SERVERS), SERVERS)
+        servers = self.load({'mcpServers': {'github': expected_config(SERVERS[0])}})
+        self.assertEqual([(s['name'], s['transport'], s['url']) for s in servers],
+                         [('github', 'http', SERVERS[0]['url'])])
+
+    def test_bad_entries_name_their_index(self):
+        for entry in ('github', None, {'transport': 'stdio'}, {'name': ''}, {'name': 3}):
+            with self.assertRaisesRegex(ValueError, r'^server 1: '):
+                self.load([SERVERS[0], entry])
+
+    def test_bad_mcp_servers_config(self):
+        with self.assertRaisesRegex(ValueError, "server 'github'"):
+            self.load({'mcpServers': {'github': 'https://example.com'}})
+        with self.assertRaises(ValueError):
+            self.load({'mcpServers': []})
+
+
+class McpConfigStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lock_is_beside_the_config(self):
+        store = McpConfigStore(self.dir / 'custom.json')
+        store.update_servers({'github': expected_config(SERVERS[0])})
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ['.custom.json.lock', 'custom.json'])
+        self.assertEqual(McpConfigStore(self.dir / '.mcp.json').lock_path, self.dir / '.mcp.json.lock')
+
+    def test_non_object_config_is_rejected(self):
+        for content in ('[]', '"text"', '{"mcpServers": []}'):
+            config_path = self.dir / '.mcp.json'
+            config_path.write_text(content, encoding='utf-8')
+            with self.assertRaises(ValueError):
+                McpConfigStore(config_path).update_servers({'github': expected_config(SERVERS[0])})
+            self.assertEqual(config_path.read_text(encoding='utf-8'), content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the registry fetcher
+
+Runs fetch_sources offline against a local http.server fixture that
+serves a paginated registry with ETag and Last-Modified validators, and
+checks that a second run only revalidates.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from registry_fetch import fetch_sources  # noqa: E402
+
+
+LAST_MODIFIED = 'Wed, 01 Jan 2025 00:00:00 GMT'
+
+# cursor -> (page body, ETag, Last-Modified); pages carry one or both validators
+PAGES = {
+    None: ({'servers': [{'server': {'name': 'alpha', 'description': 'First',
+                                    'packages': [{'registryType': 'npm', 'identifier': 'alpha-mcp'}]}}],
+            'metadata': {'nextCursor': 'p2'}}, '"page-1"', None),
+    'p2': ({'servers': [{'name': 'beta', 'description': 'Second',
+                         'remotes': [{'type': 'sse', 'url': 'https://beta.example/sse'}]}],
+            'metadata': {'nextCursor': 'p3'}}, None, LAST_MODIFIED),
+    'p3': ({'servers': [{'name': 'gamma', 'description': 'Third'}], 'metadata': {}}, '"page-3"', LAST_MODIFIED),
+}
+
+
+class RegistryHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, as the registry serves it
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        cursor = parse_qs(parts.query).get('cursor', [None])[0]
+        self.server.requests.append((parts.path, cursor, {k.lower(): v for k, v in self.headers.items()}))
+        if parts.path != '/v0/servers' or cursor not in PAGES:
+            self._reply(404, {}, b'')
+            return
+
+        page, etag, last_modified = PAGES[cursor]
+        validators = {}
+        if etag:
+            validators['ETag'] = etag
+        if last_modified:
+            validators['Last-Modified'] = last_modified
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            fresh = if_none_match == etag
+        else:
+            fresh = last_modified is not None and self.headers.get('If-Modified-Since') == last_modified
+        if fresh:
+            self._reply(304, validators, b'')
+        else:
+            self._reply(200, dict(validators, **{'Content-Type': 'application/json'}), json.dumps(page).encode('utf-8'))
+
+    def _reply(self, status: int, headers: dict, body: bytes):
+        self.server.statuses.append(status)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchSourcesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RegistryHandler)
+        self.server.requests = []
+        self.server.statuses = []
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v0/servers"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name) / 'http-cache'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def fetch(self, **kwargs):
+        self.server.requests.clear()
+        self.server.statuses.clear()
+        return fetch_sources([self.url], cache_dir=self.cache_dir, **kwargs)
+
+    def test_follows_pages(self):
+        servers, stats = self.fetch()
+        self.assertEqual([s['name'] for s in servers], ['alpha', 'beta', 'gamma'])
+        self.assertEqual(servers[0]['install'], 'npx -y alpha-mcp')
+        self.assertEqual(servers[1]['config'], {'type': 'sse', 'url': 'https://beta.example/sse'})
+        self.assertEqual([cursor for _path, cursor, _headers in self.server.requests], [None, 'p2', 'p3'])
+        self.assertEqual((stats.fetched, stats.not_modified, stats.failed), (3, 0, 0))
+
+    def test_second_run_sends_only_conditional_requests(self):
+        first, _stats = self.fetch()
+        for _path, _cursor, headers in self.server.requests:
+            self.assertNotIn('if-none-match', headers)
+            self.assertNotIn('if-modified-since', headers)
+
+        second, stats = self.fetch()
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.server.requests), 3)
+        for _path, cursor, headers in self.server.requests:
+            _page, etag, last_modified = PAGES[cursor]
+            self.assertEqual(headers.get('if-none-match'), etag)
+            self.assertEqual(headers.get('if-modified-since'), last_modified)
+        self.assertEqual(self.server.statuses, [304, 304, 304])
+        self.assertEqual((stats.fetched, stats.not_modified, stats.failed), (0, 3, 0))
+
+    def test_without_cache_nothing_is_conditional(self):
+        self.fetch()
+        _servers, stats = self.fetch(use_cache=False)
+        self.assertEqual(self.server.statuses, [200, 200, 200])
+        self.assertEqual(stats.fetched, 3)
+
+    def test_failed_source(self):
+        missing = self.url.replace('/v0/servers', '/missing')
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            servers, stats = fetch_sources([missing, self.url], cache_dir=self.cache_dir)
+        self.assertIn('HTTP 404', errors.getvalue())
+        self.assertEqual(len(servers), 3)
+        self.assertEqual(stats.failed_sources, [missing])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the Markdown registry round trip
+
+Checks that servers rendered by registry_store read back unchanged with
+registry_markdown, and that hand edits to the rendered registry are
+imported field by field.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from registry_markdown import format_value, load_registry_markdown, parse_registry_markdown  # noqa: E402
+from registry_store import RegistryStore, render_markdown_body  # noqa: E402
+
+
+GUIDE = ROOT / 'docs' / 'mcp-server-guide.md'
+
+
+def round_trip(servers: list[dict]) -> list[dict]:
+    return parse_registry_markdown(render_markdown_body(servers).splitlines())
+
+
+def server(name: str, **fields) -> dict:
+    return dict({'name': name, 'category': 'Development', 'purpose': 'Does things', 'transport': 'stdio'}, **fields)
+
+
+class RoundTripTest(unittest.TestCase):
+
+    def assertRoundTrips(self, entry: dict):
+        self.assertEqual(round_trip([entry]), [entry])
+
+    def test_plain_fields(self):
+        self.assertRoundTrips(server(
+            'github', install='npx -y @modelcontextprotocol/server-github',
+            use_cases='Issues, pull requests', docs='https://github.com', required='GITHUB_TOKEN'
+        ))
+
+    def test_config(self):
+        self.assertRoundTrips(server('db', config={'command': 'npx', 'args': ['-y', 'db'], 'env': {}}))
+
+    def test_multi_line_fields(self):
+        self.assertRoundTrips(server('multi', purpose='Line one\nLine two', use_cases='a\n\nb\n'))
+        self.assertRoundTrips(server('crlf', purpose='Line one\r\nLine two'))
+
+    def test_empty_fields(self):
+        self.assertRoundTrips(server('empty', purpose='', docs='', install=''))
+
+    def test_surrounding_whitespace(self):
+        self.assertRoundTrips(server('spaces', purpose='trailing  ', use_cases='  leading', install='npx x '))
+
+    def test_quoted_values(self):
+        self.assertRoundTrips(server('quotes', purpose='"Quoted" at the start', docs='"'))
+
+    def test_plain_values_stay_readable(self):
+        self.assertEqual(format_value('Plain text'), 'Plain text')
+        self.assertIn('- **Install**: `npx x`\n', render_markdown_body([server('x', install='npx x')]))
+
+    def test_empty_purpose_is_kept(self):
+        servers = parse_registry_markdown([
+            '## Development', '', '### blank', '', '- **Purpose**:', '- **Transport**: stdio',
+        ])
+        self.assertEqual(servers, [server('blank', purpose='')])
+
+    def test_server_guide(self):
+        servers = load_registry_markdown(GUIDE)
+        self.assertTrue(servers)
+
+        def key(entry):
+            return entry['category'], entry['name']
+
+        self.assertEqual(sorted(round_trip(servers), key=key), sorted(servers, key=key))
+
+
+class ImportLocalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry = Path(self.tmp.name) / 'mcp_servers.md'
+        self.store = RegistryStore(Path(self.tmp.name) / 'mcp_servers.db')
+        self.servers = [
+            server('multi', purpose='Line one\nLine two'),
+            server('spaces', purpose='trailing  '),
+            server('empty', purpose=''),
+            server('plain', docs='https://example.com'),
+        ]
+        self.store.upsert(self.servers, source='web')
+        self.store.write_markdown(self.registry)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def edit(self, old: str, new: str):
+        text = self.registry.read_text(encoding='utf-8')
+        self.assertIn(old, text)
+        time.sleep(0.01)  # a new mtime even on coarse clocks
+        self.registry.write_text(text.replace(old, new), encoding='utf-8')
+
+    def test_touch_imports_nothing(self):
+        self.edit('# MCP Server Registry', '# MCP Server Registry')
+        self.assertEqual(self.store.sync_markdown(self.registry), {'inserted': 0, 'customized': 0, 'unchanged': 4})
+        for entry in self.servers:
+            self.assertEqual(self.store.get(entry['name']), entry)
+
+    def test_edit_applies_only_changed_fields(self):
+        self.edit('- **Purpose**: Does things\n- **Transport**: stdio\n- **Docs**', '- **Purpose**: Edited\n- **Transport**: stdio\n- **Docs**')
+        self.assertEqual(self.store.sync_markdown(self.registry)['customized'], 1)
+        self.assertEqual(self.store.get('plain'), dict(self.servers[3], purpose='Edited', custom=True))
+        self.assertEqual(self.store.get('multi'), self.servers[0])
+
+        counts = self.store.upsert([dict(self.servers[0], purpose='Fetched'), dict(self.servers[3], purpose='Fetched')])
+        self.assertEqual((counts['updated'], counts['kept_custom']), (1, 1))
+
+    def test_removed_field(self):
+        self.edit('- **Docs**: https://example.com\n', '')
+        self.store.sync_markdown(self.registry)
+        self.assertNotIn('docs', self.store.get('plain'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for compiled template bundles
+
+Checks that get_bundle reuses the open bundle of an unchanged template
+and drops, closes and deletes the previous bundle when it changes.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import template_bundle  # noqa: E402
+from template_bundle import get_bundle  # noqa: E402
+
+
+class GetBundleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.template_dir = root / 'demo'
+        self.template_dir.mkdir()
+        (self.template_dir / 'README.md.template').write_text('# {{PROJECT_NAME}}\n', encoding='utf-8')
+        self.cache_dir = root / 'cache'
+
+    def tearDown(self):
+        for key in [key for key in template_bundle._open_bundles if key[0] == str(self.cache_dir)]:
+            template_bundle._open_bundles.pop(key).close()
+        self.tmp.cleanup()
+
+    def change_template(self, text: str):
+        (self.template_dir / 'README.md.template').write_text(text, encoding='utf-8')
+
+    def open_bundles(self) -> list:
+        return [bundle for key, bundle in template_bundle._open_bundles.items() if key[0] == str(self.cache_dir)]
+
+    def test_unchanged_template_reuses_bundle(self):
+        bundle = get_bundle(self.template_dir, self.cache_dir)
+        self.assertIs(get_bundle(self.template_dir, self.cache_dir), bundle)
+
+    def test_changed_template_closes_previous_bundle(self):
+        old = get_bundle(self.template_dir, self.cache_dir)
+        old_path, old_map = old.path, old._map
+        del old
+
+        self.change_template('# {{PROJECT_NAME}} v2\n')
+        new = get_bundle(self.template_dir, self.cache_dir)
+        self.assertNotEqual(new.path, old_path)
+        self.assertTrue(old_map.closed)
+        self.assertFalse(old_path.exists())
+        self.assertEqual(self.open_bundles(), [new])
+        self.assertEqual(new.render(new.files[0], {'PROJECT_NAME': 'x'}), b'# x v2\n')
+
+    def test_previous_bundle_stays_usable_while_held(self):
+        old = get_bundle(self.template_dir, self.cache_dir)
+        self.change_template('# {{PROJECT_NAME}} v2\n')
+        get_bundle(self.template_dir, self.cache_dir)
+        self.assertEqual(old.render(old.files[0], {'PROJECT_NAME': 'x'}), b'# x\n')
+        old_map = old._map
+        del old
+        self.assertTrue(old_map.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for template rendering
+
+Checks {{PLACEHOLDER}} substitution and that batch manifests reject
+variable names no placeholder can refer to.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from init_project import load_batch_manifest  # noqa: E402
+from template_engine import check_variable_names, compile_template, render  # noqa: E402
+
+
+class RenderTest(unittest.TestCase):
+
+    def test_substitutes_known_variables(self):
+        self.assertEqual(render(compile_template('{{NAME}} / {{_x1}}'), {'NAME': 'demo', '_x1': 'y'}), 'demo / y')
+
+    def test_unknown_placeholders_are_kept(self):
+        self.assertEqual(render(compile_template('{{NAME}} {{OTHER}}'), {'NAME': 'demo'}), 'demo {{OTHER}}')
+
+    def test_check_variable_names(self):
+        check_variable_names({'PROJECT_NAME': 'x', '_private': 'y'})
+        with self.assertRaisesRegex(ValueError, 'api-key, db.host'):
+            check_variable_names({'db.host': 'x', 'api-key': 'y', 'OK': 'z'})
+        with self.assertRaises(ValueError):
+            check_variable_names({'1st': 'x'})
+
+
+class BatchManifestTest(unittest.TestCase):
+
+    def test_invalid_variable_names_are_reported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / 'projects.jsonl'
+            manifest.write_text(
+                '{"path": "a", "template": "base", "name": "A", "variables": {"api-key": "x"}}\n'
+                '{"path": "b", "template": "base", "name": "B", "variables": {"API_KEY": "x"}}\n',
+                encoding='utf-8'
+            )
+            first, second = load_batch_manifest(manifest)
+        self.assertIn('api-key', first['error'])
+        self.assertNotIn('error', second)
+
+
+if __name__ == '__main__':
+    unittest.main()
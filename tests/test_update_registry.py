@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for registry reads and refreshes
+
+Checks that open_registry reads the store read-only, without waiting on
+a refresh that holds the write lock, and that the refresh is what reads
+hand edits to the Markdown registry back in. No network access: every
+source is made not due, and background refreshes are disabled.
+
+    python3 -m unittest discover tests
+
+Uses only Python standard library.
+"""
+
+import contextlib
+import io
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from registry_store import RegistryStore, registry_header, render_markdown_body  # noqa: E402
+from update_registry import open_registry, update_registry  # noqa: E402
+
+
+SOURCE = 'http://127.0.0.1:9/v0/servers'
+SERVERS = [
+    {'name': 'github', 'category': 'Development', 'purpose': 'GitHub issues and pull requests', 'transport': 'http'},
+    {'name': 'postgres', 'category': 'Data', 'purpose': 'Query databases', 'transport': 'stdio'},
+]
+
+
+class OpenRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry = Path(self.tmp.name) / 'mcp_servers.md'
+        self.registry.write_text(registry_header() + render_markdown_body(SERVERS), encoding='utf-8')
+        self.store_path = self.registry.with_suffix('.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def open(self) -> RegistryStore:
+        return open_registry(self.registry, refresh=False)
+
+    def edit_registry(self):
+        time.sleep(0.01)  # a new mtime even on coarse clocks
+        text = self.registry.read_text(encoding='utf-8')
+        self.registry.write_text(text.replace('Query databases', 'Edited'), encoding='utf-8')
+
+    def test_first_open_fills_the_store(self):
+        with self.open() as store:
+            self.assertTrue(store.read_only)
+            self.assertEqual(sorted(s['name'] for s in store.servers()), ['github', 'postgres'])
+            self.assertTrue(store.search_index_complete())
+            with self.assertRaises(sqlite3.OperationalError):
+                store.set_meta('x', 'y')
+
+    def test_open_does_not_wait_for_a_refresh(self):
+        self.open().close()
+        self.edit_registry()  # would need a write to read back in
+        writer = sqlite3.connect(self.store_path, timeout=30)
+        try:
+            writer.execute('BEGIN IMMEDIATE')
+            writer.execute("INSERT INTO meta (key, value) VALUES ('refreshing', '1')")
+            started = time.perf_counter()
+            with self.open() as store:
+                self.assertEqual(store.count(), 2)
+            self.assertLess(time.perf_counter() - started, 5)
+        finally:
+            writer.rollback()
+            writer.close()
+
+    def test_hand_edits_are_left_to_the_refresh(self):
+        self.open().close()
+        self.edit_registry()
+        with self.open() as store:
+            self.assertTrue(store.markdown_edited(self.registry))
+            self.assertEqual(store.get('postgres')['purpose'], 'Query databases')
+
+        # Nothing is due, but the refresh still reads the edit back in
+        with RegistryStore(self.store_path) as store:
+            store.set_meta(f"source_due:{SOURCE}", str(time.time() + 3600))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(update_registry(self.registry, sources=[SOURCE]))
+        with self.open() as store:
+            self.assertFalse(store.markdown_edited(self.registry))
+            self.assertEqual(store.get('postgres')['purpose'], 'Edited')
+
+
+if __name__ == '__main__':
+    unittest.main()